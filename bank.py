@@ -0,0 +1,224 @@
+import mmap
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+from typing import BinaryIO, Dict, Iterable, List, Tuple, Union
+
+from rater import LEVELS, rate
+
+
+MAGIC = b'SDKB'
+RECORD_SIZE = 41
+# magic, then the first record and amount of records of every level
+HEADER = struct.Struct('<4s' + 'II' * len(LEVELS))
+
+
+def pack_board(board: List[List[int]], level: str) -> bytes:
+    """ packs a board and its level into a fixed width record, two cells
+    per byte
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+        level: how hard the board is, one of rater.LEVELS
+    Returns:
+        RECORD_SIZE bytes, the last cell sharing its byte with the level
+    """
+    cells = [number for row in board for number in row]
+    cells.append(LEVELS.index(level))
+    return bytes(cells[i] << 4 | cells[i + 1] for i in range(0, 82, 2))
+
+
+def unpack_board(record: bytes) -> List[List[int]]:
+    """ unpacks the board of a record made by pack_board
+    Args:
+        record: RECORD_SIZE bytes
+    Returns:
+        a sudoku game board, 0 marks an empty cell
+    """
+    cells = []
+    for byte in record:
+        cells.append(byte >> 4)
+        cells.append(byte & 15)
+    return [cells[row:row + 9] for row in range(0, 81, 9)]
+
+
+def write_bank(path: str, boards: Iterable[Tuple[List[List[int]], str]]) -> Dict[str, int]:
+    """ writes boards to a bank file, grouped by level so every level is
+    one run of records
+    Args:
+        path: the file to write
+        boards: (board, level) pairs, boards of any other level are left out
+    Returns:
+        the amount of boards written for each level
+    """
+    # each record goes straight to its level's run on disk, so the boards
+    # are never all in memory at once
+    runs: Dict[str, BinaryIO] = {level: tempfile.TemporaryFile() for level in LEVELS}
+    counts: Dict[str, int] = {level: 0 for level in LEVELS}
+    try:
+        for board, level in boards:
+            if level in runs:
+                runs[level].write(pack_board(board, level))
+                counts[level] += 1
+
+        index: List[int] = []
+        first = 0
+        for level in LEVELS:
+            index += [first, counts[level]]
+            first += counts[level]
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, *index))
+            for level in LEVELS:
+                runs[level].seek(0)
+                shutil.copyfileobj(runs[level], f)
+        os.replace(temporary, path)
+    finally:
+        for run in runs.values():
+            run.close()
+    return counts
+
+
+class PuzzleBank:
+    """ Read only bank of puzzles kept in a memory mapped file, so only
+    the records that are picked are ever read from disk
+
+    The file is a header holding the first record and amount of records
+    of each level, followed by the records grouped by level, each
+    RECORD_SIZE bytes.
+
+    Attrs:
+        _file(Union[BinaryIO, None]): the open bank file, None when empty
+        _map(Union[mmap.mmap, None]): the mapped bank file, None when empty
+        _index(Dict[str, Tuple[int, int]]): the first record and amount of
+                                            records of each level
+
+    """
+
+    def __init__(self) -> None:
+        """ Creates an empty bank, load() opens a bank file
+
+        Args:
+            None
+
+        """
+        self._file = None
+        self._map: Union[mmap.mmap, None] = None
+        self._index: Dict[str, Tuple[int, int]] = {level: (0, 0) for level in LEVELS}
+
+    @classmethod
+    def load(cls, path: str) -> "PuzzleBank":
+        """ maps a bank file
+        Args:
+            path: the file to map
+        Returns:
+            the bank, empty if the file is missing or not a bank
+        """
+        bank = cls()
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            return bank
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            f.close()
+            return bank
+        if len(mapped) < HEADER.size or mapped[:4] != MAGIC:
+            mapped.close()
+            f.close()
+            return bank
+        index = HEADER.unpack_from(mapped)[1:]
+        if len(mapped) < HEADER.size + sum(index[1::2]) * RECORD_SIZE:
+            mapped.close()
+            f.close()
+            return bank
+        bank._file = f
+        bank._map = mapped
+        bank._index = {level: (index[i * 2], index[i * 2 + 1])
+                       for i, level in enumerate(LEVELS)}
+        return bank
+
+    def close(self) -> None:
+        """ unmaps the bank file, leaving the bank empty
+        Args:
+            None
+        Returns:
+            None
+        """
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._map = None
+        self._file = None
+        self._index = {level: (0, 0) for level in LEVELS}
+
+    def get_count(self, level: str) -> int:
+        """ getter for the amount of boards of a level
+        Args:
+            level: one of rater.LEVELS
+        Returns:
+            the amount of boards
+        """
+        return self._index[level][1]
+
+    def get_board(self, level: str, number: int) -> List[List[int]]:
+        """ reads a single board of a level
+        Args:
+            level: one of rater.LEVELS
+            number: which of the level's boards, from 0
+        Returns:
+            a sudoku game board, 0 marks an empty cell
+        """
+        first, count = self._index[level]
+        if not 0 <= number < count:
+            raise IndexError(f"no board {number} of level {level}")
+        offset = HEADER.size + (first + number) * RECORD_SIZE
+        return unpack_board(self._map[offset:offset + RECORD_SIZE])
+
+    def pick(self, level: str, rng: Union[random.Random, None]=None) -> Union[List[List[int]], None]:
+        """ reads a random board of a level
+        Args:
+            level: one of rater.LEVELS
+            rng: the random number generator to draw from, random when None
+        Returns:
+            a sudoku game board, or None if the bank has none of the level
+        """
+        count = self.get_count(level)
+        if not count:
+            return None
+        return self.get_board(level, (rng or random).randrange(count))
+
+
+def main(argv: Union[List[str], None]=None) -> int:
+    """ rates puzzles from files and writes them into a bank file
+    Args:
+        argv: command line arguments, sys.argv[1:] when None
+    Returns:
+        the exit status, 1 if no puzzle was written
+    """
+    # the board model imports this module, so the command line parts stay
+    # out of its way until the tool is actually run
+    import argparse
+    from batch import read_files, read_puzzles
+
+    parser = argparse.ArgumentParser(description="Build a puzzle bank from Sudoku puzzles.")
+    parser.add_argument('files', nargs='*', default=['-'],
+                        help="files with one 81 character puzzle per line or "
+                             "nested lists of numbers, - for stdin")
+    parser.add_argument('-o', '--output', default='puzzles.bank',
+                        help="the bank file to write")
+    args = parser.parse_args(argv)
+
+    boards = ((board, rate(board).get_level())
+              for line_number, board in read_puzzles(read_files(args.files)))
+    counts = write_bank(args.output, boards)
+    for level in LEVELS:
+        print(f"{level}: {counts[level]} puzzles", file=sys.stderr)
+    return 0 if sum(counts.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
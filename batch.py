@@ -0,0 +1,226 @@
+import argparse
+import itertools
+import multiprocessing
+import os
+import re
+import sys
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+
+from rater import rate
+from solver import SOLVER_BACKENDS, create_solver
+
+
+PUZZLE_LINE = re.compile(r'[0-9.]{81}')
+LIST_DIGIT = re.compile(r'\d')
+
+
+def board_to_string(board: List[List[int]]) -> str:
+    """ flattens a board into an 81 character line
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+    Returns:
+        the numbers of the board read row by row, 0 for empty cells
+    """
+    return ''.join(str(number) for row in board for number in row)
+
+
+def string_to_board(line: str) -> List[List[int]]:
+    """ turns an 81 character line into a board
+    Args:
+        line: the numbers of a board read row by row, 0 or . for empty cells
+    Returns:
+        a sudoku game board, 0 marks an empty cell
+    """
+    numbers = [0 if character == '.' else int(character) for character in line]
+    return [numbers[row * 9:row * 9 + 9] for row in range(9)]
+
+
+def read_puzzles(lines: Iterable[str]) -> Iterator[Tuple[int, List[List[int]]]]:
+    """ reads boards one at a time from 81 character lines or from the
+    nested list format of Sudoku._ALL_START_BOARDS, which may be spread
+    over several lines
+    Args:
+        lines: the lines to read, # starts a comment
+    Returns:
+        (line number, board) pairs, numbered by the line the board ends on
+    """
+    numbers: List[int] = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.split('#')[0].strip()
+        if not line:
+            continue
+        if PUZZLE_LINE.fullmatch(line):
+            yield line_number, string_to_board(line)
+        elif line[0] in '[],':
+            numbers.extend(int(digit) for digit in LIST_DIGIT.findall(line))
+            while len(numbers) >= 81:
+                yield line_number, string_to_board(''.join(str(number) for number in numbers[:81]))
+                del numbers[:81]
+        else:
+            print(f"line {line_number}: skipped, not a puzzle", file=sys.stderr)
+
+
+def read_files(paths: List[str]) -> Iterator[str]:
+    """ reads the lines of each file in turn, - meaning stdin
+    Args:
+        paths: the files to read
+    Returns:
+        the lines of every file
+    """
+    for path in paths:
+        if path == '-':
+            yield from sys.stdin
+            continue
+        with open(path, 'r') as f:
+            yield from f
+
+
+def solve_puzzle(board: List[List[int]], backend: str='bitmask') -> Tuple[Union[str, None], float]:
+    """ solves a board and times how long it took
+    Args:
+        board: a sudoku game board, it is solved in place
+        backend: the solver to use, one of solver.SOLVER_BACKENDS
+    Returns:
+        the solved board as an 81 character line, or None if not
+        solvable, and the seconds it took
+    """
+    start = perf_counter()
+    solved = create_solver(board, backend).solve()
+    elapsed = perf_counter() - start
+    if not solved:
+        return None, elapsed
+    return board_to_string(board), elapsed
+
+
+def solve_job(job: Tuple[str, str, bool]) -> Tuple[str, Union[str, None], float, int, str, float]:
+    """ solves a single puzzle, in whichever process runs it
+    Args:
+        job: the puzzle as an 81 character line, the solver backend and
+             whether to rate the puzzle
+    Returns:
+        the puzzle, its solution or None, the seconds solving took, the id
+        of the process that solved it, its level and score separated by a
+        tab, empty when not rated, and the seconds solving and rating took
+    """
+    start = perf_counter()
+    puzzle, backend, rated = job
+    board = string_to_board(puzzle)
+    grade = ''
+    if rated:
+        rating = rate(board)
+        grade = f"{rating.get_level()}\t{rating.get_score():.2f}"
+    solution, elapsed = solve_puzzle(board, backend)
+    return puzzle, solution, elapsed, os.getpid(), grade, perf_counter() - start
+
+
+def solve_jobs(jobs: Iterator[Tuple[str, str, bool]], workers: int=1, chunk_size: int=64,
+               ordered: bool=True) -> Iterator[Tuple[str, Union[str, None], float, int, str, float]]:
+    """ solves puzzles in a pool of processes, handing them out in chunks
+    Args:
+        jobs: (puzzle, backend, rated) triples for solve_job
+        workers: the amount of processes, 1 solves in this process
+        chunk_size: the amount of puzzles handed to a process at a time
+        ordered: whether results come back in the order of the jobs
+    Returns:
+        the results of solve_job for every job
+    """
+    pool = None
+    if workers > 1:
+        try:
+            pool = multiprocessing.Pool(workers)
+        except (OSError, ImportError) as error:
+            print(f"process pool unavailable ({error}), using 1 worker", file=sys.stderr)
+    if pool is None:
+        yield from map(solve_job, jobs)
+        return
+
+    # only a few chunks per worker are read ahead, so memory stays constant
+    window = workers * chunk_size * 4
+    with pool:
+        solve = pool.imap if ordered else pool.imap_unordered
+        while True:
+            block = list(itertools.islice(jobs, window))
+            if not block:
+                break
+            yield from solve(solve_job, block, chunk_size)
+
+
+def solve_stream(puzzles: Iterable[Tuple[int, List[List[int]]]],
+                 output: TextIO, backend: str='bitmask', workers: int=1,
+                 chunk_size: int=64, ordered: bool=True,
+                 rated: bool=False) -> Dict[int, List[Union[int, float]]]:
+    """ solves boards as they are read and writes one line per board
+    Args:
+        puzzles: (line number, board) pairs from read_puzzles
+        output: where to write the puzzle, its solution, the seconds it
+                took and, when rated, its level and score, separated by
+                tabs
+        backend: the solver to use, one of solver.SOLVER_BACKENDS
+        workers: the amount of processes solving at once
+        chunk_size: the amount of puzzles handed to a process at a time
+        ordered: whether lines are written in the order boards were read
+        rated: whether to rate how hard each board is for a person
+    Returns:
+        the amount of boards read, the amount solved and the seconds spent
+        solving and rating them, by process id
+    """
+    jobs = ((board_to_string(board), backend, rated) for line_number, board in puzzles)
+    stats: Dict[int, List[Union[int, float]]] = {}
+    for puzzle, solution, elapsed, worker, grade, busy in solve_jobs(jobs, workers, chunk_size,
+                                                                     ordered):
+        worker_stats = stats.setdefault(worker, [0, 0, 0.0])
+        worker_stats[0] += 1
+        worker_stats[2] += busy
+        if solution is None:
+            solution = 'unsolvable'
+        else:
+            worker_stats[1] += 1
+        if grade:
+            output.write(f"{puzzle}\t{solution}\t{elapsed:.6f}\t{grade}\n")
+        else:
+            output.write(f"{puzzle}\t{solution}\t{elapsed:.6f}\n")
+    return stats
+
+
+def main(argv: Union[List[str], None]=None) -> int:
+    """ solves every puzzle in the given files without opening a window
+    Args:
+        argv: command line arguments, sys.argv[1:] when None
+    Returns:
+        the exit status, 1 if any puzzle could not be solved
+    """
+    parser = argparse.ArgumentParser(description="Solve Sudoku puzzles from files or stdin.")
+    parser.add_argument('files', nargs='*', default=['-'],
+                        help="files with one 81 character puzzle per line or "
+                             "nested lists of numbers, - for stdin")
+    parser.add_argument('--backend', choices=SOLVER_BACKENDS, default='bitmask',
+                        help="the solver to use")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="the amount of processes solving at once")
+    parser.add_argument('--chunk-size', type=int, default=64,
+                        help="the amount of puzzles handed to a process at a time")
+    parser.add_argument('--unordered', action='store_true',
+                        help="write solutions as they finish instead of in input order")
+    parser.add_argument('--rate', action='store_true',
+                        help="add how hard each puzzle is for a person, its level and score")
+    args = parser.parse_args(argv)
+
+    start = perf_counter()
+    stats = solve_stream(read_puzzles(read_files(args.files)), sys.stdout,
+                         args.backend, max(1, args.workers),
+                         max(1, args.chunk_size), not args.unordered, args.rate)
+    wall = perf_counter() - start
+
+    total = sum(worker_stats[0] for worker_stats in stats.values())
+    solved = sum(worker_stats[1] for worker_stats in stats.values())
+    for worker, (count, worker_solved, seconds) in sorted(stats.items()):
+        per_second = count / seconds if seconds else 0.0
+        print(f"worker {worker}: {count} puzzles, {per_second:.1f} puzzles/s", file=sys.stderr)
+    per_second = total / wall if wall else 0.0
+    print(f"{solved}/{total} solved in {wall:.3f}s, {per_second:.1f} puzzles/s", file=sys.stderr)
+    return 0 if solved == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,722 @@
+import math
+from typing import TYPE_CHECKING, List, Dict, Iterable, Tuple, Union, Set
+
+from bank import PuzzleBank
+from cache import SolutionCache
+from grid import Grid
+from history import History, pack_delta, unpack_delta
+from rater import Hint, Rater
+from solver import CELL_UNITS, PEERS, create_solver
+
+if TYPE_CHECKING:
+    from commands import Command
+
+
+class Board:
+    """ Sudoku board model, holding the game's state and rules without
+    anything to do with drawing it
+
+    Attrs:
+        _ALL_START_BOARDS(List[List[List[int]]]): all sudoku game boards
+        _puzzle_bank(Union[PuzzleBank, None]): bank of rated boards to start
+                                               from, None to use none
+        _solution_cache(Union[SolutionCache, None]): solutions shared by
+                                                     every board, None to
+                                                     always solve
+        _start_board(Grid): a randomized sudoku gameboard
+        _board(Grid): game board where the user can input numbers, holding
+                      the temporary values of the pencil tool as marks
+        _columns(int): the amount of columns in the board
+        _rows(int): the amount of rows in the board
+        _selected(Tuple[int, int]): most recently clicked board coordinate
+        _pencil_mode(bool): the status of pencil tool's activation
+        _incorrect_coordinates(Set[Tuple[int, int]]): coordinates shown
+                                                      with invalid numbers
+        _unit_counts(bytearray): how often each number appears in each row,
+                                 column and box, indexed by
+                                 unit * 9 + number - 1 with units
+                                 numbered as in solver.UNITS
+        _conflicts(Set[Tuple[int, int]]): coordinates whose inputted number
+                                          currently breaks Sudoku's rules
+        _unit_masks(List[int]): the numbers present in each row, column and
+                                box, bit (number - 1) per number, numbered
+                                as in solver.UNITS
+        _auto_notes(bool): whether the pencil marks of empty cells are
+                           kept equal to their candidates
+        _commands(List["Command"]): the commands executed since the board
+                                    was last set or reset, in order,
+                                    leaving out the undone ones
+        _undone_commands(List["Command"]): the undone commands that can be
+                                           redone, the most recent last
+        _history(History): the cells each command changed, for undoing
+
+    """
+
+    __slots__ = ('_start_board', '_board', '_columns', '_rows', '_selected',
+                 '_pencil_mode', '_incorrect_coordinates', '_unit_counts',
+                 '_conflicts', '_unit_masks', '_auto_notes', '_commands',
+                 '_undone_commands', '_history')
+
+    _solution_cache: Union[SolutionCache, None] = None
+    _puzzle_bank: Union[PuzzleBank, None] = None
+
+    _ALL_START_BOARDS: List[List[List[int]]] = [
+        [
+            [7, 8, 0, 4, 0, 0, 1, 2, 0],
+            [6, 0, 0, 0, 7, 5, 0, 0, 9],
+            [0, 0, 0, 6, 0, 1, 0, 7, 8],
+            [0, 0, 7, 0, 4, 0, 2, 6, 0],
+            [0, 0, 1, 0, 5, 0, 9, 3, 0],
+            [9, 0, 4, 0, 6, 0, 0, 0, 5],
+            [0, 7, 0, 3, 0, 0, 0, 1, 2],
+            [1, 2, 0, 0, 0, 7, 4, 0, 0],
+            [0, 4, 9, 2, 0, 6, 0, 0, 7]
+        ],
+        [
+            [0, 4, 0, 8, 0, 5, 2, 0, 0],
+            [0, 2, 0, 0, 4, 0, 0, 5, 0],
+            [5, 0, 0, 0, 0, 0, 0, 0, 4],
+            [0, 9, 0, 0, 0, 3, 1, 2, 0],
+            [1, 0, 6, 0, 7, 8, 0, 0, 3],
+            [3, 7, 0, 9, 0, 4, 0, 8, 0],
+            [0, 0, 0, 0, 0, 6, 7, 0, 0],
+            [0, 0, 8, 3, 5, 9, 0, 1, 0],
+            [0, 1, 9, 0, 0, 7, 6, 0, 0]
+        ]
+    ]
+
+    def __init__(self, start_board: Union[List[List[int]], Grid]) -> None:
+        """ Creates a sudoku board
+
+        Args:
+            start_board: a randomized sudoku game board
+
+        """
+        if not isinstance(start_board, Grid):
+            start_board = Grid.from_rows(start_board)
+        self._start_board: Grid = start_board
+        self._columns: int = 9
+        self._rows: int = 9
+        self._board: Grid = start_board.clone()
+        self._selected: Tuple[int, int] = (math.ceil(self._columns / 2),
+                                           math.ceil(self._rows / 2))
+        self._pencil_mode: bool = False
+        self._incorrect_coordinates: Set[Tuple[int, int]] = set()
+        self._unit_counts: bytearray = bytearray(243)
+        self._conflicts: Set[Tuple[int, int]] = set()
+        self._unit_masks: List[int] = [0] * 27
+        self._auto_notes: bool = False
+        self._commands: List["Command"] = []
+        self._undone_commands: List["Command"] = []
+        self._history: History = History()
+        self._rebuild_conflicts()
+
+    @classmethod
+    def get_all_start_boards(cls) -> List[List[List[int]]]:
+        """ getter for _ALL_START_BOARDS
+        Args:
+            None
+        Returns:
+            All sudoku game boards
+        """
+        return cls._ALL_START_BOARDS
+
+    @classmethod
+    def get_solution_cache(cls) -> Union[SolutionCache, None]:
+        """ getter for _solution_cache
+        Args:
+            None
+        Returns:
+            the cache of solutions shared by every board
+        """
+        return cls._solution_cache
+
+    @classmethod
+    def set_solution_cache(cls, cache: Union[SolutionCache, None]) -> None:
+        """ setter for _solution_cache
+        Args:
+            cache: the cache of solutions shared by every board, None to
+                   always solve
+        Returns:
+            None
+        """
+        cls._solution_cache = cache
+
+    @classmethod
+    def get_puzzle_bank(cls) -> Union[PuzzleBank, None]:
+        """ getter for _puzzle_bank
+        Args:
+            None
+        Returns:
+            the bank of rated boards to start from
+        """
+        return cls._puzzle_bank
+
+    @classmethod
+    def set_puzzle_bank(cls, bank: Union[PuzzleBank, None]) -> None:
+        """ setter for _puzzle_bank
+        Args:
+            bank: the bank of rated boards to start from, None to use none
+        Returns:
+            None
+        """
+        cls._puzzle_bank = bank
+
+    @classmethod
+    def pick_start_board(cls, level: str='medium') -> Union[List[List[int]], None]:
+        """ picks a random board of a level from the puzzle bank
+        Args:
+            level: one of rater.LEVELS
+        Returns:
+            a sudoku game board, or None if the bank has none of the level
+        """
+        if cls._puzzle_bank is None:
+            return None
+        return cls._puzzle_bank.pick(level)
+
+    def get_rows(self) -> int:
+        """ getter for _rows
+        Args:
+            None
+        Returns:
+            the amount of rows in the board
+        """
+        return self._rows
+
+    def get_columns(self) -> int:
+        """ getter for _columns
+        Args:
+            None
+        Returns:
+            the amount of columns in the board
+        """
+        return self._columns
+
+    def get_start_board(self) -> List[List[int]]:
+        """ getter for _start_board
+        Args:
+            None
+        Returns:
+            a copy of the randomized sudoku gameboard
+        """
+        return self._start_board.to_rows()
+
+    def get_start_grid(self) -> Grid:
+        """ getter for _start_board, without copying it
+        Args:
+            None
+        Returns:
+            the randomized sudoku gameboard
+        """
+        return self._start_board
+
+    def get_grid(self) -> Grid:
+        """ getter for _board, without copying it, numbers must still be
+        changed through set_number to keep the conflicts up to date
+        Args:
+            None
+        Returns:
+            game board where the user can input numbers
+        """
+        return self._board
+
+    def get_selected(self) -> Tuple[int, int]:
+        """ getter for _selected
+        Args:
+            None
+        Returns:
+            The most recently clicked board coordinate
+        """
+        return self._selected
+
+    def set_selected(self, cord: Tuple[int, int]) -> None:
+        """ setter for _selected
+        Args:
+            cord: the newly selected coordinate
+        Returns:
+            None
+        """
+        self._selected = cord
+
+    def set_board(self, board: List[List[int]]) -> None:
+        """ setter for _board
+
+        Args:
+            board: sudoku game board where the user can input numbers
+        Returns:
+            None
+        """
+        self._board.load_rows(board)
+        self._forget_commands()
+        self._rebuild_conflicts()
+        if self._auto_notes:
+            self.fill_notes()
+
+    def set_number(self, coordinate: Tuple[int, int], value: int) -> None:
+        """ setter for a coordinate in _board
+        Args:
+            coordinate: the coordinate that will have its value changed
+            value: the value the coordinate will adopt
+        Returns:
+            None
+        """
+        old_value = self._board.get_number(coordinate[0], coordinate[1])
+        if old_value == value:
+            return
+        self._set_value(coordinate, old_value, value)
+        self._update_notes(coordinate, old_value, value)
+
+    def _set_value(self, coordinate: Tuple[int, int], old_value: int, value: int) -> None:
+        """ changes a coordinate's number and its counts and conflicts,
+        leaving every pencil mark alone
+        Args:
+            coordinate: the coordinate that will have its value changed
+            old_value: the number it holds, 0 when empty
+            value: the value the coordinate will adopt
+        Returns:
+            None
+        """
+        row, column = coordinate
+        self._count(coordinate, old_value, -1)
+        self._board.set_number(row, column, value)
+        self._count(coordinate, value, 1)
+
+        # only peers holding the old or new number can change status
+        for peer in PEERS[row * 9 + column]:
+            peer_value = self._board.get_number(peer[0], peer[1])
+            if peer_value and (peer_value == old_value or peer_value == value):
+                self._check_conflict(peer)
+        self._check_conflict(coordinate)
+
+    def _update_notes(self, coordinate: Tuple[int, int], old_value: int, value: int) -> None:
+        """ rubs a placed number out of the pencil marks of the cell's 20
+        peers and, with auto notes, pencils a removed number back into the
+        peers it became possible in again
+        Args:
+            coordinate: the coordinate whose number changed
+            old_value: the number it held, 0 when empty
+            value: the number it holds now, 0 when empty
+        Returns:
+            None
+        """
+        grid = self._board
+        peers = PEERS[coordinate[0] * 9 + coordinate[1]]
+        if value:
+            kept = ~(1 << (value - 1))
+            for row, column in peers:
+                grid.set_marks(row, column, grid.get_marks(row, column) & kept)
+        if self._auto_notes:
+            if old_value:
+                bit = 1 << (old_value - 1)
+                for peer in peers:
+                    if not grid.get_number(*peer) and self.get_candidates(peer) & bit:
+                        grid.set_marks(peer[0], peer[1], grid.get_marks(*peer) | bit)
+            grid.set_marks(coordinate[0], coordinate[1],
+                           0 if value else self.get_candidates(coordinate))
+
+    def get_candidates(self, coordinate: Tuple[int, int]) -> int:
+        """ finds the numbers no row, column or box of a coordinate holds
+        Args:
+            coordinate: the coordinate to check
+        Returns:
+            the mask of candidates, bit (number - 1) per number
+        """
+        row_unit, column_unit, box_unit = CELL_UNITS[coordinate[0] * 9 + coordinate[1]]
+        masks = self._unit_masks
+        return ~(masks[row_unit] | masks[column_unit] | masks[box_unit]) & 0x1FF
+
+    def get_auto_notes(self) -> bool:
+        """ getter for _auto_notes
+        Args:
+            None
+        Returns:
+            Whether or not the pencil marks follow the candidates
+        """
+        return self._auto_notes
+
+    def set_auto_notes(self, value: bool) -> None:
+        """ setter for _auto_notes, pencilling every empty cell's
+        candidates in when turned on
+        Args:
+            value: whether the pencil marks follow the candidates
+        Returns:
+            None
+        """
+        self._auto_notes = value
+        if value:
+            self.fill_notes()
+
+    def get_hint(self) -> Union[Hint, None]:
+        """ finds the easiest number the player could logically place next,
+        starting from the candidates the unit masks already hold
+        Args:
+            None
+        Returns:
+            the hint, or None if the board is full, breaks Sudoku's rules
+            or needs guessing
+        """
+        if self._conflicts:
+            return None
+        candidates = [self.get_candidates(divmod(index, 9)) for index in range(81)]
+        return Rater(self._board.to_rows(), candidates).find_hint()
+
+    def fill_notes(self) -> None:
+        """ pencils every empty cell's candidates in, replacing its marks
+        Args:
+            None
+        Returns:
+            None
+        """
+        grid = self._board
+        for index, number in enumerate(grid.get_cells()):
+            row, column = divmod(index, 9)
+            grid.set_marks(row, column, 0 if number else self.get_candidates((row, column)))
+
+    def _count(self, coordinate: Tuple[int, int], value: int, change: int) -> None:
+        """ updates how often a number appears in a coordinate's units
+        Args:
+            coordinate: the coordinate the number is at
+            value: the number, 0 changes nothing
+            change: 1 when the number is added, -1 when it is removed
+        Returns:
+            None
+        """
+        if not value:
+            return
+        bit = 1 << (value - 1)
+        for unit in CELL_UNITS[coordinate[0] * 9 + coordinate[1]]:
+            count = self._unit_counts[unit * 9 + value - 1] + change
+            self._unit_counts[unit * 9 + value - 1] = count
+            if count:
+                self._unit_masks[unit] |= bit
+            else:
+                self._unit_masks[unit] &= ~bit
+
+    def _check_conflict(self, coordinate: Tuple[int, int]) -> None:
+        """ updates whether a coordinate's number breaks Sudoku's rules,
+        numbers from the start board never count as conflicts
+        Args:
+            coordinate: the coordinate to check
+        Returns:
+            None
+        """
+        row, column = coordinate
+        value = self._board.get_number(row, column)
+        if value and not self._start_board.get_number(row, column):
+            for unit in CELL_UNITS[row * 9 + column]:
+                if self._unit_counts[unit * 9 + value - 1] > 1:
+                    self._conflicts.add(coordinate)
+                    return
+        self._conflicts.discard(coordinate)
+
+    def _rebuild_conflicts(self) -> None:
+        """ recounts every number and conflict after the whole board changed
+        Args:
+            None
+        Returns:
+            None
+        """
+        self._unit_counts = bytearray(243)
+        self._unit_masks = [0] * 27
+        self._conflicts = set()
+        for index, value in enumerate(self._board.get_cells()):
+            self._count(divmod(index, 9), value, 1)
+        for index in range(81):
+            self._check_conflict(divmod(index, 9))
+
+    def get_conflicts(self) -> Set[Tuple[int, int]]:
+        """ getter for _conflicts, kept up to date as numbers are inputted
+        Args:
+            None
+        Returns:
+            the coordinates whose inputted number breaks Sudoku's rules
+        """
+        return self._conflicts
+
+    def get_temp_board(self) -> Dict[Tuple, List]:
+        """ getter for the temporary values, built from the pencil marks
+        Args:
+            None
+        Returns:
+            the board containing temporary vaules
+        """
+        return {(row, column): self.get_temp_list((row, column))
+                for row in range(self._rows) for column in range(self._columns)}
+
+    def set_temp_board(self, temp_board: Dict[Tuple, List]) -> None:
+        """ setter for the temporary values, stored as pencil marks
+        Args:
+            temp_board: a game board containing temporary values
+        Returns:
+            None
+        """
+        self._board.clear_marks()
+        for coordinate, numbers in temp_board.items():
+            self.set_temp_list(coordinate, numbers)
+
+    def set_temp_number(self, target: int, coordinate: Tuple[int, int]) -> None:
+        """ setter for a coordinate's temporary values given a number
+        Args:
+            target: the number that is to be added/removed
+            coordinate: the coordinate whose temporary values are changed
+        Returns:
+            None
+        """
+        self._board.toggle_mark(coordinate[0], coordinate[1], target)
+
+    def get_temp_list(self, coordinate: Tuple[int, int]) -> List[int]:
+        """ getter for a coordinate's temporary values
+        Args:
+            coordinate: the coordinate whose temporary values are read
+        Returns:
+            the sorted temporary values of the coordinate
+        """
+        return list(self._board.get_mark_digits(coordinate[0], coordinate[1]))
+
+    def set_temp_list(self, coordinate: Tuple[int, int], numbers: List[int]) -> None:
+        """ setter for a coordinate's temporary values given a list
+        Args:
+            coordinate: the coordinate whose temporary values are changed
+            numbers: a sorted list of numbers that the coordinate adopts
+        Returns:
+            None
+        """
+        marks = 0
+        for number in numbers:
+            marks |= 1 << (number - 1)
+        self._board.set_marks(coordinate[0], coordinate[1], marks)
+
+    def get_pencil_mode(self) -> bool:
+        """ getter for _pencil_mode
+        Args:
+            None
+        Returns:
+            the status of pencil tool's activation
+        """
+        return self._pencil_mode
+
+    def set_pencil_mode(self, value: bool) -> None:
+        """ setter for _pencil_mode
+        Args:
+            value: toggle for pencil mode's activation
+        Returns:
+            None
+        """
+        self._pencil_mode = value
+
+    def get_incorrect_coordinates(self) -> Set[Tuple[int, int]]:
+        """ getter for _incorrect_coordinates
+        Args:
+            None
+        Returns:
+            a set of coordinates containing the invalid inputted numbers
+        """
+        return self._incorrect_coordinates
+
+    def set_incorrect_coordinates(self, value: Iterable[Tuple[int, int]]) -> None:
+        """ setter for _incorrect_coordinates
+        Args:
+            value: coordinates containing invalid inputted numbers
+        Returns:
+            None
+        """
+        self._incorrect_coordinates = set(value)
+
+    def discard_incorrect_coordinate(self, coordinate: Tuple[int, int]) -> None:
+        """ stops showing a coordinate as incorrect, if it was
+        Args:
+            coordinate: the coordinate whose number changed
+        Returns:
+            None
+        """
+        self._incorrect_coordinates.discard(coordinate)
+
+    def execute(self, command: "Command") -> None:
+        """ applies a command to the board and remembers it for replaying
+        and undoing, unless it changed nothing
+        Args:
+            command: the change to make
+        Returns:
+            None
+        """
+        # a command only ever changes its cell and, through the pencil
+        # marks, the cell's peers
+        row, column = command.get_coordinate()
+        index = row * 9 + column
+        cells = [(row, column)] + PEERS[index]
+        grid = self._board
+        before = [(grid.get_number(*cell), grid.get_marks(*cell)) for cell in cells]
+        command.apply(self)
+
+        deltas = []
+        for cell, (old_value, old_mask) in zip(cells, before):
+            value = grid.get_number(*cell)
+            mask = grid.get_marks(*cell)
+            if value != old_value or mask != old_mask:
+                deltas.append(pack_delta(cell[0] * 9 + cell[1], old_value, value, old_mask, mask))
+        if deltas:
+            self._history.push(deltas)
+            self._commands.append(command)
+            self._undone_commands = []
+
+    def undo(self) -> List[Tuple[int, int]]:
+        """ takes back the last command that was executed and not undone
+        Args:
+            None
+        Returns:
+            the coordinates that changed, empty if there was nothing to undo
+        """
+        step = self._history.undo()
+        if step is None:
+            return []
+        self._undone_commands.append(self._commands.pop())
+        return self._apply_step(step, True)
+
+    def redo(self) -> List[Tuple[int, int]]:
+        """ executes the last undone command again
+        Args:
+            None
+        Returns:
+            the coordinates that changed, empty if there was nothing to redo
+        """
+        step = self._history.redo()
+        if step is None:
+            return []
+        self._commands.append(self._undone_commands.pop())
+        return self._apply_step(step, False)
+
+    def _apply_step(self, step: Iterable[int], undo: bool) -> List[Tuple[int, int]]:
+        """ puts the numbers and pencil marks of a step's cells back to
+        how they were before or after the step
+        Args:
+            step: the step's packed deltas
+            undo: True for before the step, False for after it
+        Returns:
+            the coordinates of the step's cells
+        """
+        grid = self._board
+        changed = []
+        for delta in step:
+            index, old_value, value, old_mask, mask = unpack_delta(delta)
+            if undo:
+                old_value, value, mask = value, old_value, old_mask
+            coordinate = divmod(index, 9)
+            if old_value != value:
+                self._set_value(coordinate, old_value, value)
+            grid.set_marks(coordinate[0], coordinate[1], mask)
+            changed.append(coordinate)
+        return changed
+
+    def _forget_commands(self) -> None:
+        """ forgets the executed and undone commands after the whole board
+        changed, since their deltas no longer apply
+        Args:
+            None
+        Returns:
+            None
+        """
+        self._commands = []
+        self._undone_commands = []
+        self._history.clear()
+
+    def can_undo(self) -> bool:
+        """ getter for whether a command can be undone
+        Args:
+            None
+        Returns:
+            Whether or not undo() would change the board
+        """
+        return self._history.can_undo()
+
+    def can_redo(self) -> bool:
+        """ getter for whether a command can be redone
+        Args:
+            None
+        Returns:
+            Whether or not redo() would change the board
+        """
+        return self._history.can_redo()
+
+    def get_commands(self) -> List["Command"]:
+        """ getter for _commands
+        Args:
+            None
+        Returns:
+            the commands executed since the board was last set or reset,
+            in order
+        """
+        return list(self._commands)
+
+    def reset_board(self) -> None:
+        """ resets the board to its original state
+        Args:
+            None
+        Returns:
+            None
+        """
+        self._board = self._start_board.clone()
+        self._incorrect_coordinates = set()
+        self._forget_commands()
+        self._rebuild_conflicts()
+        if self._auto_notes:
+            self.fill_notes()
+
+    def find_empty(self) -> Union[Tuple[int, int], None]:
+        """ finds the closest empty cell in the board
+        Args:
+            None
+        Returns:
+            The coordinate of the closest empty cell
+        """
+        return self._board.find_empty()
+
+    def solve(self, backend: str='bitmask') -> bool:
+        """ solves the Sudoku board in place and indicates if not possible
+        Args:
+            backend: the solver to use, one of solver.SOLVER_BACKENDS
+        Returns:
+            Whether or not the board is solvable
+        """
+        cells = self._board.get_cells()
+        cache = Board._solution_cache
+        if cache is not None:
+            solution = cache.get(bytes(cells))
+            if solution is not None:
+                cells[:] = solution
+                self._forget_commands()
+                self._rebuild_conflicts()
+                return True
+
+        puzzle = bytes(cells)
+        board = self._board.to_rows()
+        if not create_solver(board, backend).solve():
+            return False
+        self._board.load_rows(board)
+        self._forget_commands()
+        self._rebuild_conflicts()
+        if cache is not None:
+            cache.put(puzzle, bytes(cells))
+        return True
+
+    def get_solution(self) -> Union[Grid, None]:
+        """ solves the start board without changing the user's board
+        Args:
+            None
+        Returns:
+            the solved start board, or None if not solvable
+        """
+        solved = Board(self._start_board)
+        if not solved.solve():
+            return None
+        return solved.get_grid()
+
+    def get_invalid_numbers(self) -> Union[List[None], Set[Tuple[int, int]]]:
+        """ finds the coordinates whose inputted number breaks Sudoku's rules
+        Args:
+            None
+        Returns:
+            a set of coordinates that do not follow Sudoku's rules
+        """
+        if not self._conflicts:
+            return []
+        return set(self._conflicts)
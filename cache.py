@@ -0,0 +1,276 @@
+import os
+import pickle
+from collections import OrderedDict
+from itertools import permutations
+from operator import itemgetter
+from typing import Callable, Dict, List, Tuple, Union
+
+
+def _line_orders() -> List[List[int]]:
+    """ lists the orders rows can be put in by moving whole bands and
+    flipping every band upside down
+    Args:
+        None
+    Returns:
+        12 orders, each giving the original row of every new row
+    """
+    orders = []
+    for bands in permutations(range(3)):
+        for flipped in (False, True):
+            orders.append([bands[i // 3] * 3 + (2 - i % 3 if flipped else i % 3)
+                           for i in range(9)])
+    return orders
+
+
+def _symmetries() -> List[Callable[[bytes], Tuple[int, ...]]]:
+    """ lists every rearrangement of the cells kept by the cache: band and
+    stack moves, flips and transposition, which together include every
+    rotation of the board
+    Args:
+        None
+    Returns:
+        288 getters, each taking the 81 cells and returning them rearranged
+    """
+    symmetries = []
+    for transposed in (False, True):
+        for rows in _line_orders():
+            for columns in _line_orders():
+                if transposed:
+                    cells = [columns[j] * 9 + rows[i] for i in range(9) for j in range(9)]
+                else:
+                    cells = [rows[i] * 9 + columns[j] for i in range(9) for j in range(9)]
+                symmetries.append(itemgetter(*cells))
+    return symmetries
+
+
+SYMMETRIES: List[Callable[[bytes], Tuple[int, ...]]] = _symmetries()
+
+
+# the first row of every rearrangement, to rule most of them out cheaply
+FIRST_ROWS: List[Callable[[bytes], Tuple[int, ...]]] = [
+    itemgetter(*symmetry(range(81))[:9]) for symmetry in SYMMETRIES]
+LABELS = bytes(range(1, 10))
+# turns every number into 1, leaving which cells are given
+GIVEN = bytes([0] + [1] * 9) + bytes(246)
+
+
+def canonicalize(cells: bytes) -> Tuple[bytes, int, bytes]:
+    """ finds the form of a puzzle shared by every puzzle that only differs
+    from it by symmetry and the naming of its numbers
+    Args:
+        cells: the 81 numbers of the puzzle, 0 for empty cells
+    Returns:
+        the canonical 81 cells, the index in SYMMETRIES of the
+        rearrangement used and the table that renamed the numbers
+    """
+    # the first row of a puzzle holds different numbers, which are renamed
+    # 1, 2, 3... in order, so only the rearrangements whose first row has
+    # the earliest empty cells can give the smallest form
+    given = cells.translate(GIVEN)
+    first_rows = [bytes(first_row(given)) for first_row in FIRST_ROWS]
+    lowest = min(first_rows)
+
+    best = None
+    best_symmetry = 0
+    best_table = b''
+    for index, first_row in enumerate(first_rows):
+        if first_row != lowest:
+            continue
+        arranged = bytes(SYMMETRIES[index](cells))
+        # numbers are renamed 1, 2, 3... in the order they first appear
+        order = dict.fromkeys(arranged)
+        order.pop(0, None)
+        names = bytes(order)
+        if len(names) < 9:
+            names += bytes(number for number in LABELS if number not in order)
+        table = bytes.maketrans(names, LABELS)
+        canonical = arranged.translate(table)
+        if best is None or canonical < best:
+            best = canonical
+            best_symmetry = index
+            best_table = table
+    return best, best_symmetry, best_table
+
+
+class SolutionCache:
+    """ Size bounded, least recently used cache of puzzle solutions, shared
+    by every puzzle with the same canonical form
+
+    Attrs:
+        _path(Union[str, None]): file the cache is saved to, None to keep it
+                                 in memory only
+        _max_size(int): the most solutions kept before the least recently
+                        used one is dropped
+        _entries(OrderedDict): canonical solution by canonical puzzle, least
+                               recently used first
+        _hits(int): the amount of lookups that found a solution
+        _misses(int): the amount of lookups that did not
+        _save_every(int): the amount of new solutions that makes put()
+                          save the cache
+        _unsaved(int): the amount of solutions added since the last save
+        _exact(OrderedDict): solution by puzzle as it was asked for, so
+                             asking again skips canonicalizing, least
+                             recently used first
+        _last_miss(Union[Tuple[bytes, Tuple[bytes, int, bytes]], None]):
+            the puzzle of the last lookup that found nothing and its
+            canonical form, for put() to reuse
+
+    """
+
+    def __init__(self, path: Union[str, None]=None, max_size: int=1024,
+                 save_every: int=32) -> None:
+        """ Creates a solution cache
+
+        Args:
+            path: file the cache is saved to, None to keep it in memory only
+            max_size: the most solutions kept
+            save_every: the amount of new solutions that makes put() save
+                        the cache, the rest is saved by calling save()
+
+        """
+        self._path = path
+        self._max_size = max_size
+        self._save_every = save_every
+        self._unsaved: int = 0
+        self._entries: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._exact: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._last_miss: Union[Tuple[bytes, Tuple[bytes, int, bytes]], None] = None
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @classmethod
+    def load(cls, path: str, max_size: int=1024, save_every: int=32) -> "SolutionCache":
+        """ creates a cache holding the solutions saved in a file
+        Args:
+            path: the file to read, and to save to from then on
+            max_size: the most solutions kept
+            save_every: the amount of new solutions that makes put() save
+                        the cache
+        Returns:
+            the cache, empty if the file is missing, unreadable or holds
+            anything but pairs of 81 cells
+        """
+        cache = cls(path, max_size, save_every)
+        try:
+            with open(path, "rb") as f:
+                entries = pickle.load(f)
+            for puzzle, solution in entries:
+                if not (isinstance(puzzle, bytes) and isinstance(solution, bytes)
+                        and len(puzzle) == len(solution) == 81):
+                    raise ValueError("not a cached solution")
+                cache._store(puzzle, solution)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            return cls(path, max_size, save_every)
+        return cache
+
+    def save(self) -> None:
+        """ writes the cache to its file if solutions were added since it
+        was last saved, replacing the old file only once the new one is
+        complete
+        Args:
+            None
+        Returns:
+            None
+        """
+        if self._path is None or not self._unsaved:
+            return
+        temporary = self._path + ".tmp"
+        with open(temporary, "wb") as f:
+            pickle.dump(list(self._entries.items()), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, self._path)
+        self._unsaved = 0
+
+    def get(self, cells: bytes) -> Union[bytes, None]:
+        """ looks up the solution of a puzzle
+        Args:
+            cells: the 81 numbers of the puzzle, 0 for empty cells
+        Returns:
+            the 81 numbers of the solution, or None if not cached
+        """
+        solved = self._exact.get(cells)
+        if solved is not None:
+            self._hits += 1
+            self._exact.move_to_end(cells)
+            return solved
+
+        form = canonicalize(cells)
+        canonical, symmetry, table = form
+        solution = self._entries.get(canonical)
+        if solution is None:
+            self._misses += 1
+            self._last_miss = (cells, form)
+            return None
+        self._hits += 1
+        self._entries.move_to_end(canonical)
+
+        names = bytearray(range(256))
+        for number in range(1, 10):
+            names[table[number]] = number
+        unarranged = bytearray(81)
+        for new, old in enumerate(SYMMETRIES[symmetry](range(81))):
+            unarranged[old] = names[solution[new]]
+        solved = bytes(unarranged)
+        self._remember(cells, solved)
+        return solved
+
+    def put(self, cells: bytes, solution: bytes) -> None:
+        """ remembers the solution of a puzzle, saving the cache once
+        enough solutions were added since it was last saved
+        Args:
+            cells: the 81 numbers of the puzzle, 0 for empty cells
+            solution: the 81 numbers of its solution
+        Returns:
+            None
+        """
+        # the puzzle was most likely just looked up, so its canonical form
+        # is already known
+        if self._last_miss is not None and self._last_miss[0] == cells:
+            canonical, symmetry, table = self._last_miss[1]
+        else:
+            canonical, symmetry, table = canonicalize(cells)
+        self._last_miss = None
+        solution = bytes(solution)
+        self._store(canonical, bytes(SYMMETRIES[symmetry](solution)).translate(table))
+        self._remember(cells, solution)
+        # pickling the whole cache on every new puzzle would stall the game
+        self._unsaved += 1
+        if self._unsaved >= self._save_every:
+            self.save()
+
+    def _store(self, canonical: bytes, solution: bytes) -> None:
+        """ adds a canonical solution, dropping the least recently used one
+        if the cache is full
+        Args:
+            canonical: the canonical form of the puzzle
+            solution: the solution in the same form
+        Returns:
+            None
+        """
+        self._entries[canonical] = solution
+        self._entries.move_to_end(canonical)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _remember(self, cells: bytes, solution: bytes) -> None:
+        """ adds the solution of a puzzle as it was asked for, dropping the
+        least recently used one if there are too many
+        Args:
+            cells: the 81 numbers of the puzzle
+            solution: the 81 numbers of its solution
+        Returns:
+            None
+        """
+        self._exact[cells] = solution
+        self._exact.move_to_end(cells)
+        while len(self._exact) > self._max_size:
+            self._exact.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        """ getter for the cache's statistics
+        Args:
+            None
+        Returns:
+            the amount of hits, misses and cached solutions
+        """
+        return {'hits': self._hits, 'misses': self._misses,
+                'size': len(self._entries)}
@@ -0,0 +1,205 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Tuple, Union
+
+from board import Board
+
+
+# key symbols as arcade reports them
+KEY_0 = 48
+KEY_A = 97
+KEY_H = 104
+KEY_Y = 121
+KEY_Z = 122
+KEY_BACKSPACE = 65288
+KEY_ESCAPE = 65307
+
+DEFAULT_KEYMAP: Dict[int, Tuple[str, int]] = {
+    **{KEY_0 + number: ('number', number) for number in range(1, 10)},
+    KEY_0: ('number', 0),
+    KEY_BACKSPACE: ('number', 0),
+    KEY_ESCAPE: ('pause', 0),
+    KEY_A: ('auto_notes', 0),
+    KEY_Z: ('undo', 0),
+    KEY_Y: ('redo', 0),
+    KEY_H: ('hint', 0),
+}
+
+
+class Command(ABC):
+    """ A change to a board made by the player, kept so that it can be
+    applied again to replay a game
+
+    Attrs:
+        _coordinate(Tuple[int, int]): the (row, column) of the cell
+        _value(int): the number the command puts in or marks in the cell
+
+    """
+
+    __slots__ = ('_coordinate', '_value')
+
+    def __init__(self, coordinate: Tuple[int, int], value: int) -> None:
+        """ Creates a command
+
+        Args:
+            coordinate: the (row, column) of the cell
+            value: the number the command puts in or marks in the cell
+
+        """
+        self._coordinate = coordinate
+        self._value = value
+
+    def get_coordinate(self) -> Tuple[int, int]:
+        """ getter for _coordinate
+        Args:
+            None
+        Returns:
+            the (row, column) of the cell
+        """
+        return self._coordinate
+
+    def get_value(self) -> int:
+        """ getter for _value
+        Args:
+            None
+        Returns:
+            the number the command puts in or marks in the cell
+        """
+        return self._value
+
+    @abstractmethod
+    def apply(self, board: Board) -> None:
+        """ makes the change to a board
+        Args:
+            board: the board to change
+        Returns:
+            None
+        """
+
+
+class SetNumber(Command):
+    """ Puts a number in a cell, or empties it with 0, clearing the cell's
+    pencil marks and incorrect indicator """
+
+    __slots__ = ()
+
+    def apply(self, board: Board) -> None:
+        """ makes the change to a board
+        Args:
+            board: the board to change
+        Returns:
+            None
+        """
+        row, column = self._coordinate
+        if board.get_start_grid().get_number(row, column):
+            return
+        if board.get_grid().get_marks(row, column):
+            board.set_temp_list(self._coordinate, [])
+        board.set_number(self._coordinate, self._value)
+        board.discard_incorrect_coordinate(self._coordinate)
+
+
+class ToggleMark(Command):
+    """ Pencils a number into a cell, or rubs it out if already pencilled,
+    emptying the cell and clearing its incorrect indicator """
+
+    __slots__ = ()
+
+    def apply(self, board: Board) -> None:
+        """ makes the change to a board
+        Args:
+            board: the board to change
+        Returns:
+            None
+        """
+        row, column = self._coordinate
+        if board.get_start_grid().get_number(row, column):
+            return
+        board.set_number(self._coordinate, 0)
+        board.discard_incorrect_coordinate(self._coordinate)
+        board.set_temp_number(self._value, self._coordinate)
+
+
+def replay(board: Board, commands: Iterable[Command]) -> None:
+    """ applies commands to a board in order
+    Args:
+        board: the board to change
+        commands: the commands, for example from Board.get_commands()
+    Returns:
+        None
+    """
+    for command in commands:
+        command.apply(board)
+
+
+class Keymap:
+    """ Table from key symbols to the actions they trigger, which can be
+    rebound at any time
+
+    Attrs:
+        _bindings(Dict[int, Tuple[str, int]]): the action and its number
+                                               for each key symbol
+
+    """
+
+    __slots__ = ('_bindings',)
+
+    def __init__(self, bindings: Union[Dict[int, Tuple[str, int]], None]=None) -> None:
+        """ Creates a keymap
+
+        Args:
+            bindings: the action and its number for each key symbol,
+                      DEFAULT_KEYMAP when None
+
+        """
+        self._bindings = dict(DEFAULT_KEYMAP if bindings is None else bindings)
+
+    def bind(self, symbol: int, action: str, value: int=0) -> None:
+        """ makes a key trigger an action, replacing its old one
+        Args:
+            symbol: the key symbol
+            action: 'number' to fill or pencil the selected cell, 'pause'
+                    to pause the game, 'auto_notes' to turn auto notes on
+                    or off, 'undo' or 'redo' to take back or repeat a move, 'hint' to
+                    show the next logical step
+            value: the number for 'number', 0 to empty the cell
+        Returns:
+            None
+        """
+        self._bindings[symbol] = (action, value)
+
+    def unbind(self, symbol: int) -> None:
+        """ makes a key trigger nothing
+        Args:
+            symbol: the key symbol
+        Returns:
+            None
+        """
+        self._bindings.pop(symbol, None)
+
+    def get_binding(self, symbol: int) -> Union[Tuple[str, int], None]:
+        """ getter for the action of a key
+        Args:
+            symbol: the key symbol
+        Returns:
+            the action and its number, or None if the key is not bound
+        """
+        return self._bindings.get(symbol)
+
+    def make_command(self, symbol: int, board: Board) -> Union[Command, None]:
+        """ turns a key press into a command on a board's selected cell
+        Args:
+            symbol: the key symbol
+            board: the board the key was pressed on
+        Returns:
+            the command, or None if the key does not change the board
+        """
+        binding = self._bindings.get(symbol)
+        if binding is None or binding[0] != 'number':
+            return None
+        x, y = board.get_selected()
+        coordinate = (y - 1, x - 1)
+        if board.get_pencil_mode():
+            if not binding[1]:
+                return None
+            return ToggleMark(coordinate, binding[1])
+        return SetNumber(coordinate, binding[1])
@@ -0,0 +1,254 @@
+from typing import List, Tuple, Union
+
+from solver import BitmaskSolver, get_box
+
+
+class DancingLinksSolver:
+    """ Sudoku solver that treats the board as an exact cover problem and
+    searches it with Knuth's Algorithm X on dancing links
+
+    Every empty cell and legal number is a row of the cover matrix, and
+    every cell, row/number, column/number and box/number rule that the
+    starting numbers do not already satisfy is a column of it. Boards
+    whose starting numbers clash have no solution and are rejected before
+    the matrix is built, since searching them can take forever.
+
+    Attrs:
+        _board(List[List[int]]): game board that is solved in place
+        _left(List[int]): the node to the left of each node
+        _right(List[int]): the node to the right of each node
+        _up(List[int]): the node above each node
+        _down(List[int]): the node below each node
+        _header(List[int]): the column header each node belongs to
+        _size(List[int]): the amount of nodes left in each column,
+                          indexed by header
+        _placements(List[Tuple[int, int, int]]): the (row, column, number)
+                                                 placement each node stands
+                                                 for, indexed by node
+        _partial(List[int]): nodes of the rows chosen so far
+        _first(List[int]): nodes of the rows of the first solution found
+        _found(int): the amount of solutions found by the running search
+        _conflicting(bool): whether the starting numbers already break
+                            Sudoku's rules
+
+    """
+
+    def __init__(self, board: List[List[int]]) -> None:
+        """ Creates a solver for a board
+
+        Args:
+            board: a sudoku game board, 0 marks an empty cell
+
+        """
+        self._board = board
+        self._left: List[int] = [0]
+        self._right: List[int] = [0]
+        self._up: List[int] = [0]
+        self._down: List[int] = [0]
+        self._header: List[int] = [0]
+        self._size: List[int] = [0]
+        self._placements: List[Tuple[int, int, int]] = [(0, 0, 0)]
+        self._partial: List[int] = []
+        self._first: List[int] = []
+        self._found: int = 0
+
+        candidates = BitmaskSolver(board, propagate=False)
+        self._conflicting: bool = candidates.has_conflicts()
+        if self._conflicting:
+            return
+        rows = []
+        needed = set()
+        for row, column in candidates.get_empty():
+            mask = candidates.get_candidates((row, column))
+            needed.add(row * 9 + column)
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                value = bit.bit_length() - 1
+                constraints = (row * 9 + column,
+                               81 + row * 9 + value,
+                               162 + column * 9 + value,
+                               243 + get_box(row, column) * 9 + value)
+                needed.update(constraints)
+                rows.append(((row, column, value + 1), constraints))
+
+        headers = {}
+        for constraint in sorted(needed):
+            headers[constraint] = self._add_node(0, (0, 0, 0))
+            self._left[headers[constraint]] = self._left[0]
+            self._right[headers[constraint]] = 0
+            self._right[self._left[0]] = headers[constraint]
+            self._left[0] = headers[constraint]
+
+        for placement, constraints in rows:
+            first = None
+            for constraint in constraints:
+                header = headers[constraint]
+                node = self._add_node(header, placement)
+                self._up[node] = self._up[header]
+                self._down[node] = header
+                self._down[self._up[header]] = node
+                self._up[header] = node
+                self._size[header] += 1
+                if first is None:
+                    first = node
+                else:
+                    self._left[node] = self._left[first]
+                    self._right[node] = first
+                    self._right[self._left[first]] = node
+                    self._left[first] = node
+
+    def _add_node(self, header: int, placement: Tuple[int, int, int]) -> int:
+        """ creates a node that only links to itself
+        Args:
+            header: the column header of the node, 0 for a new header
+            placement: the (row, column, number) placement of the node
+        Returns:
+            the index of the new node
+        """
+        node = len(self._header)
+        self._left.append(node)
+        self._right.append(node)
+        self._up.append(node)
+        self._down.append(node)
+        self._header.append(header or node)
+        self._size.append(0)
+        self._placements.append(placement)
+        return node
+
+    def get_board(self) -> List[List[int]]:
+        """ getter for _board
+        Args:
+            None
+        Returns:
+            the game board being solved
+        """
+        return self._board
+
+    def has_conflicts(self) -> bool:
+        """ getter for _conflicting
+        Args:
+            None
+        Returns:
+            whether the starting numbers already break Sudoku's rules
+        """
+        return self._conflicting
+
+    def solve(self) -> bool:
+        """ solves the board in place, leaving it untouched if not possible
+        Args:
+            None
+        Returns:
+            Whether or not the board is solvable
+        """
+        if not self.count_solutions(1):
+            return False
+        for node in self._first:
+            row, column, value = self._placements[node]
+            self._board[row][column] = value
+        return True
+
+    def count_solutions(self, limit: Union[int, None]=None) -> int:
+        """ counts the solutions of the board without changing it
+        Args:
+            limit: stop searching once this many solutions are found,
+                   None to count every solution
+        Returns:
+            the amount of solutions found
+        """
+        self._found = 0
+        self._partial = []
+        if self._conflicting:
+            return 0
+        self._search(limit)
+        return self._found
+
+    def _search(self, limit: Union[int, None]) -> bool:
+        """ recursively chooses rows until every column is covered
+        Args:
+            limit: the amount of solutions to stop at, None for no limit
+        Returns:
+            Whether or not the limit has been reached
+        """
+        right = self._right
+        down = self._down
+        if right[0] == 0:
+            self._found += 1
+            if self._found == 1:
+                self._first = list(self._partial)
+            return limit is not None and self._found >= limit
+
+        header = right[0]
+        smallest = self._size[header]
+        other = right[header]
+        while other != 0 and smallest > 1:
+            if self._size[other] < smallest:
+                header = other
+                smallest = self._size[other]
+            other = right[other]
+        if not smallest:
+            return False
+
+        self._cover(header)
+        node = down[header]
+        while node != header:
+            self._partial.append(node)
+            other = right[node]
+            while other != node:
+                self._cover(self._header[other])
+                other = right[other]
+
+            done = self._search(limit)
+
+            other = self._left[node]
+            while other != node:
+                self._uncover(self._header[other])
+                other = self._left[other]
+            self._partial.pop()
+            if done:
+                self._uncover(header)
+                return True
+            node = down[node]
+
+        self._uncover(header)
+        return False
+
+    def _cover(self, header: int) -> None:
+        """ removes a column and every row that uses it from the matrix
+        Args:
+            header: the header of the column
+        Returns:
+            None
+        """
+        left, right, up, down = self._left, self._right, self._up, self._down
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        row = down[header]
+        while row != header:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                self._size[self._header[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def _uncover(self, header: int) -> None:
+        """ puts back a column removed by _cover
+        Args:
+            header: the header of the column
+        Returns:
+            None
+        """
+        left, right, up, down = self._left, self._right, self._up, self._down
+        row = up[header]
+        while row != header:
+            node = left[row]
+            while node != row:
+                self._size[self._header[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+        right[left[header]] = header
+        left[right[header]] = header
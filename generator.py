@@ -0,0 +1,351 @@
+import queue
+import random
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, List, Sequence, Union
+
+from rater import LEVELS, Rating, rate
+from solver import PEERS, BitmaskSolver
+
+
+# the amount of givens that most often generates a puzzle of each rater
+# level, since the level of a generated puzzle is only known once rated
+LEVEL_GIVENS: Dict[str, int] = {'easy': 36, 'medium': 26, 'hard': 22,
+                                'expert': 22, 'extreme': 24}
+# the levels a PuzzleQueue keeps ready by default; expert puzzles are too
+# rare among generated ones to keep a queue of them full
+QUEUE_LEVELS: Sequence[str] = ('easy', 'medium', 'hard')
+
+
+def generate_solution(rng: random.Random) -> List[List[int]]:
+    """ creates a random solved board
+    Args:
+        rng: the random number generator to draw from
+    Returns:
+        a completely filled sudoku game board
+    """
+    board = [[0] * 9 for _ in range(9)]
+    # the three boxes on the diagonal share no row or column, so any
+    # numbers in them can always be completed into a solution
+    for box in (0, 4, 8):
+        numbers = rng.sample(range(1, 10), 9)
+        for i, number in enumerate(numbers):
+            board[box // 3 * 3 + i // 3][box % 3 * 3 + i % 3] = number
+    BitmaskSolver(board).solve()
+    return board
+
+
+def has_unique_solution(board: List[List[int]]) -> bool:
+    """ checks that a board can only be solved one way
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+    Returns:
+        Whether or not the board has exactly one solution
+    """
+    return BitmaskSolver(board).count_solutions(2) == 1
+
+
+def stays_unique(board: List[List[int]], row: int, column: int, number: int) -> bool:
+    """ checks that a board whose only solution had number at an emptied
+    cell still has one solution, which only needs a search for a solution
+    with any other number there rather than a count of every solution
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+        row: the row of the emptied cell
+        column: the column of the emptied cell
+        number: the number the emptied cell held
+    Returns:
+        Whether or not the board still has exactly one solution
+    """
+    solver = BitmaskSolver(board)
+    solver.exclude((row, column), number)
+    return not solver.count_solutions(1)
+
+
+def is_forced(board: List[List[int]], row: int, column: int) -> bool:
+    """ checks if an empty cell's peers already rule out every number but
+    one, in which case emptying it cannot add a solution
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+        row: the row of the empty cell
+        column: the column of the empty cell
+    Returns:
+        Whether or not the peers hold 8 different numbers
+    """
+    used = 0
+    for peer_row, peer_column in PEERS[row * 9 + column]:
+        number = board[peer_row][peer_column]
+        if number:
+            used |= 1 << number
+    return bin(used).count('1') == 8
+
+
+def generate_puzzle(givens: int=30, seed: Union[int, None]=None) -> List[List[int]]:
+    """ creates a random board with a single solution by emptying cells of
+    a solved board for as long as the solution stays unique
+    Args:
+        givens: the amount of numbers to leave on the board, boards where
+                no more can be emptied keep more
+        seed: makes the board the same every time, None for a new board
+    Returns:
+        a sudoku game board, 0 marks an empty cell
+    """
+    rng = random.Random(seed)
+    board = generate_solution(rng)
+    remaining = 81
+    cells = rng.sample(range(81), 81)
+    for cell in cells:
+        if remaining <= givens:
+            break
+        row, column = divmod(cell, 9)
+        number = board[row][column]
+        board[row][column] = 0
+        if is_forced(board, row, column) or stays_unique(board, row, column, number):
+            remaining -= 1
+        else:
+            board[row][column] = number
+    return board
+
+
+class PuzzleRecord:
+    """ A puzzle together with how hard it is for a person to solve
+
+    Attrs:
+        _board(List[List[int]]): the sudoku game board, 0 marks an empty cell
+        _rating(Rating): the techniques needed to solve the board
+
+    """
+
+    __slots__ = ('_board', '_rating')
+
+    def __init__(self, board: List[List[int]], rating: Union[Rating, None]=None) -> None:
+        """ Creates a puzzle record
+
+        Args:
+            board: a sudoku game board, 0 marks an empty cell
+            rating: the rating of the board, rated here when None
+
+        """
+        self._board = board
+        self._rating = rating if rating is not None else rate(board)
+
+    def get_board(self) -> List[List[int]]:
+        """ getter for _board
+        Args:
+            None
+        Returns:
+            the sudoku game board, 0 marks an empty cell
+        """
+        return self._board
+
+    def get_rating(self) -> Rating:
+        """ getter for _rating
+        Args:
+            None
+        Returns:
+            the techniques needed to solve the board
+        """
+        return self._rating
+
+    def get_level(self) -> str:
+        """ getter for the level of _rating
+        Args:
+            None
+        Returns:
+            how hard the board is, one of rater.LEVELS
+        """
+        return self._rating.get_level()
+
+
+def generate_record(givens: int=30, seed: Union[int, None]=None) -> PuzzleRecord:
+    """ creates a random board with a single solution and rates it
+    Args:
+        givens: the amount of numbers to leave on the board
+        seed: makes the board the same every time, None for a new board
+    Returns:
+        the board and its rating
+    """
+    return PuzzleRecord(generate_puzzle(givens, seed))
+
+
+class PuzzleQueue:
+    """ Bounded queues of ready made puzzles for each of the rater's
+    levels, kept full by a background thread so that starting a game never
+    waits for the generator
+
+    Every generated puzzle is rated and goes to the queue of its level, so
+    a puzzle aimed at one level that turns out easier or harder still
+    fills another queue rather than being thrown away.
+
+    Attrs:
+        _queues(Dict[str, queue.Queue]): ready made puzzle records by level
+        _popped(Dict[str, Deque[float]]): when each puzzle not yet replaced
+                                          was taken, by level
+        _generate_seconds(List[float]): total seconds spent generating and
+                                        the amount of puzzles generated
+        _refill_seconds(List[float]): total seconds between a puzzle being
+                                      taken and replaced, and the amount of
+                                      puzzles replaced
+        _misses(int): the amount of pops that found their queue empty
+        _wake(threading.Event): set when a queue needs refilling
+        _running(bool): whether the background thread should keep going
+        _thread(Union[threading.Thread, None]): the background thread
+
+    """
+
+    def __init__(self, depth: int=3, levels: Union[Sequence[str], None]=None) -> None:
+        """ Creates the queues, start() begins filling them
+
+        Args:
+            depth: the most puzzles kept ready for each level
+            levels: the rater levels to keep puzzles of, QUEUE_LEVELS when
+                    None
+
+        """
+        levels = QUEUE_LEVELS if levels is None else levels
+        for level in levels:
+            if level not in LEVELS:
+                raise ValueError(f"unknown puzzle level: {level}")
+        self._queues: Dict[str, queue.Queue] = {level: queue.Queue(depth) for level in levels}
+        self._popped: Dict[str, Deque[float]] = {level: deque() for level in levels}
+        self._generate_seconds: List[float] = [0.0, 0]
+        self._refill_seconds: List[float] = [0.0, 0]
+        self._misses: int = 0
+        self._wake = threading.Event()
+        self._running: bool = False
+        self._thread: Union[threading.Thread, None] = None
+
+    def start(self) -> None:
+        """ starts the background thread that fills the queues
+        Args:
+            None
+        Returns:
+            None
+        """
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._fill, name="puzzle-queue",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """ stops the background thread once its current puzzle is done
+        Args:
+            None
+        Returns:
+            None
+        """
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def pop(self, level: str='medium') -> PuzzleRecord:
+        """ takes a ready made puzzle, of the nearest level with one ready
+        if the level's queue has run dry, generating one on the spot only
+        if every queue has
+        Args:
+            level: one of the queue's levels
+        Returns:
+            a rated sudoku game board with a single solution
+        """
+        try:
+            record = self._queues[level].get_nowait()
+        except queue.Empty:
+            self._misses += 1
+            record = self._take_nearest(level)
+        else:
+            self._popped[level].append(perf_counter())
+        # the background thread refills whatever was taken
+        self._wake.set()
+        if record is None:
+            record = generate_record(LEVEL_GIVENS[level])
+        return record
+
+    def get_depth(self, level: str) -> int:
+        """ getter for the amount of puzzles ready for a level
+        Args:
+            level: one of the queue's levels
+        Returns:
+            the amount of ready made puzzles
+        """
+        return self._queues[level].qsize()
+
+    def get_stats(self) -> Dict[str, Union[int, float, Dict[str, int]]]:
+        """ getter for the queue's statistics
+        Args:
+            None
+        Returns:
+            the depth of each queue, the mean seconds to generate a puzzle
+            and to replace a taken one, and the amount of pops that had to
+            wait for a puzzle to be generated
+        """
+        generated_seconds, generated = self._generate_seconds
+        refill_seconds, refilled = self._refill_seconds
+        return {'depths': {level: self.get_depth(level) for level in self._queues},
+                'generated': generated,
+                'mean_generate_seconds': generated_seconds / generated if generated else 0.0,
+                'mean_refill_seconds': refill_seconds / refilled if refilled else 0.0,
+                'misses': self._misses}
+
+    def _take_nearest(self, level: str) -> Union[PuzzleRecord, None]:
+        """ takes a ready made puzzle of the level closest to another one
+        Args:
+            level: the level asked for
+        Returns:
+            the puzzle, or None if every queue is empty
+        """
+        wanted = LEVELS.index(level)
+        for other in sorted(self._queues, key=lambda other: abs(LEVELS.index(other) - wanted)):
+            try:
+                record = self._queues[other].get_nowait()
+            except queue.Empty:
+                continue
+            self._popped[other].append(perf_counter())
+            return record
+        return None
+
+    def _offer(self, record: PuzzleRecord) -> bool:
+        """ puts a puzzle in the queue of its level if that queue has room
+        Args:
+            record: the rated puzzle
+        Returns:
+            Whether or not the puzzle was kept
+        """
+        level = record.get_level()
+        if level not in self._queues:
+            return False
+        try:
+            self._queues[level].put_nowait(record)
+        except queue.Full:
+            return False
+        if self._popped[level]:
+            self._refill_seconds[0] += perf_counter() - self._popped[level].popleft()
+            self._refill_seconds[1] += 1
+        return True
+
+    def _fill(self) -> None:
+        """ generates puzzles aimed at whichever levels are not full,
+        sleeping while they all are
+        Args:
+            None
+        Returns:
+            None
+        """
+        while self._running:
+            self._wake.clear()
+            filled = False
+            for level, puzzles in self._queues.items():
+                if not self._running or puzzles.full():
+                    continue
+                start = perf_counter()
+                record = generate_record(LEVEL_GIVENS[level])
+                self._generate_seconds[0] += perf_counter() - start
+                self._generate_seconds[1] += 1
+                self._offer(record)
+                filled = True
+            if not filled:
+                self._wake.wait()
@@ -0,0 +1,189 @@
+from array import array
+from typing import List, Tuple, Union
+
+
+# the marked numbers of every pencil mark mask, in order
+MARK_DIGITS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(number for number in range(1, 10) if mask & (1 << (number - 1)))
+    for mask in range(512))
+
+
+class Grid:
+    """ Compact 9x9 grid of numbers and pencil marks
+
+    Numbers are kept one byte per cell and pencil marks as a 16-bit mask
+    per cell, bit (number - 1) set when the number is marked, so a whole
+    grid is 81 + 162 bytes and copying it is two buffer copies.
+
+    Attrs:
+        _cells(bytearray): the number of each cell, 0 when empty, indexed
+                           by row * 9 + column
+        _marks(array): the pencil mark mask of each cell, indexed like
+                       _cells
+
+    """
+
+    __slots__ = ('_cells', '_marks')
+
+    def __init__(self, cells: Union[bytes, None]=None,
+                 marks: Union[array, None]=None) -> None:
+        """ Creates a grid
+
+        Args:
+            cells: the 81 numbers of the grid, empty when None
+            marks: the 81 pencil mark masks of the grid, none when None
+
+        """
+        self._cells = bytearray(cells) if cells is not None else bytearray(81)
+        self._marks = array('H', marks) if marks is not None else array('H', bytes(162))
+
+    @classmethod
+    def from_rows(cls, rows: List[List[int]]) -> "Grid":
+        """ creates a grid from a nested list board
+        Args:
+            rows: a sudoku game board, 0 marks an empty cell
+        Returns:
+            a grid with the numbers of the board and no pencil marks
+        """
+        return cls(bytes(number for row in rows for number in row))
+
+    def to_rows(self) -> List[List[int]]:
+        """ creates a nested list board from the grid
+        Args:
+            None
+        Returns:
+            a new sudoku game board, 0 marks an empty cell
+        """
+        cells = self._cells
+        return [list(cells[row:row + 9]) for row in range(0, 81, 9)]
+
+    def load_rows(self, rows: List[List[int]]) -> None:
+        """ replaces the numbers of the grid, keeping its pencil marks
+        Args:
+            rows: a sudoku game board, 0 marks an empty cell
+        Returns:
+            None
+        """
+        self._cells[:] = bytes(number for row in rows for number in row)
+
+    def get_cells(self) -> bytearray:
+        """ getter for _cells
+        Args:
+            None
+        Returns:
+            the number of each cell, indexed by row * 9 + column
+        """
+        return self._cells
+
+    def get_number(self, row: int, column: int) -> int:
+        """ getter for a cell's number
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+        Returns:
+            the number in the cell, 0 when empty
+        """
+        return self._cells[row * 9 + column]
+
+    def set_number(self, row: int, column: int, value: int) -> None:
+        """ setter for a cell's number
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+            value: the number the cell will adopt, 0 to empty it
+        Returns:
+            None
+        """
+        self._cells[row * 9 + column] = value
+
+    def get_marks(self, row: int, column: int) -> int:
+        """ getter for a cell's pencil marks
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+        Returns:
+            the mask of marked numbers, bit (number - 1) per number
+        """
+        return self._marks[row * 9 + column]
+
+    def set_marks(self, row: int, column: int, mask: int) -> None:
+        """ setter for a cell's pencil marks
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+            mask: the mask of marked numbers, bit (number - 1) per number
+        Returns:
+            None
+        """
+        self._marks[row * 9 + column] = mask
+
+    def get_mark_digits(self, row: int, column: int) -> Tuple[int, ...]:
+        """ getter for a cell's pencil marks as numbers
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+        Returns:
+            the marked numbers, in order
+        """
+        return MARK_DIGITS[self._marks[row * 9 + column]]
+
+    def toggle_mark(self, row: int, column: int, value: int) -> None:
+        """ marks a number in a cell, or unmarks it if already marked
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+            value: the number to toggle
+        Returns:
+            None
+        """
+        self._marks[row * 9 + column] ^= 1 << (value - 1)
+
+    def clear_marks(self) -> None:
+        """ removes every pencil mark
+        Args:
+            None
+        Returns:
+            None
+        """
+        self._marks = array('H', bytes(162))
+
+    def find_empty(self) -> Union[Tuple[int, int], None]:
+        """ finds the first empty cell in reading order
+        Args:
+            None
+        Returns:
+            the (row, column) coordinate of the cell, or None if full
+        """
+        index = self._cells.find(0)
+        if index == -1:
+            return None
+        return divmod(index, 9)
+
+    def clone(self) -> "Grid":
+        """ copies the grid
+        Args:
+            None
+        Returns:
+            a grid with the same numbers and pencil marks
+        """
+        return Grid(self._cells, self._marks)
+
+    def snapshot(self) -> bytes:
+        """ packs the grid into bytes that restore() can read back
+        Args:
+            None
+        Returns:
+            the numbers followed by the pencil marks
+        """
+        return bytes(self._cells) + self._marks.tobytes()
+
+    def restore(self, snapshot: bytes) -> None:
+        """ puts the grid back to the state of a snapshot
+        Args:
+            snapshot: bytes created by snapshot()
+        Returns:
+            None
+        """
+        self._cells[:] = snapshot[:81]
+        self._marks = array('H')
+        self._marks.frombytes(snapshot[81:])
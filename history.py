@@ -0,0 +1,137 @@
+from array import array
+from typing import Iterable, Tuple, Union
+
+
+def pack_delta(index: int, old_value: int, value: int, old_mask: int, mask: int) -> int:
+    """ packs the change to one cell into a single integer
+    Args:
+        index: the cell, row * 9 + column
+        old_value: the number the cell held, 0 when empty
+        value: the number the cell holds now, 0 when empty
+        old_mask: the pencil mark mask the cell had
+        mask: the pencil mark mask the cell has now
+    Returns:
+        the delta, 33 bits wide
+    """
+    return index | old_value << 7 | value << 11 | old_mask << 15 | mask << 24
+
+
+def unpack_delta(delta: int) -> Tuple[int, int, int, int, int]:
+    """ unpacks a delta made by pack_delta
+    Args:
+        delta: the packed change to one cell
+    Returns:
+        the cell, old number, new number, old mask and new mask
+    """
+    return (delta & 127, delta >> 7 & 15, delta >> 11 & 15,
+            delta >> 15 & 511, delta >> 24 & 511)
+
+
+class History:
+    """ Undo and redo stacks of steps, each step being the deltas of the
+    cells one move changed
+
+    Every stack is a flat array of packed deltas plus an array of where
+    each step ends, so a move costs 8 bytes per changed cell and 4 bytes
+    for the step, however long the game goes on, and undoing or redoing a
+    step only touches that step's deltas.
+
+    Attrs:
+        _deltas(array): the deltas of the steps that can be undone
+        _ends(array): where each step of _deltas ends
+        _redo_deltas(array): the deltas of the steps that can be redone,
+                             the most recently undone last
+        _redo_ends(array): where each step of _redo_deltas ends
+
+    """
+
+    __slots__ = ('_deltas', '_ends', '_redo_deltas', '_redo_ends')
+
+    def __init__(self) -> None:
+        """ Creates an empty history
+
+        Args:
+            None
+
+        """
+        self._deltas = array('Q')
+        self._ends = array('L')
+        self._redo_deltas = array('Q')
+        self._redo_ends = array('L')
+
+    def clear(self) -> None:
+        """ forgets every step
+        Args:
+            None
+        Returns:
+            None
+        """
+        del self._deltas[:], self._ends[:], self._redo_deltas[:], self._redo_ends[:]
+
+    def can_undo(self) -> bool:
+        """ getter for whether a step can be undone
+        Args:
+            None
+        Returns:
+            Whether or not there is a step to undo
+        """
+        return bool(self._ends)
+
+    def can_redo(self) -> bool:
+        """ getter for whether a step can be redone
+        Args:
+            None
+        Returns:
+            Whether or not there is a step to redo
+        """
+        return bool(self._redo_ends)
+
+    def push(self, deltas: Iterable[int]) -> None:
+        """ records a new step, forgetting the steps that could be redone
+        Args:
+            deltas: the packed changes of the step's cells
+        Returns:
+            None
+        """
+        self._deltas.extend(deltas)
+        self._ends.append(len(self._deltas))
+        del self._redo_deltas[:], self._redo_ends[:]
+
+    def undo(self) -> Union[array, None]:
+        """ moves the last step onto the redo stack
+        Args:
+            None
+        Returns:
+            the step's deltas, or None if there is no step to undo
+        """
+        return self._move(self._deltas, self._ends, self._redo_deltas, self._redo_ends)
+
+    def redo(self) -> Union[array, None]:
+        """ moves the last undone step back onto the undo stack
+        Args:
+            None
+        Returns:
+            the step's deltas, or None if there is no step to redo
+        """
+        return self._move(self._redo_deltas, self._redo_ends, self._deltas, self._ends)
+
+    @staticmethod
+    def _move(deltas: array, ends: array, to_deltas: array, to_ends: array) -> Union[array, None]:
+        """ moves the last step of one stack onto another
+        Args:
+            deltas: the deltas of the stack to take from
+            ends: where each step of deltas ends
+            to_deltas: the deltas of the stack to put onto
+            to_ends: where each step of to_deltas ends
+        Returns:
+            the step's deltas, or None if the stack is empty
+        """
+        if not ends:
+            return None
+        ends.pop()
+        start = ends[-1] if ends else 0
+        step = deltas[start:]
+        del deltas[start:]
+        to_deltas.extend(step)
+        to_ends.append(len(to_deltas))
+        return step
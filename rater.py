@@ -0,0 +1,601 @@
+from itertools import combinations
+from typing import Dict, FrozenSet, List, Tuple, Union
+
+from solver import ALL_DIGITS, BIT_COUNTS, PEERS, UNITS
+
+
+UNIT_CELLS: List[List[int]] = [[row * 9 + column for row, column in unit] for unit in UNITS]
+PEER_CELLS: List[FrozenSet[int]] = [frozenset(row * 9 + column for row, column in peers)
+                                    for peers in PEERS]
+LINE_CELLS: List[Tuple[List[List[int]], List[List[int]]]] = [(UNIT_CELLS[:9], UNIT_CELLS[9:18]),
+                                                             (UNIT_CELLS[9:18], UNIT_CELLS[:9])]
+
+# (technique, weight, level), from the easiest to the hardest; weights
+# follow the scale of Sudoku Explainer
+TECHNIQUES: List[Tuple[str, float, str]] = [
+    ('hidden_single', 1.5, 'easy'),
+    ('naked_single', 2.3, 'medium'),
+    ('locked_candidates', 2.6, 'hard'),
+    ('naked_pair', 3.0, 'hard'),
+    ('x_wing', 3.2, 'hard'),
+    ('hidden_pair', 3.4, 'hard'),
+    ('naked_triple', 3.6, 'expert'),
+    ('swordfish', 3.8, 'expert'),
+    ('hidden_triple', 4.0, 'expert'),
+    ('chains', 6.6, 'extreme'),
+]
+GUESSING: Tuple[str, float, str] = ('guessing', 10.0, 'extreme')
+LEVELS: Tuple[str, ...] = ('easy', 'medium', 'hard', 'expert', 'extreme')
+
+
+class Rating:
+    """ How hard a puzzle is for a person, from the logical techniques
+    needed to solve it
+
+    Attrs:
+        _level(str): one of LEVELS, or 'invalid' for boards without a
+                     solution
+        _score(float): the weight of the hardest technique, plus a
+                       hundredth for each time it was used, up to 9
+        _hardest(str): the hardest technique needed, 'guessing' when the
+                       techniques were not enough
+        _counts(Dict[str, int]): how often each technique was used
+
+    """
+
+    __slots__ = ('_level', '_score', '_hardest', '_counts')
+
+    def __init__(self, level: str, score: float, hardest: str,
+                 counts: Dict[str, int]) -> None:
+        """ Creates a rating
+
+        Args:
+            level: one of LEVELS, or 'invalid'
+            score: the weight of the hardest technique plus its usage
+            hardest: the hardest technique needed
+            counts: how often each technique was used
+
+        """
+        self._level = level
+        self._score = score
+        self._hardest = hardest
+        self._counts = counts
+
+    def get_level(self) -> str:
+        """ getter for _level
+        Args:
+            None
+        Returns:
+            one of LEVELS, or 'invalid' for boards without a solution
+        """
+        return self._level
+
+    def get_score(self) -> float:
+        """ getter for _score
+        Args:
+            None
+        Returns:
+            the weight of the hardest technique plus its usage
+        """
+        return self._score
+
+    def get_hardest(self) -> str:
+        """ getter for _hardest
+        Args:
+            None
+        Returns:
+            the hardest technique needed to solve the puzzle
+        """
+        return self._hardest
+
+    def get_counts(self) -> Dict[str, int]:
+        """ getter for _counts
+        Args:
+            None
+        Returns:
+            how often each technique was used
+        """
+        return self._counts
+
+
+class Hint:
+    """ The next number a person could logically place on a board
+
+    Attrs:
+        _coordinate(Tuple[int, int]): the (row, column) of the cell
+        _number(int): the number that goes in the cell
+        _technique(str): the hardest technique needed to see it, one of
+                         TECHNIQUES
+
+    """
+
+    __slots__ = ('_coordinate', '_number', '_technique')
+
+    def __init__(self, coordinate: Tuple[int, int], number: int, technique: str) -> None:
+        """ Creates a hint
+
+        Args:
+            coordinate: the (row, column) of the cell
+            number: the number that goes in the cell
+            technique: the hardest technique needed to see it
+
+        """
+        self._coordinate = coordinate
+        self._number = number
+        self._technique = technique
+
+    def get_coordinate(self) -> Tuple[int, int]:
+        """ getter for _coordinate
+        Args:
+            None
+        Returns:
+            the (row, column) of the cell
+        """
+        return self._coordinate
+
+    def get_number(self) -> int:
+        """ getter for _number
+        Args:
+            None
+        Returns:
+            the number that goes in the cell
+        """
+        return self._number
+
+    def get_technique(self) -> str:
+        """ getter for _technique
+        Args:
+            None
+        Returns:
+            the hardest technique needed to see the number
+        """
+        return self._technique
+
+
+class Rater:
+    """ Solves a board the way a person would, always using the easiest
+    technique that makes progress
+
+    Attrs:
+        _cells(List[int]): the number of each cell, 0 when empty, indexed
+                           by row * 9 + column
+        _candidates(List[int]): the numbers each empty cell can still hold
+        _invalid(bool): whether the board has been found to have no
+                        solution
+        _techniques(List[Tuple[Callable, str, float, str]]): each technique
+                    with its name, weight and level, easiest first
+
+    """
+
+    def __init__(self, board: List[List[int]],
+                 candidates: Union[List[int], None]=None) -> None:
+        """ Creates a rater for a board
+
+        Args:
+            board: a sudoku game board, 0 marks an empty cell
+            candidates: the numbers no unit rules out of each cell, already
+                        kept by the caller, worked out from the board when
+                        None
+
+        """
+        self._cells: List[int] = [0] * 81
+        self._candidates: List[int] = [ALL_DIGITS] * 81
+        self._invalid: bool = False
+        self._techniques = [(getattr(self, '_' + name), name, weight, level)
+                            for name, weight, level in TECHNIQUES]
+        if candidates is not None:
+            self._cells = [number for row in board for number in row]
+            self._candidates = [0 if number else mask
+                                for number, mask in zip(self._cells, candidates)]
+            return
+        for row in range(9):
+            for column in range(9):
+                number = board[row][column]
+                if number:
+                    if not self._candidates[row * 9 + column] & (1 << (number - 1)):
+                        self._invalid = True
+                    self._place(row * 9 + column, number)
+
+    def rate(self) -> Rating:
+        """ solves the board with the techniques, from easiest to hardest
+        Args:
+            None
+        Returns:
+            the rating of the board
+        """
+        counts = {name: 0 for name, weight, level in TECHNIQUES}
+        hardest = None
+        while not self._invalid and 0 in self._cells:
+            for technique, name, weight, level in self._techniques:
+                used = technique()
+                if used:
+                    counts[name] += used
+                    if hardest is None or weight > hardest[1]:
+                        hardest = (name, weight, level)
+                    break
+            else:
+                hardest = GUESSING
+                break
+            if any(not self._cells[cell] and not self._candidates[cell]
+                   for cell in range(81)):
+                self._invalid = True
+
+        if self._invalid:
+            return Rating('invalid', 0.0, 'none', counts)
+        if hardest is None:
+            return Rating(LEVELS[0], 0.0, 'none', counts)
+        name, weight, level = hardest
+        return Rating(level, round(weight + min(counts.get(name, 0), 9) / 100, 2),
+                      name, counts)
+
+    def find_hint(self) -> Union[Hint, None]:
+        """ finds the easiest number to place next, ruling candidates out
+        with harder techniques only until a single turns up
+        Args:
+            None
+        Returns:
+            the hint, or None if the board is full, has no solution or the
+            techniques are not enough
+        """
+        weights = {name: weight for name, weight, level in TECHNIQUES}
+        hardest = None
+        while not self._invalid and 0 in self._cells:
+            single = self._find_single()
+            if single is not None:
+                cell, number, name = single
+                if hardest is None or weights[name] > weights[hardest]:
+                    hardest = name
+                return Hint(divmod(cell, 9), number, hardest)
+            # the singles come first in the ladder and were just tried
+            for technique, name, weight, level in self._techniques[2:]:
+                if technique():
+                    if hardest is None or weight > weights[hardest]:
+                        hardest = name
+                    break
+            else:
+                return None
+        return None
+
+    def _find_single(self) -> Union[Tuple[int, int, str], None]:
+        """ looks for a hidden single, then a naked single, without
+        placing it
+        Args:
+            None
+        Returns:
+            the cell, its number and the technique, or None if there is no
+            single or a cell has no candidates left
+        """
+        candidates = self._candidates
+        for cell in range(81):
+            if not self._cells[cell] and not candidates[cell]:
+                self._invalid = True
+                return None
+        for unit in UNIT_CELLS:
+            once = 0
+            more = 0
+            for cell in unit:
+                more |= once & candidates[cell]
+                once |= candidates[cell]
+            singles = once & ~more
+            if singles:
+                for cell in unit:
+                    bit = candidates[cell] & singles
+                    if bit:
+                        bit &= -bit
+                        return cell, bit.bit_length(), 'hidden_single'
+        for cell in range(81):
+            mask = candidates[cell]
+            if mask and not mask & (mask - 1):
+                return cell, mask.bit_length(), 'naked_single'
+        return None
+
+    def _place(self, cell: int, number: int) -> None:
+        """ fills a cell and rules its number out of the cell's peers
+        Args:
+            cell: the index of the cell
+            number: the number to place
+        Returns:
+            None
+        """
+        self._cells[cell] = number
+        self._candidates[cell] = 0
+        bit = ~(1 << (number - 1))
+        for peer in PEER_CELLS[cell]:
+            self._candidates[peer] &= bit
+
+    def _eliminate(self, cells: List[int], numbers: int) -> bool:
+        """ rules numbers out of cells
+        Args:
+            cells: the indexes of the cells
+            numbers: a bitmask of the numbers to rule out
+        Returns:
+            Whether or not any candidate was removed
+        """
+        removed = False
+        for cell in cells:
+            if self._candidates[cell] & numbers:
+                self._candidates[cell] &= ~numbers
+                removed = True
+        return removed
+
+    def _hidden_single(self) -> int:
+        """ fills numbers that fit in a single cell of a unit
+        Args:
+            None
+        Returns:
+            the amount of cells filled
+        """
+        filled = 0
+        candidates = self._candidates
+        for unit in UNIT_CELLS:
+            once = 0
+            more = 0
+            for cell in unit:
+                more |= once & candidates[cell]
+                once |= candidates[cell]
+            singles = once & ~more
+            for cell in unit:
+                bit = candidates[cell] & singles
+                if bit:
+                    if bit & (bit - 1):
+                        self._invalid = True
+                        return filled
+                    self._place(cell, bit.bit_length())
+                    filled += 1
+        return filled
+
+    def _naked_single(self) -> int:
+        """ fills cells that have a single candidate left
+        Args:
+            None
+        Returns:
+            the amount of cells filled
+        """
+        filled = 0
+        for cell in range(81):
+            candidates = self._candidates[cell]
+            if candidates and not candidates & (candidates - 1):
+                self._place(cell, candidates.bit_length())
+                filled += 1
+        return filled
+
+    def _locked_candidates(self) -> int:
+        """ rules a number out of a line when it is locked to one box there,
+        and out of a box when it is locked to one of its lines
+        Args:
+            None
+        Returns:
+            the amount of locked numbers that ruled anything out
+        """
+        used = 0
+        candidates = self._candidates
+        for box in UNIT_CELLS[18:]:
+            for lines in (UNIT_CELLS[:9], UNIT_CELLS[9:18]):
+                for line in lines:
+                    inside = set(line) & set(box)
+                    if not inside:
+                        continue
+                    here = there_line = there_box = 0
+                    for cell in line:
+                        if cell in inside:
+                            here |= candidates[cell]
+                        else:
+                            there_line |= candidates[cell]
+                    for cell in box:
+                        if cell not in inside:
+                            there_box |= candidates[cell]
+                    # pointing, then claiming
+                    pointing = here & ~there_box & there_line
+                    claiming = here & ~there_line & there_box
+                    if pointing and self._eliminate([cell for cell in line
+                                                     if cell not in inside], pointing):
+                        used += 1
+                    if claiming and self._eliminate([cell for cell in box
+                                                     if cell not in inside], claiming):
+                        used += 1
+        return used
+
+    def _naked_subset(self, size: int) -> int:
+        """ rules numbers out of a unit when size of its cells can only
+        hold those size numbers
+        Args:
+            size: the amount of cells in the subset
+        Returns:
+            the amount of subsets that ruled anything out
+        """
+        used = 0
+        candidates = self._candidates
+        for unit in UNIT_CELLS:
+            cells = [cell for cell in unit if 1 < BIT_COUNTS[candidates[cell]] <= size]
+            for subset in combinations(cells, size):
+                numbers = 0
+                for cell in subset:
+                    numbers |= candidates[cell]
+                if BIT_COUNTS[numbers] == size and self._eliminate(
+                        [cell for cell in unit if cell not in subset], numbers):
+                    used += 1
+        return used
+
+    def _hidden_subset(self, size: int) -> int:
+        """ rules other numbers out of size cells of a unit when size
+        numbers can only go in those cells
+        Args:
+            size: the amount of numbers in the subset
+        Returns:
+            the amount of subsets that ruled anything out
+        """
+        used = 0
+        candidates = self._candidates
+        for unit in UNIT_CELLS:
+            places = {}
+            for number in range(9):
+                cells = [cell for cell in unit if candidates[cell] >> number & 1]
+                if 1 < len(cells) <= size:
+                    places[1 << number] = cells
+            for subset in combinations(places, size):
+                cells = set()
+                numbers = 0
+                for number in subset:
+                    cells.update(places[number])
+                    numbers |= number
+                if len(cells) == size and self._eliminate(list(cells), ALL_DIGITS & ~numbers):
+                    used += 1
+        return used
+
+    def _fish(self, size: int) -> int:
+        """ rules a number out of size columns when size rows only hold it
+        in those columns, and the same with rows and columns swapped
+        Args:
+            size: 2 for an X-wing, 3 for a swordfish
+        Returns:
+            the amount of fish that ruled anything out
+        """
+        used = 0
+        candidates = self._candidates
+        for number in range(9):
+            bit = 1 << number
+            for lines, crossing in LINE_CELLS:
+                places = {}
+                for index, line in enumerate(lines):
+                    positions = frozenset(position for position, cell in enumerate(line)
+                                          if candidates[cell] & bit)
+                    if 1 < len(positions) <= size:
+                        places[index] = positions
+                for subset in combinations(places, size):
+                    positions = frozenset().union(*(places[index] for index in subset))
+                    if len(positions) != size:
+                        continue
+                    cells = [cell for position in positions
+                             for index, cell in enumerate(crossing[position])
+                             if index not in subset]
+                    if self._eliminate(cells, bit):
+                        used += 1
+        return used
+
+    def _naked_pair(self) -> int:
+        """ rules out the numbers of two cells of a unit that share the
+        same two candidates
+        Args:
+            None
+        Returns:
+            the amount of pairs that ruled anything out
+        """
+        return self._naked_subset(2)
+
+    def _naked_triple(self) -> int:
+        """ rules out the numbers of three cells of a unit that only hold
+        three numbers between them
+        Args:
+            None
+        Returns:
+            the amount of triples that ruled anything out
+        """
+        return self._naked_subset(3)
+
+    def _hidden_pair(self) -> int:
+        """ clears two cells of a unit down to the two numbers that only
+        fit in them
+        Args:
+            None
+        Returns:
+            the amount of pairs that ruled anything out
+        """
+        return self._hidden_subset(2)
+
+    def _hidden_triple(self) -> int:
+        """ clears three cells of a unit down to the three numbers that
+        only fit in them
+        Args:
+            None
+        Returns:
+            the amount of triples that ruled anything out
+        """
+        return self._hidden_subset(3)
+
+    def _x_wing(self) -> int:
+        """ applies fish over two lines
+        Args:
+            None
+        Returns:
+            the amount of X-wings that ruled anything out
+        """
+        return self._fish(2)
+
+    def _swordfish(self) -> int:
+        """ applies fish over three lines
+        Args:
+            None
+        Returns:
+            the amount of swordfish that ruled anything out
+        """
+        return self._fish(3)
+
+    def _chains(self) -> int:
+        """ colours chains of cells linked by a number that has only two
+        places in a unit, so that one colour must be true, then rules the
+        number out of a colour that sees itself and out of cells that see
+        both colours
+        Args:
+            None
+        Returns:
+            the amount of chains that ruled anything out
+        """
+        used = 0
+        candidates = self._candidates
+        for number in range(9):
+            bit = 1 << number
+            links: Dict[int, List[int]] = {}
+            for unit in UNIT_CELLS:
+                cells = [cell for cell in unit if candidates[cell] & bit]
+                if len(cells) == 2:
+                    links.setdefault(cells[0], []).append(cells[1])
+                    links.setdefault(cells[1], []).append(cells[0])
+
+            coloured: Dict[int, int] = {}
+            for start in links:
+                if start in coloured:
+                    continue
+                colours: Tuple[List[int], List[int]] = ([], [])
+                coloured[start] = 0
+                stack = [start]
+                while stack:
+                    cell = stack.pop()
+                    colours[coloured[cell]].append(cell)
+                    for other in links[cell]:
+                        if other not in coloured:
+                            coloured[other] = 1 - coloured[cell]
+                            stack.append(other)
+
+                for colour in colours:
+                    if any(PEER_CELLS[cell] & set(colour) for cell in colour):
+                        if self._eliminate(colour, bit):
+                            used += 1
+                        break
+                else:
+                    seen = [set().union(*(PEER_CELLS[cell] for cell in colour))
+                            for colour in colours]
+                    trapped = [cell for cell in seen[0] & seen[1]
+                               if cell not in coloured]
+                    if self._eliminate(trapped, bit):
+                        used += 1
+        return used
+
+
+def find_hint(board: List[List[int]]) -> Union[Hint, None]:
+    """ finds the easiest number a person could place next on a board
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+    Returns:
+        the hint, or None if none could be found
+    """
+    return Rater(board).find_hint()
+
+
+def rate(board: List[List[int]]) -> Rating:
+    """ rates how hard a board is for a person to solve
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+    Returns:
+        the rating of the board
+    """
+    return Rater(board).rate()
@@ -0,0 +1,219 @@
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+import arcade
+import PIL.Image
+import PIL.ImageDraw
+import PIL.ImageFont
+
+
+FONT_NAMES: Tuple[str, ...] = ('arial',)
+# text is drawn this many times larger, then shrunk to smooth its edges
+TEXT_SCALE = 5
+
+
+@lru_cache(maxsize=None)
+def load_font(font_size: float) -> "PIL.ImageFont.FreeTypeFont":
+    """ finds the game's font at a size, the same way arcade.draw_text does
+    Args:
+        font_size: the size in arcade's points
+    Returns:
+        the font, or PIL's default font if arial is missing
+    """
+    size = int(font_size * 1.25 * TEXT_SCALE)
+    for name in chain(*((name, name + '.ttf') for name in FONT_NAMES)):
+        try:
+            return PIL.ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return PIL.ImageFont.load_default()
+
+
+@lru_cache(maxsize=1024)
+def make_text_texture(text: str, color: Tuple[int, ...], font_size: float) -> arcade.Texture:
+    """ renders text into a texture once, looking like arcade.draw_text
+    Args:
+        text: the text to render
+        color: the color of the text
+        font_size: the size in arcade's points
+    Returns:
+        a texture holding the text
+    """
+    font = load_font(font_size)
+    measure = PIL.ImageDraw.Draw(PIL.Image.new("RGBA", (10, 10)))
+    width, height = measure.multiline_textsize(text, font=font)
+    image = PIL.Image.new("RGBA", (max(width, 1), max(height, 1)))
+    PIL.ImageDraw.Draw(image).multiline_text((0, 0), text, tuple(color), font=font)
+    image = image.resize((max(width // TEXT_SCALE, 1), max(height // TEXT_SCALE, 1)),
+                         resample=PIL.Image.LANCZOS)
+    return arcade.Texture(f"text-{text}-{tuple(color)}-{font_size}", image)
+
+
+def make_text_sprite(text: str, x: float, y: float, color: Tuple[int, ...],
+                     font_size: float) -> arcade.Sprite:
+    """ creates a sprite showing text, for drawing as part of a SpriteList
+    Args:
+        text: the text to show
+        x: the center of the text
+        y: the bottom of the text
+        color: the color of the text
+        font_size: the size in arcade's points
+    Returns:
+        a sprite placed like arcade.draw_text with anchor_x="center"
+    """
+    texture = make_text_texture(text, tuple(color), font_size)
+    sprite = arcade.Sprite()
+    sprite.texture = texture
+    sprite.center_x = x
+    sprite.center_y = y + texture.height / 2
+    return sprite
+
+
+class GlyphAtlas:
+    """ Textures of the digits 1 to 9 in every color and size the game
+    draws them in, shared by every board and view so each digit is only
+    ever rendered once
+
+    Attrs:
+        _glyphs(Dict[Tuple[Tuple[int, ...], float], List[arcade.Texture]]):
+                the texture of each digit, by color and size, index 0
+                unused
+
+    """
+
+    _glyphs: Dict[Tuple[Tuple[int, ...], float], List[arcade.Texture]] = {}
+
+    @classmethod
+    def preload(cls, styles: Iterable[Tuple[Tuple[int, ...], float]]) -> None:
+        """ renders the digits in several styles ahead of their first use
+        Args:
+            styles: (color, size) pairs
+        Returns:
+            None
+        """
+        for color, font_size in styles:
+            cls.get_glyphs(color, font_size)
+
+    @classmethod
+    def get_glyphs(cls, color: Tuple[int, ...], font_size: float) -> List[arcade.Texture]:
+        """ getter for the digits of a style, rendering them the first time
+        Args:
+            color: the color of the digits
+            font_size: the size in arcade's points
+        Returns:
+            the texture of each digit, index 0 unused
+        """
+        style = (tuple(color), font_size)
+        glyphs = cls._glyphs.get(style)
+        if glyphs is None:
+            glyphs = [None] + [make_text_texture(str(digit), style[0], font_size)
+                               for digit in range(1, 10)]
+            cls._glyphs[style] = glyphs
+        return glyphs
+
+    @classmethod
+    def make_sprite(cls, digit: int, x: float, y: float, color: Tuple[int, ...],
+                    font_size: float) -> arcade.Sprite:
+        """ creates a sprite showing a digit
+        Args:
+            digit: the digit, 1 to 9
+            x: the center of the digit
+            y: the bottom of the digit
+            color: the color of the digit
+            font_size: the size in arcade's points
+        Returns:
+            a sprite placed like arcade.draw_text with anchor_x="center"
+        """
+        texture = cls.get_glyphs(color, font_size)[digit]
+        sprite = arcade.Sprite()
+        sprite.texture = texture
+        sprite.center_x = x
+        sprite.center_y = y + texture.height / 2
+        return sprite
+
+    @classmethod
+    def make_row(cls, digits: Sequence[int], x: float, y: float, color: Tuple[int, ...],
+                 font_size: float) -> List[arcade.Sprite]:
+        """ creates sprites showing digits side by side after a space, laid
+        out like the text ' ' + digits
+        Args:
+            digits: the digits, 1 to 9
+            x: the center of the row
+            y: the bottom of the row
+            color: the color of the digits
+            font_size: the size in arcade's points
+        Returns:
+            a sprite for each digit
+        """
+        glyphs = cls.get_glyphs(color, font_size)
+        # arial's digits are all as wide, and twice as wide as its space
+        width = glyphs[1].width
+        left = x - (len(digits) + 0.5) * width / 2 + width / 2
+        return [cls.make_sprite(digit, left + (i + 0.5) * width, y, color, font_size)
+                for i, digit in enumerate(digits)]
+
+
+class Layer:
+    """ Shapes and sprites that are drawn together and kept between frames,
+    only rebuilt after being marked dirty
+
+    arcade 2.3.7 has no offscreen framebuffer, so a layer keeps its batches
+    on the GPU instead of a rendered image: a clean layer costs a couple of
+    batched draw calls and no work in Python.
+
+    Attrs:
+        _build(Callable[[ShapeElementList, SpriteList], None]): fills the
+               layer's new shapes and sprites when it is rebuilt
+        _shapes(Union[ShapeElementList, None]): the layer's shapes
+        _sprites(Union[SpriteList, None]): the layer's sprites
+        _dirty(bool): whether the layer must be rebuilt before drawing
+
+    """
+
+    __slots__ = ('_build', '_shapes', '_sprites', '_dirty')
+
+    def __init__(self, build: Callable[[arcade.ShapeElementList, arcade.SpriteList], None]) -> None:
+        """ Creates a layer, built on its first draw
+
+        Args:
+            build: fills the layer's new shapes and sprites
+
+        """
+        self._build = build
+        self._shapes = None
+        self._sprites = None
+        self._dirty: bool = True
+
+    def mark_dirty(self) -> None:
+        """ makes the next draw rebuild the layer
+        Args:
+            None
+        Returns:
+            None
+        """
+        self._dirty = True
+
+    def is_dirty(self) -> bool:
+        """ getter for _dirty
+        Args:
+            None
+        Returns:
+            Whether or not the next draw rebuilds the layer
+        """
+        return self._dirty
+
+    def draw(self) -> None:
+        """ draws the layer, rebuilding it first if it is dirty
+        Args:
+            None
+        Returns:
+            None
+        """
+        if self._dirty:
+            self._shapes = arcade.ShapeElementList()
+            self._sprites = arcade.SpriteList()
+            self._build(self._shapes, self._sprites)
+            self._dirty = False
+        self._shapes.draw()
+        self._sprites.draw()
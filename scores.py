@@ -0,0 +1,556 @@
+import json
+import os
+from bisect import insort
+import pickle
+import threading
+import zlib
+from typing import BinaryIO, Dict, Iterable, List, Tuple, Union
+
+
+class Score:
+    """ A single won game
+
+    Attrs:
+        _name(str): the name of the winner
+        _color(Tuple[int, ...]): the winner's preferred color
+        _time(float): the seconds it took to complete the board
+        _puzzle(str): the start board as an 81 character line, empty when
+                      unknown
+
+    """
+
+    __slots__ = ('_name', '_color', '_time', '_puzzle')
+
+    def __init__(self, name: str, color: Tuple[int, ...], time: float,
+                 puzzle: str='') -> None:
+        """ Creates a score
+
+        Args:
+            name: the name of the winner
+            color: the winner's preferred color
+            time: the seconds it took to complete the board
+            puzzle: the start board as an 81 character line, empty when
+                    unknown
+
+        """
+        self._name = name
+        self._color = tuple(color)
+        self._time = float(time)
+        self._puzzle = puzzle
+
+    def get_name(self) -> str:
+        """ getter for _name
+        Args:
+            None
+        Returns:
+            the name of the winner
+        """
+        return self._name
+
+    def get_color(self) -> Tuple[int, ...]:
+        """ getter for _color
+        Args:
+            None
+        Returns:
+            the winner's preferred color
+        """
+        return self._color
+
+    def get_time(self) -> float:
+        """ getter for _time
+        Args:
+            None
+        Returns:
+            the seconds it took to complete the board
+        """
+        return self._time
+
+    def get_puzzle(self) -> str:
+        """ getter for _puzzle
+        Args:
+            None
+        Returns:
+            the start board as an 81 character line, empty when unknown
+        """
+        return self._puzzle
+
+    def encode(self) -> bytes:
+        """ turns the score into a log line, checksummed so that a line
+        cut short by a crash is never read back
+        Args:
+            None
+        Returns:
+            the checksum and the score as JSON, ending in a newline
+        """
+        body = json.dumps([self._name, list(self._color), self._time, self._puzzle],
+                          separators=(',', ':')).encode()
+        return b'%08x\t%s\n' % (zlib.crc32(body), body)
+
+    @classmethod
+    def decode(cls, line: bytes) -> Union["Score", None]:
+        """ reads a log line written by encode()
+        Args:
+            line: the line, with or without its newline
+        Returns:
+            the score, or None if the line is damaged
+        """
+        checksum, _, body = line.rstrip(b'\n').partition(b'\t')
+        try:
+            if int(checksum, 16) != zlib.crc32(body):
+                return None
+            name, color, time, puzzle = json.loads(body)
+            return cls(name, color, time, puzzle)
+        except (TypeError, ValueError):
+            return None
+
+
+class _LegacyWinner:
+    """ Stands in for the Winner class of old pickled leaderboards, whose
+    module may no longer exist """
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    """ Unpickler that reads any pickled Winner, whatever module it was
+    saved from """
+
+    def find_class(self, module: str, name: str) -> type:
+        if name == 'Winner':
+            return _LegacyWinner
+        return super().find_class(module, name)
+
+
+def read_pickled_scores(path: str) -> List[Score]:
+    """ reads the winners of a leaderboard saved by the old pickle format
+    Args:
+        path: the pickle file
+    Returns:
+        the scores, none if the file is missing, empty or unreadable
+    """
+    try:
+        with open(path, 'rb') as f:
+            winners = _LegacyUnpickler(f).load()
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        return []
+    scores = []
+    for winner in winners if isinstance(winners, list) else []:
+        state = getattr(winner, '__dict__', {})
+        try:
+            scores.append(Score(state['_name'], state['_preferred_color'], state['_time']))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return scores
+
+
+class Leaderboard:
+    """ The fastest games overall, of each winner and of each puzzle, each
+    kept in order as games are added so reading one is a slice
+
+    Attrs:
+        _size(int): the most games kept in each ranking
+        _added(int): the amount of games added, breaking ties so that the
+                     earlier of two equal times ranks first
+        _overall(List[Tuple[float, int, Score]]): the fastest games
+        _by_name(Dict[str, List[Tuple[float, int, Score]]]): the fastest
+                                                             games of each
+                                                             winner
+        _by_puzzle(Dict[str, List[Tuple[float, int, Score]]]): the fastest
+                                                               games of
+                                                               each puzzle
+
+    """
+
+    __slots__ = ('_size', '_added', '_overall', '_by_name', '_by_puzzle')
+
+    def __init__(self, size: int=10) -> None:
+        """ Creates an empty leaderboard
+
+        Args:
+            size: the most games kept in each ranking
+
+        """
+        self._size = size
+        self._added: int = 0
+        self._overall: List[Tuple[float, int, Score]] = []
+        self._by_name: Dict[str, List[Tuple[float, int, Score]]] = {}
+        self._by_puzzle: Dict[str, List[Tuple[float, int, Score]]] = {}
+
+    def add(self, score: Score) -> None:
+        """ ranks a game in every ranking it belongs to
+        Args:
+            score: the game to rank
+        Returns:
+            None
+        """
+        entry = (score.get_time(), self._added, score)
+        self._added += 1
+        self._insert(self._overall, entry)
+        self._insert(self._by_name.setdefault(score.get_name(), []), entry)
+        if score.get_puzzle():
+            self._insert(self._by_puzzle.setdefault(score.get_puzzle(), []), entry)
+
+    def _insert(self, ranking: List[Tuple[float, int, Score]],
+                entry: Tuple[float, int, Score]) -> None:
+        """ puts a game in its place in a ranking, dropping the slowest game
+        if the ranking is full
+        Args:
+            ranking: the ranking to add to
+            entry: the time, order added and game
+        Returns:
+            None
+        """
+        if len(ranking) == self._size and entry >= ranking[-1]:
+            return
+        insort(ranking, entry)
+        del ranking[self._size:]
+
+    def get_top(self, amount: Union[int, None]=None) -> List[Score]:
+        """ getter for the fastest games overall
+        Args:
+            amount: the amount of games, every kept game when None
+        Returns:
+            the games, fastest first
+        """
+        return [entry[2] for entry in self._overall[:amount]]
+
+    def get_top_by_name(self, name: str, amount: Union[int, None]=None) -> List[Score]:
+        """ getter for the fastest games of a winner
+        Args:
+            name: the name of the winner
+            amount: the amount of games, every kept game when None
+        Returns:
+            the games, fastest first
+        """
+        return [entry[2] for entry in self._by_name.get(name, [])[:amount]]
+
+    def get_top_by_puzzle(self, puzzle: str, amount: Union[int, None]=None) -> List[Score]:
+        """ getter for the fastest games of a puzzle
+        Args:
+            puzzle: the start board as an 81 character line
+            amount: the amount of games, every kept game when None
+        Returns:
+            the games, fastest first
+        """
+        return [entry[2] for entry in self._by_puzzle.get(puzzle, [])[:amount]]
+
+
+class ScoreStore:
+    """ Append only log of won games
+
+    Every win is one checksummed line added to the end of the file, so
+    saving does not depend on how many games were recorded before. A line
+    cut short by a crash is cut off when the log is next read, and only if
+    reading it found other damaged lines is the log rewritten without them
+    in the background, a line at a time.
+
+    Next to the log a small summary file holds the amount of games and
+    the fastest ones, so opening the store reads a constant amount no
+    matter how long the history is. The whole log is only read the first
+    time a winner's or puzzle's ranking is asked for, or when the summary
+    does not match the log after a crash.
+
+    Attrs:
+        _path(str): the log file
+        _top_size(int): the most games kept in each ranking
+        _count(int): the amount of recorded games
+        _log_size(int): the size of the log in bytes
+        _top(List[Score]): the fastest recorded games, fastest first
+        _leaderboard(Union[Leaderboard, None]): every ranking, None until
+                                                the whole log is read
+        _lock(threading.RLock): guards the store and the file
+        _compactor(Union[threading.Thread, None]): the thread rewriting
+                                                   the log, if any
+
+    """
+
+    def __init__(self, path: str, top: int=10) -> None:
+        """ Creates an empty store, load() reads an existing log
+
+        Args:
+            path: the log file
+            top: the most games kept in each ranking of the leaderboard
+
+        """
+        self._path = path
+        self._top_size = top
+        self._count: int = 0
+        self._log_size: int = 0
+        self._top: List[Score] = []
+        self._leaderboard: Union[Leaderboard, None] = None
+        self._lock = threading.RLock()
+        self._compactor: Union[threading.Thread, None] = None
+
+    @classmethod
+    def load(cls, path: str, legacy_path: Union[str, None]=None,
+             top: int=10) -> "ScoreStore":
+        """ opens a log from its summary, reading the whole log only to
+        recover from a damaged end, or creates it from an old pickled
+        leaderboard the first time
+        Args:
+            path: the log file
+            legacy_path: a pickle file saved by the old leaderboard, read
+                         only when the log does not exist yet
+            top: the most games kept in each ranking of the leaderboard
+        Returns:
+            the store
+        """
+        store = cls(path, top)
+        if not os.path.exists(path):
+            scores = read_pickled_scores(legacy_path) if legacy_path is not None else []
+            store._rewrite(scores)
+            store._index(scores)
+            store._write_summary()
+        elif not store._read_summary():
+            store._load_log()
+        return store
+
+    def add(self, score: Score) -> None:
+        """ records a won game by adding one line to the log
+        Args:
+            score: the game to record
+        Returns:
+            None
+        """
+        line = score.encode()
+        with self._lock:
+            with open(self._path, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._log_size += len(line)
+            self._count += 1
+            self._rank(score)
+            self._write_summary()
+
+    def get_count(self) -> int:
+        """ getter for _count
+        Args:
+            None
+        Returns:
+            the amount of recorded games
+        """
+        return self._count
+
+    def get_top(self, amount: int=10) -> List[Score]:
+        """ getter for the fastest recorded games, read from the summary
+        Args:
+            amount: the amount of games, at most the store's top
+        Returns:
+            the games, fastest first
+        """
+        with self._lock:
+            return self._top[:amount]
+
+    def get_top_by_name(self, name: str, amount: int=10) -> List[Score]:
+        """ getter for the fastest recorded games of a winner, reading the
+        whole log the first time a ranking is asked for
+        Args:
+            name: the name of the winner
+            amount: the amount of games, at most the store's top
+        Returns:
+            the games, fastest first
+        """
+        with self._lock:
+            return self._get_leaderboard().get_top_by_name(name, amount)
+
+    def get_top_by_puzzle(self, puzzle: str, amount: int=10) -> List[Score]:
+        """ getter for the fastest recorded games of a puzzle, reading the
+        whole log the first time a ranking is asked for
+        Args:
+            puzzle: the start board as an 81 character line
+            amount: the amount of games, at most the store's top
+        Returns:
+            the games, fastest first
+        """
+        with self._lock:
+            return self._get_leaderboard().get_top_by_puzzle(puzzle, amount)
+
+    def compact(self, wait: bool=False) -> None:
+        """ rewrites the log without its damaged lines on a background
+        thread, which reading the whole log does by itself when it finds any
+        Args:
+            wait: whether to wait for the rewrite to finish
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._compactor is None:
+                self._compactor = threading.Thread(target=self._compact, name="score-compactor",
+                                                   daemon=True)
+                self._compactor.start()
+            compactor = self._compactor
+        if wait:
+            compactor.join()
+
+    def _get_leaderboard(self) -> Leaderboard:
+        """ getter for _leaderboard, reading the whole log if it has not
+        been read yet
+        Args:
+            None
+        Returns:
+            every ranking
+        """
+        if self._leaderboard is None:
+            self._load_log()
+        return self._leaderboard
+
+    def _rank(self, score: Score) -> None:
+        """ adds a game to the fastest games and, once read, every ranking
+        Args:
+            score: the game to rank
+        Returns:
+            None
+        """
+        if self._leaderboard is not None:
+            self._leaderboard.add(score)
+            self._top = self._leaderboard.get_top()
+            return
+        # later games rank after earlier ones with the same time
+        position = len(self._top)
+        while position and self._top[position - 1].get_time() > score.get_time():
+            position -= 1
+        self._top.insert(position, score)
+        del self._top[self._top_size:]
+
+    def _index(self, scores: Iterable[Score]) -> None:
+        """ ranks every game of the log from scratch
+        Args:
+            scores: every game, in the order of the log
+        Returns:
+            None
+        """
+        self._leaderboard = Leaderboard(self._top_size)
+        self._count = 0
+        for score in scores:
+            self._leaderboard.add(score)
+            self._count += 1
+        self._top = self._leaderboard.get_top()
+
+    def _read_lines(self) -> Tuple[List[Score], bool, int]:
+        """ reads every game of the log
+        Args:
+            None
+        Returns:
+            the games, whether any complete line was damaged and the size
+            of the log up to its last complete line
+        """
+        with open(self._path, 'rb') as f:
+            data = f.read()
+        # the text after the last newline was never completely written
+        end = data.rfind(b'\n') + 1
+        damaged = False
+        scores = []
+        for line in data[:end].split(b'\n')[:-1]:
+            score = Score.decode(line)
+            if score is None:
+                damaged = True
+                continue
+            scores.append(score)
+        return scores, damaged, end
+
+    def _load_log(self) -> None:
+        """ reads the whole log, cutting off a line cut short, ranks every
+        game in it and starts dropping any damaged lines
+        Args:
+            None
+        Returns:
+            None
+        """
+        with self._lock:
+            scores, damaged, end = self._read_lines()
+            if end != os.path.getsize(self._path):
+                os.truncate(self._path, end)
+            self._log_size = end
+            self._index(scores)
+            self._write_summary()
+            if damaged:
+                self.compact()
+
+    def _read_summary(self) -> bool:
+        """ reads the amount of games and the fastest ones from the summary
+        Args:
+            None
+        Returns:
+            Whether or not the summary was read and matches the log
+        """
+        try:
+            with open(self._path + '.top', 'rb') as f:
+                header, *lines = f.read().split(b'\n')
+            count, log_size = (int(field) for field in header.split())
+        except (OSError, ValueError):
+            return False
+        if log_size != os.path.getsize(self._path) or lines[-1:] != [b'']:
+            return False
+        top = [Score.decode(line) for line in lines[:-1]]
+        if None in top:
+            return False
+        self._count = count
+        self._log_size = log_size
+        self._top = top[:self._top_size]
+        return True
+
+    def _write_summary(self) -> None:
+        """ writes the amount of games, the size of the log and the fastest
+        games next to the log
+        Args:
+            None
+        Returns:
+            None
+        """
+        temporary = self._path + '.top.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(b'%d %d\n' % (self._count, self._log_size))
+            f.write(b''.join(score.encode() for score in self._top))
+        os.replace(temporary, self._path + '.top')
+
+    def _compact(self) -> None:
+        """ copies every undamaged line of the log to a new log and swaps
+        it in, holding the lock throughout so no game recorded meanwhile
+        is lost
+        Args:
+            None
+        Returns:
+            None
+        """
+        try:
+            with self._lock:
+                temporary = self._path + '.tmp'
+                with open(temporary, 'wb') as f:
+                    self._copy_lines(f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temporary, self._path)
+                self._log_size = os.path.getsize(self._path)
+                self._write_summary()
+        finally:
+            with self._lock:
+                self._compactor = None
+
+    def _copy_lines(self, target: BinaryIO) -> None:
+        """ copies the undamaged lines of the log to another file, reading
+        a line at a time
+        Args:
+            target: the file to write the lines to
+        Returns:
+            None
+        """
+        with open(self._path, 'rb') as f:
+            for line in f:
+                # the text after the last newline was never completely written
+                if line.endswith(b'\n') and Score.decode(line) is not None:
+                    target.write(line)
+
+    def _rewrite(self, scores: List[Score]) -> None:
+        """ replaces the log with the given games, only once the new log is
+        complete
+        Args:
+            scores: the games to write
+        Returns:
+            None
+        """
+        temporary = self._path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(b''.join(score.encode() for score in scores))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self._path)
+        self._log_size = os.path.getsize(self._path)
@@ -0,0 +1,542 @@
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Union
+
+if TYPE_CHECKING:
+    from dlx import DancingLinksSolver
+
+
+ALL_DIGITS: int = 0b111111111
+BIT_COUNTS: List[int] = [bin(mask).count('1') for mask in range(ALL_DIGITS + 1)]
+ROWS: List[List[Tuple[int, int]]] = [[(row, column) for column in range(9)]
+                                     for row in range(9)]
+COLUMNS: List[List[Tuple[int, int]]] = [[(row, column) for row in range(9)]
+                                        for column in range(9)]
+BOXES: List[List[Tuple[int, int]]] = [[(row, column)
+                                       for row in range(box // 3 * 3, box // 3 * 3 + 3)
+                                       for column in range(box % 3 * 3, box % 3 * 3 + 3)]
+                                      for box in range(9)]
+UNITS: List[List[Tuple[int, int]]] = ROWS + COLUMNS + BOXES
+CELL_UNITS: List[Tuple[int, int, int]] = [(row, 9 + column, 18 + (row // 3) * 3 + column // 3)
+                                          for row in range(9) for column in range(9)]
+PEERS: List[List[Tuple[int, int]]] = [sorted({coordinate
+                                              for unit in CELL_UNITS[row * 9 + column]
+                                              for coordinate in UNITS[unit]} - {(row, column)})
+                                      for row in range(9) for column in range(9)]
+SOLVER_BACKENDS: Tuple[str, ...] = ('bitmask', 'dlx')
+
+
+def get_box(row: int, column: int) -> int:
+    """ finds the 3x3 box that a coordinate belongs to
+    Args:
+        row: the row of the coordinate
+        column: the column of the coordinate
+    Returns:
+        the index of the box, counted left to right and top to bottom
+    """
+    return (row // 3) * 3 + column // 3
+
+
+def get_bit(value: int) -> int:
+    """ translates a number into its bitmask representation
+    Args:
+        value: a number from 1 to 9
+    Returns:
+        a bitmask with only the bit of the number set
+    """
+    return 1 << (value - 1)
+
+
+def select_row_major(solver: "BitmaskSolver", index: int) -> int:
+    """ picks the next empty cell in reading order
+    Args:
+        solver: the solver that is searching
+        index: the position in the solver's empty cells to fill next
+    Returns:
+        the position of the chosen empty cell
+    """
+    return index
+
+
+def select_min_remaining(solver: "BitmaskSolver", index: int) -> int:
+    """ picks the empty cell with the fewest legal numbers left
+    Args:
+        solver: the solver that is searching
+        index: the position in the solver's empty cells to fill next
+    Returns:
+        the position of the chosen empty cell
+    """
+    empty = solver.get_empty()
+    best = index
+    best_count = 10
+    for i in range(index, len(empty)):
+        count = BIT_COUNTS[solver.get_candidates(empty[i])]
+        if count < best_count:
+            best = i
+            best_count = count
+            if count <= 1:
+                break
+    return best
+
+
+class BitmaskSolver:
+    """ Backtracking Sudoku solver that keeps track of used numbers with
+    bitmasks, so that checking if a number can be placed costs O(1)
+
+    Attrs:
+        _board(List[List[int]]): game board that is solved in place
+        _row_masks(List[int]): the numbers used in each row
+        _column_masks(List[int]): the numbers used in each column
+        _box_masks(List[int]): the numbers used in each 3x3 box
+        _empty(List[Tuple[int, int]]): coordinates that had no number
+                                       when the solver was created
+        _select_cell(Callable): strategy that picks which empty cell
+                                to fill next
+        _node_count(int): the amount of numbers tried during the search
+        _propagate(bool): whether logic is applied before searching
+        _conflicting(bool): whether the starting numbers already break
+                            Sudoku's rules
+        _eliminated(List[int]): numbers ruled out of each cell by logic,
+                                indexed by row * 9 + column
+        _propagated(List[Tuple[int, int]]): coordinates filled by logic
+        _removed(List[Tuple[int, int]]): coordinates filled by logic that
+                                         were taken out of _empty
+        _propagation_counts(Dict[str, int]): how often each logical
+                                             technique was applied
+
+    """
+
+    def __init__(self, board: List[List[int]],
+                 select_cell: Callable[["BitmaskSolver", int], int]=select_min_remaining,
+                 propagate: bool=True) -> None:
+        """ Creates a solver for a board
+
+        Args:
+            board: a sudoku game board, 0 marks an empty cell
+            select_cell: strategy that picks which empty cell to fill next,
+                         select_min_remaining or select_row_major
+            propagate: whether singles and locked candidates are filled in
+                       before any guessing
+
+        """
+        self._board = board
+        self._select_cell = select_cell
+        self._node_count: int = 0
+        self._propagate = propagate
+        self._eliminated: List[int] = [0] * 81
+        self._propagated: List[Tuple[int, int]] = []
+        self._removed: List[Tuple[int, int]] = []
+        self._propagation_counts: Dict[str, int] = {'naked_singles': 0,
+                                                    'hidden_singles': 0,
+                                                    'locked_candidates': 0}
+        self._row_masks: List[int] = [0] * 9
+        self._column_masks: List[int] = [0] * 9
+        self._box_masks: List[int] = [0] * 9
+        self._empty: List[Tuple[int, int]] = []
+        self._conflicting: bool = False
+        for row in range(9):
+            for column in range(9):
+                value = board[row][column]
+                if not value:
+                    self._empty.append((row, column))
+                    continue
+                bit = get_bit(value)
+                if (self._row_masks[row] | self._column_masks[column]
+                        | self._box_masks[get_box(row, column)]) & bit:
+                    self._conflicting = True
+                self._row_masks[row] |= bit
+                self._column_masks[column] |= bit
+                self._box_masks[get_box(row, column)] |= bit
+
+    def get_board(self) -> List[List[int]]:
+        """ getter for _board
+        Args:
+            None
+        Returns:
+            the game board being solved
+        """
+        return self._board
+
+    def get_empty(self) -> List[Tuple[int, int]]:
+        """ getter for _empty
+        Args:
+            None
+        Returns:
+            the coordinates that had no number, the ones before the
+            current search position are in the order they were filled
+        """
+        return self._empty
+
+    def has_conflicts(self) -> bool:
+        """ getter for _conflicting
+        Args:
+            None
+        Returns:
+            whether the starting numbers already break Sudoku's rules
+        """
+        return self._conflicting
+
+    def get_node_count(self) -> int:
+        """ getter for _node_count
+        Args:
+            None
+        Returns:
+            the amount of numbers tried during the search
+        """
+        return self._node_count
+
+    def get_propagation_counts(self) -> Dict[str, int]:
+        """ getter for _propagation_counts
+        Args:
+            None
+        Returns:
+            the amount of cells filled by naked and hidden singles, and the
+            amount of numbers ruled out by locked candidates
+        """
+        return self._propagation_counts
+
+    def get_candidates(self, coordinate: Tuple[int, int]) -> int:
+        """ finds the numbers that can legally be placed at a coordinate
+        Args:
+            coordinate: the (row, column) coordinate to check
+        Returns:
+            a bitmask of the numbers not used by the coordinate's
+            row, column or box and not ruled out by logic
+        """
+        row, column = coordinate
+        used = (self._row_masks[row] | self._column_masks[column]
+                | self._box_masks[get_box(row, column)]
+                | self._eliminated[row * 9 + column])
+        return ~used & ALL_DIGITS
+
+    def exclude(self, coordinate: Tuple[int, int], value: int) -> None:
+        """ rules a number out of an empty cell, without it breaking any rule
+        Args:
+            coordinate: the (row, column) coordinate of the empty cell
+            value: the number to rule out
+        Returns:
+            None
+        """
+        self._eliminated[coordinate[0] * 9 + coordinate[1]] |= get_bit(value)
+
+    def is_legal(self, coordinate: Tuple[int, int], value: int) -> bool:
+        """ checks if a number can be placed at a coordinate
+        Args:
+            coordinate: the (row, column) coordinate to check
+            value: the number to check
+        Returns:
+            Whether or not the number breaks Sudoku's rules there
+        """
+        return bool(self.get_candidates(coordinate) & get_bit(value))
+
+    def place(self, coordinate: Tuple[int, int], value: int) -> None:
+        """ places a number on the board and marks it as used
+        Args:
+            coordinate: the (row, column) coordinate of an empty cell
+            value: the number to place
+        Returns:
+            None
+        """
+        row, column = coordinate
+        bit = get_bit(value)
+        self._board[row][column] = value
+        self._row_masks[row] |= bit
+        self._column_masks[column] |= bit
+        self._box_masks[get_box(row, column)] |= bit
+
+    def undo(self, coordinate: Tuple[int, int]) -> None:
+        """ removes a number placed by place() and marks it as unused
+        Args:
+            coordinate: the (row, column) coordinate to clear
+        Returns:
+            None
+        """
+        row, column = coordinate
+        bit = ~get_bit(self._board[row][column])
+        self._board[row][column] = 0
+        self._row_masks[row] &= bit
+        self._column_masks[column] &= bit
+        self._box_masks[get_box(row, column)] &= bit
+
+    def solve(self) -> bool:
+        """ solves the board in place, leaving it untouched if not possible
+        Args:
+            None
+        Returns:
+            Whether or not the board is solvable
+        """
+        # boards whose starting numbers already clash have no solution, and
+        # searching them can take forever
+        if self._conflicting:
+            return False
+        if self._propagate and not self.propagate():
+            self._undo_propagation()
+            return False
+        if not self._search(0):
+            self._undo_propagation()
+            return False
+        return True
+
+    def count_solutions(self, limit: Union[int, None]=None) -> int:
+        """ counts the solutions of the board without changing it
+        Args:
+            limit: stop searching once this many solutions are found,
+                   None to count every solution
+        Returns:
+            the amount of solutions found
+        """
+        found = 0
+        if self._conflicting:
+            return found
+        if not self._propagate or self.propagate():
+            found = self._count(0, limit)
+        self._undo_propagation()
+        return found
+
+    def _count(self, index: int, limit: Union[int, None]) -> int:
+        """ recursively counts the ways to fill the empty cells from index
+        onwards
+        Args:
+            index: the position in _empty of the next cell to fill
+            limit: the amount of solutions to stop at, None for no limit
+        Returns:
+            the amount of solutions found
+        """
+        if index == len(self._empty):
+            return 1
+
+        chosen = self._select_cell(self, index)
+        empty = self._empty
+        empty[index], empty[chosen] = empty[chosen], empty[index]
+        coordinate = empty[index]
+        candidates = self.get_candidates(coordinate)
+        found = 0
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            self._node_count += 1
+            self.place(coordinate, bit.bit_length())
+            found += self._count(index + 1, None if limit is None else limit - found)
+            self.undo(coordinate)
+            if limit is not None and found >= limit:
+                break
+
+        return found
+
+    def propagate(self) -> bool:
+        """ fills in naked and hidden singles and rules out locked
+        candidates until none of them apply anymore
+        Args:
+            None
+        Returns:
+            Whether or not the board is still solvable
+        """
+        progress = True
+        while progress:
+            progress = False
+            for technique in (self._fill_naked_singles,
+                              self._fill_hidden_singles,
+                              self._eliminate_locked_candidates):
+                result = technique()
+                if result is None:
+                    return False
+                if result:
+                    progress = True
+                    break
+
+        empty = []
+        for coordinate in self._empty:
+            if self._board[coordinate[0]][coordinate[1]]:
+                self._removed.append(coordinate)
+            else:
+                empty.append(coordinate)
+        self._empty = empty
+        return True
+
+    def _fill_naked_singles(self) -> Union[int, None]:
+        """ fills every empty cell that has a single legal number left
+        Args:
+            None
+        Returns:
+            the amount of cells filled, or None if a cell has no legal
+            number left
+        """
+        filled = 0
+        for coordinate in self._empty:
+            if self._board[coordinate[0]][coordinate[1]]:
+                continue
+            candidates = self.get_candidates(coordinate)
+            if not candidates:
+                return None
+            if BIT_COUNTS[candidates] == 1:
+                self._propagated.append(coordinate)
+                self.place(coordinate, candidates.bit_length())
+                filled += 1
+
+        self._propagation_counts['naked_singles'] += filled
+        return filled
+
+    def _fill_hidden_singles(self) -> Union[int, None]:
+        """ fills every number that fits in a single cell of a row,
+        column or box
+        Args:
+            None
+        Returns:
+            the amount of cells filled, or None if a number fits nowhere
+            in a unit that still needs it
+        """
+        filled = 0
+        for unit in UNITS:
+            once = 0
+            more = 0
+            used = 0
+            for row, column in unit:
+                value = self._board[row][column]
+                if value:
+                    used |= get_bit(value)
+                    continue
+                candidates = self.get_candidates((row, column))
+                more |= once & candidates
+                once |= candidates
+            if (once | used) != ALL_DIGITS:
+                return None
+
+            singles = once & ~more
+            for row, column in unit:
+                if singles and not self._board[row][column]:
+                    bit = self.get_candidates((row, column)) & singles
+                    if bit:
+                        if bit & (bit - 1):
+                            return None
+                        singles ^= bit
+                        self._propagated.append((row, column))
+                        self.place((row, column), bit.bit_length())
+                        filled += 1
+
+        self._propagation_counts['hidden_singles'] += filled
+        return filled
+
+    def _eliminate_locked_candidates(self) -> int:
+        """ rules a number out of a row or column when it can only go in
+        one box there, and out of a box when it can only go in one of its
+        rows or columns
+        Args:
+            None
+        Returns:
+            the amount of numbers ruled out
+        """
+        eliminated = 0
+        for box in range(9):
+            for lines, get_line in ((ROWS, lambda c: c[0]),
+                                    (COLUMNS, lambda c: c[1])):
+                # pointing: a box's number is locked to one of its lines
+                masks = {}
+                for coordinate in BOXES[box]:
+                    if not self._board[coordinate[0]][coordinate[1]]:
+                        line = get_line(coordinate)
+                        masks[line] = masks.get(line, 0) | self.get_candidates(coordinate)
+                for line, mask in masks.items():
+                    others = 0
+                    for other_line, other_mask in masks.items():
+                        if other_line != line:
+                            others |= other_mask
+                    eliminated += self._eliminate(lines[line], mask & ~others,
+                                                  lambda c: get_box(*c) != box)
+
+        for lines, get_line in ((ROWS, lambda c: c[0]),
+                                (COLUMNS, lambda c: c[1])):
+            for line in range(9):
+                # claiming: a line's number is locked to one box
+                masks = {}
+                for coordinate in lines[line]:
+                    if not self._board[coordinate[0]][coordinate[1]]:
+                        box = get_box(*coordinate)
+                        masks[box] = masks.get(box, 0) | self.get_candidates(coordinate)
+                for box, mask in masks.items():
+                    others = 0
+                    for other_box, other_mask in masks.items():
+                        if other_box != box:
+                            others |= other_mask
+                    eliminated += self._eliminate(BOXES[box], mask & ~others,
+                                                  lambda c: get_line(c) != line)
+
+        self._propagation_counts['locked_candidates'] += eliminated
+        return eliminated
+
+    def _eliminate(self, unit: List[Tuple[int, int]], numbers: int,
+                   outside: Callable[[Tuple[int, int]], bool]) -> int:
+        """ rules numbers out of the empty cells of a unit that are
+        outside of the locked region
+        Args:
+            unit: the coordinates the numbers are ruled out of
+            numbers: a bitmask of the numbers to rule out
+            outside: whether a coordinate is outside of the locked region
+        Returns:
+            the amount of numbers ruled out
+        """
+        eliminated = 0
+        if not numbers:
+            return eliminated
+        for coordinate in unit:
+            if self._board[coordinate[0]][coordinate[1]] or not outside(coordinate):
+                continue
+            removed = self.get_candidates(coordinate) & numbers
+            if removed:
+                self._eliminated[coordinate[0] * 9 + coordinate[1]] |= removed
+                eliminated += BIT_COUNTS[removed]
+        return eliminated
+
+    def _undo_propagation(self) -> None:
+        """ clears every cell filled by logic, restoring the board
+        Args:
+            None
+        Returns:
+            None
+        """
+        for coordinate in reversed(self._propagated):
+            self.undo(coordinate)
+        # cells are only taken out of _empty once propagation succeeds
+        self._empty.extend(reversed(self._removed))
+        self._propagated = []
+        self._removed = []
+
+    def _search(self, index: int) -> bool:
+        """ recursively fills the empty cells from index onwards
+        Args:
+            index: the position in _empty of the next cell to fill
+        Returns:
+            Whether or not the remaining cells could be filled
+        """
+        if index == len(self._empty):
+            return True
+
+        chosen = self._select_cell(self, index)
+        empty = self._empty
+        empty[index], empty[chosen] = empty[chosen], empty[index]
+        coordinate = empty[index]
+        candidates = self.get_candidates(coordinate)
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            self._node_count += 1
+            self.place(coordinate, bit.bit_length())
+            if self._search(index + 1):
+                return True
+            self.undo(coordinate)
+
+        return False
+
+
+def create_solver(board: List[List[int]], backend: str='bitmask') -> Union[BitmaskSolver, "DancingLinksSolver"]:
+    """ creates a solver for a board with the chosen backend
+    Args:
+        board: a sudoku game board, 0 marks an empty cell
+        backend: one of SOLVER_BACKENDS, 'bitmask' for the backtracker and
+                 'dlx' for the dancing links exact cover solver
+    Returns:
+        a solver whose solve() fills the board in place
+    """
+    if backend == 'bitmask':
+        return BitmaskSolver(board)
+    if backend == 'dlx':
+        from dlx import DancingLinksSolver
+        return DancingLinksSolver(board)
+    raise ValueError(f"unknown solver backend: {backend}")
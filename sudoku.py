@@ -2,20 +2,29 @@ import arcade
 import settings
 import math
 import random
-import pickle
 from time import strftime, gmtime
-import copy
-from typing import List, Dict, Tuple, Union, Set
+from typing import Dict, Iterable, List, Set, Tuple, Union
+
+from bank import PuzzleBank
+from board import Board
+from cache import SolutionCache
+from commands import Keymap
+from generator import PuzzleQueue, generate_puzzle
+from render import GlyphAtlas, Layer, make_text_sprite
+from scores import Score, ScoreStore
+from solver import PEERS
 
 
 WIDTH = settings.WIDTH
 HEIGHT = settings.HEIGHT
 
-data: List["Winner"] = []
 user = None
 winner = None
 game = None
 game_view = None
+puzzle_queue: Union[PuzzleQueue, None] = None
+scores: Union[ScoreStore, None] = None
+keymap = Keymap()
 
 
 def translate_symbol(symbol: int) -> Union[str, None]:
@@ -71,47 +80,39 @@ def translate_symbol(symbol: int) -> Union[str, None]:
         return None
 
 
-def save_data() -> None:
-    global data
-    """ Saves data of all winners into sudoku_data.p
+def save_data(new_winner: "Winner", puzzle: str='') -> None:
+    """ Adds a winner to the end of sudoku_scores.log
     Args:
-        None
+        new_winner: the winner to save
+        puzzle: the board they completed as an 81 character line
     Returns:
         None
     """
-    with open("sudoku_data.p", "wb") as f:
-        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+    load_data().add(Score(new_winner.get_name(), new_winner.get_preferred_color(),
+                          new_winner.get_time(), puzzle))
 
 
-def load_data() -> None:
-    global data
-    """ Loads data of all winners into sudoku_data.p
+def load_data() -> ScoreStore:
+    global scores
+    """ Opens sudoku_scores.log the first time winners are needed,
+    reading only its summary, and moves the winners of an old
+    sudoku_data.p into it the first time it is created
     Args:
         None
     Returns:
-        None
+        the store of all winners
     """
+    if scores is None:
+        scores = ScoreStore.load("sudoku_scores.log", "sudoku_data.p")
+    return scores
 
-    with open("sudoku_data.p", "rb") as f:
-        data = pickle.load(f)
 
-
-class Sudoku:
-    """ Sudoku game class
+class Sudoku(Board):
+    """ Sudoku game class, drawing a Board and the buttons that act on it
 
     Attrs:
-        _ALL_START_BOARDS(List[List[List[int]]]): all sudoku game boards
-        _start_board(List[List[int]]): a randomized sudoku gameboard
-        _board(List[List[int]]): game board where the user can input numbers
-        _columns(int): the amount of columns in the board
-        _rows(int): the amount of rows in the board
-        _selected(Tuple[int, int]): most recently clicked board coordinate
-        _temp_board(Dict[Tuple, List]): game board with temporary values
         _x_gap(int): the gap between vertical grid lines
         _y_gap(int): the gap between horizontal grid lines
-        _pencil_mode(bool): the status of pencil tool's activation
-        _incorrect_coordinates(List[Tuple[int, int]]): list of coordinates
-                                                       with invalid numbers
         _validate_button("Sprite"): calls the validate function when pressed
         _validate_button.texture("texture"): the validate button's texture
         _solve_button("Sprite"): calls the solve function when pressed
@@ -120,46 +121,27 @@ class Sudoku:
         _reset_button.texture("texture"): the reset button's texture
         _pencil_button("Sprite"): toggles pencil mode on/off when pressed
         _pencil_button.texture("texture"): the pencil button's texture
+        _static(Union[Layer, None]): the grid, the given numbers and the
+                                     buttons, None until first drawn
+        _timer(Union[Layer, None]): the time above the board
+        _selection(Union[Layer, None]): the circle at the selected
+                                        coordinate
+        _invalid(Union[Layer, None]): the circles behind incorrect numbers
+        _timer_text(str): the time shown above the board
+        _number_sprites("SpriteList"): the inputted numbers
+        _cell_sprites(Dict[int, "Sprite"]): the inputted number sprite of
+                                            each cell, by row * 9 + column
+        _mark_sprites("SpriteList"): the pencil marks
+        _mark_cell_sprites(Dict[int, List["Sprite"]]): the pencil mark
+                                                       sprites of each
+                                                       cell, by
+                                                       row * 9 + column
+        _dirty_cells(Set[int]): cells whose number sprite needs rebuilding
+        _dirty_marks(Set[int]): cells whose pencil mark sprite needs
+                                rebuilding
 
     """
 
-    _ALL_START_BOARDS: List[List[List[int]]] = [
-        [
-            [7, 8, 0, 4, 0, 0, 1, 2, 0],
-            [6, 0, 0, 0, 7, 5, 0, 0, 9],
-            [0, 0, 0, 6, 0, 1, 0, 7, 8],
-            [0, 0, 7, 0, 4, 0, 2, 6, 0],
-            [0, 0, 1, 0, 5, 0, 9, 3, 0],
-            [9, 0, 4, 0, 6, 0, 0, 0, 5],
-            [0, 7, 0, 3, 0, 0, 0, 1, 2],
-            [1, 2, 0, 0, 0, 7, 4, 0, 0],
-            [0, 4, 9, 2, 0, 6, 0, 0, 7]
-        ],
-        [
-            [0, 4, 0, 8, 0, 5, 2, 0, 0],
-            [0, 2, 0, 0, 4, 0, 0, 5, 0],
-            [5, 0, 0, 0, 0, 0, 0, 0, 4],
-            [0, 9, 0, 0, 0, 3, 1, 2, 0],
-            [1, 0, 6, 0, 7, 8, 0, 0, 3],
-            [3, 7, 0, 9, 0, 4, 0, 8, 0],
-            [0, 0, 0, 0, 0, 6, 7, 0, 0],
-            [0, 0, 8, 3, 5, 9, 0, 1, 0],
-            [0, 1, 9, 0, 0, 7, 6, 0, 0]
-        ],
-
-        [
-            [0, 6, 0, 3, 0, 0, 8, 0, 4],
-            [5, 3, 7, 0, 9, 0, 0, 0, 0],
-            [0, 4, 0, 0, 0, 6, 3, 0, 7],
-            [0, 9, 0, 0, 5, 1, 2, 3, 8],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [7, 1, 3, 6, 2, 0, 0, 4, 0],
-            [3, 0, 6, 4, 0, 6, 0, 1, 0],
-            [0, 0, 0, 0, 6, 0, 5, 2, 3],
-            [1, 0, 2, 0, 0, 9, 0, 8, 0]
-        ]
-    ]
-
     def __init__(self, start_board: List[List[int]]) -> None:
         """ Creates a sudoku game
 
@@ -167,19 +149,9 @@ class Sudoku:
             start_board: a randomized sudoku game board
 
         """
-        self._start_board = start_board
-        self._columns: int = 9
-        self._rows: int = 9
-        self._board: List[List[int]] = copy.deepcopy(start_board)
-        self._selected: Tuple[int, int] = (math.ceil(self._columns / 2),
-                                           math.ceil(self._rows / 2))
-        self._temp_board: Dict[Tuple, List] = {(i, j): []
-                                               for i in range(self._columns)
-                                               for j in range(self._rows)}
+        super().__init__(start_board)
         self._x_gap: float = WIDTH / self._columns
         self._y_gap: float = HEIGHT / self._rows
-        self._pencil_mode: bool = False
-        self._incorrect_coordinates: List[Tuple[int, int]] = []
         self._validate_button: "Sprite" = arcade.Sprite(center_x=133.33,
                                                         center_y=50)
         self._validate_button.texture: "texture" = arcade.make_soft_circle_texture(65,
@@ -200,393 +172,306 @@ class Sudoku:
         self._pencil_button.texture: "texture" = arcade.make_soft_circle_texture(65,
                                                                                  arcade.color.LIGHT_SLATE_GRAY,
                                                                                  outer_alpha=255)
+        self._static: Union[Layer, None] = None
+        self._timer: Union[Layer, None] = None
+        self._selection: Union[Layer, None] = None
+        self._invalid: Union[Layer, None] = None
+        self._timer_text: str = ''
+        self._number_sprites: "SpriteList" = arcade.SpriteList()
+        self._cell_sprites: Dict[int, "Sprite"] = {}
+        self._mark_sprites: "SpriteList" = arcade.SpriteList()
+        self._mark_cell_sprites: Dict[int, List["Sprite"]] = {}
+        self._dirty_cells: Set[int] = set(range(81))
+        self._dirty_marks: Set[int] = set(range(81))
 
-    @classmethod
-    def get_all_start_boards(cls) -> List[List[List[int]]]:
-        """ getter for _ALL_START_BOARDS
-        Args:
-            None
-        Returns:
-            All sudoku game boards
-        """
-        return cls._ALL_START_BOARDS
-
-    def get_rows(self) -> int:
-        """ getter for _rows
+    def get_validate_button(self) -> "Sprite":
+        """ getter for _validate_button
         Args:
             None
         Returns:
-            the amount of rows in the board
+            a sprite that calls the validate function when pressed
         """
-        return self._rows
+        return self._validate_button
 
-    def get_columns(self) -> int:
-        """ getter for _columns
+    def get_solve_button(self) -> "Sprite":
+        """ getter for _solve_button
         Args:
             None
         Returns:
-            the amount of columns in the board
+            a sprite that calls the solve button when pressed
         """
-        return self._columns
+        return self._solve_button
 
-    def get_start_board(self) -> List[List[int]]:
-        """ getter for _start_board
+    def get_reset_button(self) -> "Sprite":
+        """ getter for _reset_button
         Args:
             None
         Returns:
-            a randomized sudoku gameboard
+            a sprite that calls the reset button when pressed
         """
-        return self._start_board
+        return self._reset_button
 
-    def get_selected(self) -> Tuple[int, int]:
-        """ getter for _selected
+    def get_pencil_button(self) -> "Sprite":
+        """ getter for the _pencil_button
         Args:
             None
         Returns:
-            The most recently clicked board coordinate
+            a sprite that toggles pencil mode on/off when pressed
         """
-        return self._selected
+        return self._pencil_button
 
-    def set_selected(self, cord: Tuple[int, int]) -> None:
-        """ setter for _selected
+    def set_pencil_button_texture(self, value: "Texture") -> None:
+        """ setter for _pencil_button_texture
         Args:
-            cord: the newly selected coordinate
+            value: an arcade texture the pencil button sprite will adopt
         Returns:
             None
         """
-        self._selected = cord
-
-    def set_board(self, board: List[List[int]]) -> None:
-        """ setter for _board
+        self._pencil_button.texture = value
 
+    def draw_board(self) -> None:
+        """ draws the game's layers from their batches, first rebuilding
+        the layers and cells marked dirty since the last draw, so a frame
+        where nothing changed only draws the batches again
         Args:
-            board: sudoku game board where the user can input numbers
+            None
         Returns:
             None
         """
-        self._board = board
-
-    def set_number(self, coordinate: Tuple[int, int], value: int) -> None:
-        """ setter for a coordinate in _board
+        if self._static is None:
+            GlyphAtlas.preload(((arcade.color.LIGHT_GRAY, 18), (arcade.color.GHOST_WHITE, 18),
+                                (arcade.color.BLACK, 18), (user.get_preferred_color(), 18),
+                                (arcade.color.RED, 10)))
+            self._static = Layer(self._build_static)
+            self._timer = Layer(self._build_timer)
+            self._selection = Layer(self._build_selection)
+            self._invalid = Layer(self._build_invalid)
+        if self._dirty_cells:
+            for index in self._dirty_cells:
+                self._update_number(*divmod(index, 9))
+            self._dirty_cells.clear()
+        if self._dirty_marks:
+            for index in self._dirty_marks:
+                self._update_marks(*divmod(index, 9))
+            self._dirty_marks.clear()
+        self._timer.draw()
+        self._selection.draw()
+        self._invalid.draw()
+        self._static.draw()
+        self._number_sprites.draw()
+        self._mark_sprites.draw()
+
+    def set_timer(self, text: str) -> None:
+        """ setter for _timer_text, marking the timer dirty only when the
+        text changes
         Args:
-            coordinate: the coordinate that will have its value changed
-            value: the value the coordinate will adopt
+            text: the time shown above the board
         Returns:
             None
         """
-        self._board[coordinate[0]][coordinate[1]] = value
-
-    def get_temp_board(self) -> Dict[Tuple, List]:
-        """ getter for _temp_board
+        if text != self._timer_text:
+            self._timer_text = text
+            if self._timer is not None:
+                self._timer.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """ marks every cell and layer that can change during a game as
+        needing to be rebuilt
         Args:
             None
-        Returns:
-            the board containing temporary vaules
-        """
-        return self._temp_board
-
-    def set_temp_board(self, temp_board: Dict[Tuple, List]) -> None:
-        """ setter for _temp_board
-        Args:
-            temp_board: a game board containing temporary values
         Returns:
             None
         """
-        self._temp_board = temp_board
+        self._dirty_cells.update(range(81))
+        self._dirty_marks.update(range(81))
+        if self._static is not None:
+            self._selection.mark_dirty()
+            self._invalid.mark_dirty()
 
-    def set_temp_number(self, target: int, coordinate: Tuple[int, int]) -> None:
-        """ setter for a coordinate in _temp_board given a number
+    def set_selected(self, cord: Tuple[int, int]) -> None:
+        """ setter for _selected, marking the selection and the numbers of
+        the old and new selected cells dirty
         Args:
-            target: the number that is to be added/removed
-            coordinate: the coordinate in _temp_board that is changed
+            cord: the newly selected coordinate
         Returns:
             None
         """
-        present = False
-        for i, num in enumerate(self._temp_board[coordinate]):
-            if num == target:
-                del self._temp_board[coordinate][i]
-                present = True
-        if not present:
-            self._temp_board[coordinate].append(target)
+        for x, y in (self._selected, cord):
+            self._dirty_cells.add((y - 1) * 9 + x - 1)
+        super().set_selected(cord)
+        if self._static is not None:
+            self._selection.mark_dirty()
 
-    def set_temp_list(self, coordinate: Tuple[int, int], numbers: List[int]) -> None:
-        """ setter for a coordinate in _temp_board given a list
+    def set_number(self, coordinate: Tuple[int, int], value: int) -> None:
+        """ setter for a coordinate in _board, marking the cell dirty
         Args:
-            coordinate: the coordinate in _temp_board that is to be changed
-            numbers: a sorted list of numbers that the coordinate adopts
+            coordinate: the coordinate that will have its value changed
+            value: the value the coordinate will adopt
         Returns:
             None
         """
-        self._temp_board[coordinate] = numbers
+        super().set_number(coordinate, value)
+        index = coordinate[0] * 9 + coordinate[1]
+        self._dirty_cells.add(index)
+        # placing or removing a number can change the pencil marks of peers
+        self._dirty_marks.add(index)
+        self._dirty_marks.update(row * 9 + column for row, column in PEERS[index])
+        if self._static is not None:
+            self._invalid.mark_dirty()
 
-    def get_pencil_mode(self) -> bool:
-        """ getter for _pencil_mode
-        Args:
-            None
-        Returns:
-            the status of pencil tool's activation
-        """
-        return self._pencil_mode
-
-    def set_pencil_mode(self, value: bool) -> None:
-        """ setter for _pencil_mode
+    def set_board(self, board: List[List[int]]) -> None:
+        """ setter for _board, marking everything dirty
         Args:
-            value: toggle for pencil mode's activation
+            board: a sudoku game board
         Returns:
             None
         """
-        self._pencil_mode = value
+        super().set_board(board)
+        self.mark_dirty()
 
-    def get_incorrect_coordinates(self) -> List[Tuple[int, int]]:
-        """ getter for _incorrect_coordinates
+    def reset_board(self) -> None:
+        """ resets the board to its original state, marking everything dirty
         Args:
             None
-        Returns:
-            a list of coordinates containing the invalid inputted numbers
-        """
-        return self._incorrect_coordinates
-
-    def set_incorrect_coordinates(self, value: List[Tuple[int, int]]) -> None:
-        """ setter for _incorrect_coordinates
-        Args:
-            value: a list of coordinates containing invalid inputted numbers
         Returns:
             None
         """
-        self._incorrect_coordinates = value
+        super().reset_board()
+        self.mark_dirty()
 
-    def get_validate_button(self) -> "Sprite":
-        """ getter for _validate_button
+    def solve(self, backend: str='bitmask') -> bool:
+        """ solves the Sudoku board in place, marking everything dirty
         Args:
-            None
+            backend: the solver to use, one of solver.SOLVER_BACKENDS
         Returns:
-            a sprite that calls the validate function when pressed
+            Whether or not the board is solvable
         """
-        return self._validate_button
+        solved = super().solve(backend)
+        self.mark_dirty()
+        return solved
 
-    def get_solve_button(self) -> "Sprite":
-        """ getter for _solve_button
+    def undo(self) -> List[Tuple[int, int]]:
+        """ takes back the last command, marking the changed cells dirty
         Args:
             None
         Returns:
-            a sprite that calls the solve button when pressed
+            the coordinates that changed, empty if there was nothing to undo
         """
-        return self._solve_button
+        changed = super().undo()
+        self._mark_cells_dirty(changed)
+        return changed
 
-    def get_reset_button(self) -> "Sprite":
-        """ getter for _reset_button
+    def redo(self) -> List[Tuple[int, int]]:
+        """ executes the last undone command again, marking the changed
+        cells dirty
         Args:
             None
         Returns:
-            a sprite that calls the reset button when pressed
+            the coordinates that changed, empty if there was nothing to redo
         """
-        return self._reset_button
+        changed = super().redo()
+        self._mark_cells_dirty(changed)
+        return changed
 
-    def get_pencil_button(self) -> "Sprite":
-        """ getter for the _pencil_button
+    def _mark_cells_dirty(self, coordinates: List[Tuple[int, int]]) -> None:
+        """ marks the numbers and pencil marks of cells dirty
         Args:
-            None
+            coordinates: the coordinates of the cells
         Returns:
-            a sprite that toggles pencil mode on/off when pressed
+            None
         """
-        return self._pencil_button
-
-    def set_pencil_button_texture(self, value: "Texture") -> None:
-        """ setter for _pencil_button_texture
+        if not coordinates:
+            return
+        indexes = [row * 9 + column for row, column in coordinates]
+        self._dirty_cells.update(indexes)
+        self._dirty_marks.update(indexes)
+        if self._static is not None:
+            self._invalid.mark_dirty()
+
+    def set_auto_notes(self, value: bool) -> None:
+        """ setter for _auto_notes, marking every pencil mark dirty
         Args:
-            value: an arcade texture the pencil button sprite will adopt
+            value: whether the pencil marks follow the candidates
         Returns:
             None
         """
-        self._pencil_button.texture = value
+        super().set_auto_notes(value)
+        self._dirty_marks.update(range(81))
 
-    def reset_board(self) -> None:
-        """ resets the board to its original state
+    def set_temp_board(self, temp_board: Dict[Tuple, List]) -> None:
+        """ setter for the pencil marks of every cell, marking them dirty
         Args:
-            None
+            temp_board: the pencil marks by coordinate
         Returns:
             None
         """
-        self._board = copy.deepcopy(self._start_board)
-        self._temp_board = {(i, j): [] for i in range(9) for j in range(9)}
-        self._incorrect_coordinates = []
+        super().set_temp_board(temp_board)
+        self._dirty_marks.update(range(81))
 
-    def find_empty(self) -> Union[Tuple[int, int], None]:
-        """ finds the closest empty cell in the board
+    def set_temp_number(self, target: int, coordinate: Tuple[int, int]) -> None:
+        """ toggles a pencil mark, marking the cell's marks dirty
         Args:
-            None
+            target: the number to toggle
+            coordinate: the coordinate of the cell
         Returns:
-            The coordinate of the closest empty cell
+            None
         """
-        for row in range(self._rows):
-            for column in range(self._columns):
-                if not self._board[row][column]:
-                    return (row, column)
-        return None
+        super().set_temp_number(target, coordinate)
+        self._dirty_marks.add(coordinate[0] * 9 + coordinate[1])
 
-    def solve(self) -> bool:
-        """ recursively solves the Sudoku board and indicates if not possible
+    def set_temp_list(self, coordinate: Tuple[int, int], numbers: List[int]) -> None:
+        """ setter for a cell's pencil marks, marking them dirty
         Args:
-            None
+            coordinate: the coordinate of the cell
+            numbers: the numbers marked in the cell
         Returns:
-            Whether or not the board is solvable
+            None
         """
-        if not self.find_empty() and not self.get_invalid_numbers():
-            return True
-        else:
-            coordinate = self.find_empty()
-            row = coordinate[0]
-            column = coordinate[1]
-
-        for i in range(1, 10):
-            self._board[row][column] = i
-            result = self.get_invalid_numbers()
-            if (row, column) in result:
-                self._board[row][column] = 0
-                continue
-
-            if self.solve():
-                return True
-
-            self._board[row][column] = 0
+        super().set_temp_list(coordinate, numbers)
+        self._dirty_marks.add(coordinate[0] * 9 + coordinate[1])
 
-        return False
-
-    def get_invalid_numbers(self) -> Union[List[None], Set[Tuple[int, int]]]:
-        """ cycles through each coordinate and ensures it abides Sudoku's rules
+    def set_incorrect_coordinates(self, value: Iterable[Tuple[int, int]]) -> None:
+        """ setter for _incorrect_coordinates, marking their layer dirty
         Args:
-            None
+            value: coordinates containing invalid inputted numbers
         Returns:
-            a set of coordinates that do not follow Sudoku's rules
+            None
         """
-        all_invalid_coordinates = []
-        for column in range(self._columns):
-            for row in range(self._rows):
-                target = self._board[row][column]
-                for y in range(self._rows):
-                    if target == self._board[y][column] and row != y and self._board[y][column] != 0:
-                        coordinate = (y, column)
-                        all_invalid_coordinates.append(coordinate)
-
-        for row in range(self._rows):
-            for column in range(self._columns):
-                target = self._board[row][column]
-                for x in range(self._columns):
-                    if target == self._board[row][x] and column != x and self._board[row][x] != 0:
-                        coordinate = (row, x)
-                        all_invalid_coordinates.append(coordinate)
+        super().set_incorrect_coordinates(value)
+        if self._static is not None:
+            self._invalid.mark_dirty()
 
-        for row in range(self._rows):
-            for column in range(self._columns):
-                if not self._board[row][column]:
-                    continue
-
-                coordinate = (row, column)
-                target = self._board[row][column]
-                block_x = column // 3
-                block_y = row // 3
-
-                if block_x == 0:
-                    start_x = 0
-                    multiplier_x = 0
-                elif block_x == 1:
-                    start_x = 3
-                    multiplier_x = 1
-                else:
-                    start_x = 6
-                    multiplier_x = 2
-
-                if block_y == 0:
-                    start_y = 0
-                    multiplier_y = 0
-                elif block_y == 1:
-                    start_y = 3
-                    multiplier_y = 1
-                else:
-                    start_y = 6
-                    multiplier_y = 2
-
-                block = self._board[start_y:start_y+3]
-                for y in range(len(block)):
-                    new_row = block[y][start_x:start_x+3]
-                    for x, number in enumerate(new_row):
-                        number_coordinate_y = y + 3 * multiplier_y
-                        number_coordinate_x = x + 3 * multiplier_x
-                        number_coordinate = (number_coordinate_y, number_coordinate_x)
-                        if number == target and number_coordinate != coordinate:
-                            all_invalid_coordinates.append(coordinate)
-
-        invalid_coordinates = []
-        for coordinate in all_invalid_coordinates:
-            y = coordinate[0]
-            x = coordinate[1]
-            if self._start_board[y][x] == 0:
-                invalid_coordinates.append(coordinate)
-
-        if not invalid_coordinates:
-            return []
-
-        return set(invalid_coordinates)
-
-    def sort_numbers(self, numbers: List[int]) -> List[int]:
-        """ takes a list of numbers and orderes them from least to greatest
+    def discard_incorrect_coordinate(self, coordinate: Tuple[int, int]) -> None:
+        """ stops showing a coordinate as incorrect, marking the layer of
+        incorrect numbers dirty if it was shown
         Args:
-            numbers: a list of integers
+            coordinate: the coordinate whose number changed
         Returns:
-            a sorted list of the numbers provided
+            None
         """
-        if len(numbers) <= 1:
-            return numbers
-
-        mid = len(numbers) // 2
-        l_side = self.sort_numbers(numbers[:mid])
-        r_side = self.sort_numbers(numbers[mid:])
-        sorted_list = []
-
-        l_pointer = 0
-        r_pointer = 0
-        while l_pointer < len(l_side) and r_pointer < len(r_side):
-            if l_side[l_pointer] < r_side[r_pointer]:
-                sorted_list.append(l_side[l_pointer])
-                l_pointer += 1
-            else:
-                sorted_list.append(r_side[r_pointer])
-                r_pointer += 1
+        if coordinate in self._incorrect_coordinates:
+            super().discard_incorrect_coordinate(coordinate)
+            if self._static is not None:
+                self._invalid.mark_dirty()
 
-        while l_pointer < len(l_side):
-            sorted_list.append(l_side[l_pointer])
-            l_pointer += 1
-
-        while r_pointer < len(r_side):
-            sorted_list.append(r_side[r_pointer])
-            r_pointer += 1
-
-        return sorted_list
-
-    def draw_temp_numbers(self) -> None:
-        """ draws all the temporary numbers
+    def _cell_position(self, row: int, column: int) -> Tuple[float, float]:
+        """ finds where a cell's contents are drawn
         Args:
-            None
+            row: the row of the cell
+            column: the column of the cell
         Returns:
-            None
+            the x coordinate of the cell's center and the y coordinate its
+            contents are drawn from
         """
-        for y in range(self._rows):
-            for x in range(self._columns):
-                coordinate = (y, x)
-                text = ' ' + ''.join(str(num)
-                                     for num in self._temp_board[coordinate])
-                translated_x = self._x_gap * (3/2) + ((self._x_gap) * (x - 1))
-                translated_y = HEIGHT / (HEIGHT / 575) - ((HEIGHT / 12) * y)
-                arcade.draw_text(text, translated_x, translated_y - 70,
-                                 arcade.color.RED, font_size=10,
-                                 font_name='arial', anchor_x="center")
+        return (self._x_gap * (3/2) + ((self._x_gap) * (column - 1)),
+                HEIGHT / (HEIGHT / 575) - ((HEIGHT / 12) * row))
 
-    @staticmethod
-    def draw_grid() -> None:
-        """ draws the Sudoku game grid
+    def _build_static(self, shapes: "ShapeElementList", sprites: "SpriteList") -> None:
+        """ builds the layer that never changes during a game: the grid,
+        the given numbers and the buttons with their labels
         Args:
-            None
+            shapes: the layer's shapes
+            sprites: the layer's sprites
         Returns:
             None
         """
@@ -604,9 +489,9 @@ class Sudoku:
                 thickness *= 3
                 color = user.get_preferred_color()
 
-            arcade.draw_rectangle_filled(x_pos, HEIGHT / 1.865,
-                                         thickness, HEIGHT / (4/3),
-                                         color)
+            shapes.append(arcade.create_rectangle_filled(x_pos, HEIGHT / 1.865,
+                                                         thickness, HEIGHT / (4/3),
+                                                         color))
 
         # VERTICAL LINES
         for i in range(1, 9):
@@ -619,52 +504,46 @@ class Sudoku:
                 thickness *= 3
                 color = user.get_preferred_color()
 
-            arcade.draw_rectangle_filled(WIDTH / 2, y_pos, thickness,
-                                         WIDTH, color, tilt_angle=90)
+            shapes.append(arcade.create_rectangle_filled(WIDTH / 2, y_pos, thickness,
+                                                         WIDTH, color, tilt_angle=90))
 
-    def draw_numbers(self) -> None:
-        """ draws all inputted numbers
+        for row in range(self._rows):
+            for column in range(self._columns):
+                number = self._start_board.get_number(row, column)
+                if number:
+                    translated_x, translated_y = self._cell_position(row, column)
+                    # arcade takes the ellipse's radii, like draw_circle_filled
+                    shapes.append(arcade.create_ellipse_filled(translated_x,
+                                                               translated_y - 51, 17, 17,
+                                                               arcade.color.PAYNE_GREY))
+                    sprites.append(GlyphAtlas.make_sprite(number, translated_x,
+                                                          translated_y - 60,
+                                                          arcade.color.LIGHT_GRAY, 18))
+
+        for button in (self._validate_button, self._solve_button,
+                       self._reset_button, self._pencil_button):
+            sprites.append(button)
+        for label, x, y, font_size in (('V', 133.33, 30, 40), ('P', 400, 30, 40),
+                                       ('S', 666.66, 30, 40), ('R', 750, 565, 20)):
+            sprites.append(make_text_sprite(label, x, y, user.get_preferred_color(),
+                                            font_size))
+
+    def _build_timer(self, shapes: "ShapeElementList", sprites: "SpriteList") -> None:
+        """ builds the layer showing the time above the board
         Args:
-            None
+            shapes: the layer's shapes
+            sprites: the layer's sprites
         Returns:
             None
         """
-        for row in range(self._rows):
-            for column in range(self._columns):
-                if self._start_board[row][column]:
-                    x = column
-                    y = row
-                    translated_x = self._x_gap * (3/2) + ((self._x_gap) * (x - 1))
-                    translated_y = HEIGHT / (HEIGHT / 575) - ((HEIGHT / 12) * y)
-                    arcade.draw_circle_filled(translated_x, translated_y - 51,
-                                              17, arcade.color.PAYNE_GREY)
-                    arcade.draw_text(str(self._start_board[row][column]),
-                                     translated_x, translated_y - 60,
-                                     arcade.color.LIGHT_GRAY, font_size=18,
-                                     font_name='arial', anchor_x="center")
-                elif self._board[row][column]:
-                    x = column
-                    y = row
-                    translated_x = self._x_gap * (3/2) + ((self._x_gap) * (x - 1))
-                    translated_y = HEIGHT / (HEIGHT / 575) - ((HEIGHT / 12) * y)
-
-                    if self._selected == (column + 1, row + 1):
-                        arcade.draw_text(str(self._board[row][column]),
-                                         translated_x, translated_y - 60,
-                                         arcade.color.BLACK, font_size=18,
-                                         font_name='arial', anchor_x="center")
-                    else:
-                        arcade.draw_text(str(self._board[row][column]),
-                                         translated_x,
-                                         translated_y - 60,
-                                         user.get_preferred_color(),
-                                         font_size=18, font_name='arial',
-                                         anchor_x="center")
-
-    def draw_selected(self) -> None:
-        """ draws the circle at the selected coordinate
+        sprites.append(make_text_sprite(self._timer_text, WIDTH / 2, 565,
+                                        arcade.color.LIGHT_GRAY, 18))
+
+    def _build_selection(self, shapes: "ShapeElementList", sprites: "SpriteList") -> None:
+        """ builds the layer with the circle at the selected coordinate
         Args:
-            None
+            shapes: the layer's shapes
+            sprites: the layer's sprites
         Returns:
             None
         """
@@ -672,30 +551,72 @@ class Sudoku:
         y = self._selected[1]
         translated_x = self._x_gap / 2 + ((self._x_gap) * (x - 1))
         translated_y = HEIGHT / (HEIGHT / 575) - ((HEIGHT / 12) * y)
-        arcade.draw_circle_filled(translated_x, translated_y - 1, 17,
-                                  user.get_preferred_color())
+        shapes.append(arcade.create_ellipse_filled(translated_x, translated_y - 1, 17, 17,
+                                                   user.get_preferred_color()))
 
-    def draw_invalid_cord(self, coordinate: Tuple[int, int]) -> None:
-        """ draws a red circle if the coordinate has an incorrect number
+    def _build_invalid(self, shapes: "ShapeElementList", sprites: "SpriteList") -> None:
+        """ builds the layer with a red circle behind every incorrect number
         Args:
-            coordinate: the coordinate at which the indicator
-                        will be drawn
+            shapes: the layer's shapes
+            sprites: the layer's sprites
         Returns:
             None
         """
-
-        x = coordinate[1]
-        y = coordinate[0]
-        if self._board[y][x] == 0:
-            return None
-        translated_x = self._x_gap / 2 + ((self._x_gap) * (x - 1))
-        translated_y = HEIGHT / (HEIGHT / 575) - ((HEIGHT / 12) * y)
-        arcade.draw_circle_filled(translated_x + 88.88, translated_y - 51, 17,
-                                  arcade.color.CADMIUM_RED)
-        arcade.draw_text(str(self._board[y][x]), translated_x + 88.88,
-                         translated_y - 60,
-                         arcade.color.GHOST_WHITE, font_size=18,
-                         font_name='arial', anchor_x="center")
+        for y, x in self._incorrect_coordinates:
+            if self._board.get_number(y, x) == 0:
+                continue
+            translated_x = self._x_gap / 2 + ((self._x_gap) * (x - 1))
+            translated_y = HEIGHT / (HEIGHT / 575) - ((HEIGHT / 12) * y)
+            shapes.append(arcade.create_ellipse_filled(translated_x + 88.88, translated_y - 51,
+                                                       17, 17, arcade.color.CADMIUM_RED))
+            sprites.append(GlyphAtlas.make_sprite(self._board.get_number(y, x),
+                                                  translated_x + 88.88, translated_y - 60,
+                                                  arcade.color.GHOST_WHITE, 18))
+
+    def _update_number(self, row: int, column: int) -> None:
+        """ rebuilds the sprite of a cell's inputted number
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+        Returns:
+            None
+        """
+        index = row * 9 + column
+        sprite = self._cell_sprites.pop(index, None)
+        if sprite is not None:
+            self._number_sprites.remove(sprite)
+        number = self._board.get_number(row, column)
+        if not number or self._start_board.get_number(row, column):
+            return
+        if self._selected == (column + 1, row + 1):
+            color = arcade.color.BLACK
+        else:
+            color = user.get_preferred_color()
+        translated_x, translated_y = self._cell_position(row, column)
+        sprite = GlyphAtlas.make_sprite(number, translated_x, translated_y - 60, color, 18)
+        self._cell_sprites[index] = sprite
+        self._number_sprites.append(sprite)
+
+    def _update_marks(self, row: int, column: int) -> None:
+        """ rebuilds the sprites of a cell's pencil marks
+        Args:
+            row: the row of the cell
+            column: the column of the cell
+        Returns:
+            None
+        """
+        index = row * 9 + column
+        for sprite in self._mark_cell_sprites.pop(index, ()):
+            self._mark_sprites.remove(sprite)
+        numbers = self._board.get_mark_digits(row, column)
+        if not numbers:
+            return
+        translated_x, translated_y = self._cell_position(row, column)
+        sprites = GlyphAtlas.make_row(numbers, translated_x, translated_y - 70,
+                                      arcade.color.RED, 10)
+        self._mark_cell_sprites[index] = sprites
+        for sprite in sprites:
+            self._mark_sprites.append(sprite)
 
 
 class User:
@@ -800,13 +721,14 @@ class Winner(User):
     """ Winner class
 
     Attributes:
-        _all_winners(List["Winner"]): contains instances of Sudoku winners
+        _all_winners(List["Winner"]): the quickest Sudoku winners, fastest
+                                      first
         _name(str): the name of the winner
         _preferred_color("color"): the winner's preferred color
         _time(float): the time it took for the winner to complete the board
 
     """
-    _all_winners = data
+    _all_winners: List["Winner"] = []
 
     def __init__(self, name: str, preferred_color: "color", time: float) -> None:
         """ Creates a winner
@@ -851,24 +773,17 @@ class Winner(User):
         return cls('Anonymous', color, time)
 
     @classmethod
-    def sort_all_winner_times(cls) -> None:
-        """ orders winners by the time it took them to complete the board
+    def load_top_winners(cls, amount: int=10) -> None:
+        """ takes the quickest winners from the leaderboard, which keeps
+        them in order as games are won
 
         Args:
-            None
+            amount: the amount of winners
         Returns:
             None
         """
-        sorted = False
-        times_through = 0
-
-        while not sorted:
-            sorted = True
-            for i in range(len(cls._all_winners) - 1 - times_through):
-                if cls._all_winners[i]._time > cls._all_winners[i + 1]._time:
-                    cls._all_winners[i], cls._all_winners[i + 1] = cls._all_winners[i + 1], cls._all_winners[i]
-                    sorted = False
-            times_through += 1
+        cls._all_winners = [cls(score.get_name(), score.get_color(), score.get_time())
+                            for score in load_data().get_top(amount)]
 
     @classmethod
     def draw_info(cls) -> None:
@@ -964,8 +879,13 @@ class MenuView(arcade.View):
         global game_view, game
         if self.play_button.collides_with_point([x, y]):
             game_view = MaxGameView()
-            board_index = random.randrange(len(Sudoku.get_all_start_boards()))
-            game = Sudoku(Sudoku.get_all_start_boards()[board_index])
+            start_board = Sudoku.pick_start_board()
+            if start_board is not None:
+                game = Sudoku(start_board)
+            elif puzzle_queue is not None:
+                game = Sudoku(puzzle_queue.pop().get_board())
+            else:
+                game = Sudoku(generate_puzzle())
             self.window.show_view(game_view)
         if self.instruction_button.collides_with_point([x, y]):
             instruction_view = InstructionView()
@@ -1005,6 +925,7 @@ class MaxGameView(arcade.View):
     def __init__(self):
         super().__init__()
         self.seconds_elapsed = 0
+        self.hint = ''
 
     def on_show(self):
         arcade.set_background_color(arcade.color.EERIE_BLACK)
@@ -1012,243 +933,45 @@ class MaxGameView(arcade.View):
     def on_draw(self):
         self.timer = strftime("%H:%M:%S", gmtime(self.seconds_elapsed))
         arcade.start_render()
-        arcade.draw_text(self.timer, WIDTH / 2, 565,
-                         arcade.color.LIGHT_GRAY, font_size=18,
-                         font_name='arial', anchor_x="center")
-
-        game.draw_selected()
+        game.set_timer(f"{self.timer}   {self.hint}" if self.hint else self.timer)
         if not user.get_name():
             user.draw_unpersonalized_name(WIDTH / 2,
                                           550, True)
         else:
             user.draw_info(WIDTH / 2, 550, True)
-        if game.get_incorrect_coordinates():
-            for coordinate in game.get_incorrect_coordinates():
-                game.draw_invalid_cord(coordinate)
-        game.draw_grid()
-        game.draw_numbers()
-        game.draw_temp_numbers()
-
-        game.get_validate_button().draw()
-        game.get_solve_button().draw()
-        game.get_reset_button().draw()
-        game.get_pencil_button().draw()
-
-        arcade.draw_text('V', 133.33, 30,
-                         user.get_preferred_color(), font_size=40,
-                         font_name='arial', anchor_x="center")
-        arcade.draw_text('P', 400, 30,
-                         user.get_preferred_color(), font_size=40,
-                         font_name='arial', anchor_x="center")
-        arcade.draw_text('S', 666.66, 30,
-                         user.get_preferred_color(), font_size=40,
-                         font_name='arial', anchor_x="center")
-        arcade.draw_text('R', 750, 565,
-                         user.get_preferred_color(), font_size=20,
-                         font_name='arial', anchor_x="center")
+        game.draw_board()
 
     def on_key_press(self, symbol, modifiers):
-        x = game.get_selected()[0] - 1
-        y = game.get_selected()[1] - 1
-        coordinate = (y, x)
-
-        if not game.get_pencil_mode():
-            if game.get_temp_board()[(y, x)]:
-                numbers = []
-                game.set_temp_list((y, x), numbers)
-            if game.get_start_board()[y][x]:
-                pass
-            elif symbol == 49:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 1)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 1)
-            elif symbol == 50:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 2)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 2)
-            elif symbol == 51:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 3)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 3)
-            elif symbol == 52:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 4)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 4)
-            elif symbol == 53:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 5)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 5)
-            elif symbol == 54:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 6)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 6)
-            elif symbol == 55:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 7)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 7)
-            elif symbol == 56:
-
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 8)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 8)
-            elif symbol == 57:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 9)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 9)
-            elif symbol == 65288 or symbol == 48:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                else:
-                    game.set_number(coordinate, 0)
-            else:
-                pass
-
-        if game.get_pencil_mode():
-            if game.get_start_board()[y][x]:
-                pass
-            elif symbol == 49:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(1, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(1, coordinate)
-            elif symbol == 50:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(2, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(2, coordinate)
-            elif symbol == 51:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(3, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(3, coordinate)
-            elif symbol == 52:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(4, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(4, coordinate)
-            elif symbol == 53:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(5, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(5, coordinate)
-            elif symbol == 54:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(6, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(6, coordinate)
-            elif symbol == 55:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(7, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(7, coordinate)
-            elif symbol == 56:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(8, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(8, coordinate)
-            elif symbol == 57:
-                if coordinate in game.get_incorrect_coordinates():
-                    game.set_number(coordinate, 0)
-                    new_board = game.get_incorrect_coordinates()
-                    new_board.remove(coordinate)
-                    game.set_incorrect_coordinates(new_board)
-                    game.set_temp_number(9, coordinate)
-                else:
-                    game.set_number(coordinate, 0)
-                    game.set_temp_number(9, coordinate)
-            else:
-                pass
-            for y in range(game.get_rows()):
-                for x in range(game.get_columns()):
-                    coordinate = (y, x)
-                    numbers = game.get_temp_board()[coordinate]
-                    ordered_numbers = game.sort_numbers(numbers)
-                    game.set_temp_list(coordinate, ordered_numbers)
-
-        if symbol == 65307:
+        binding = keymap.get_binding(symbol)
+        if binding is None:
+            return
+        if binding[0] == 'pause':
             pause_screen = PauseScreen(self)
             self.window.show_view(pause_screen)
-        else:
-            pass
+            return
+        if binding[0] == 'auto_notes':
+            game.set_auto_notes(not game.get_auto_notes())
+            return
+        if binding[0] == 'hint':
+            hint = game.get_hint()
+            if hint is None:
+                self.hint = "No hint"
+            else:
+                row, column = hint.get_coordinate()
+                game.set_selected((column + 1, row + 1))
+                self.hint = f"Hint: {hint.get_number()} ({hint.get_technique().replace('_', ' ')})"
+            return
+        self.hint = ''
+        if binding[0] == 'undo':
+            game.undo()
+            return
+        if binding[0] == 'redo':
+            game.redo()
+            return
+
+        command = keymap.make_command(symbol, game)
+        if command is not None:
+            game.execute(command)
 
     def on_update(self, delta_time):
         self.seconds_elapsed += delta_time
@@ -1273,17 +996,16 @@ class MaxGameView(arcade.View):
                                     user.get_preferred_color(),
                                     round(self.seconds_elapsed, 1))
 
-                data.append(winner)
-                save_data()
+                save_data(winner, ''.join(str(number) for row in game.get_start_board()
+                                          for number in row))
                 win_view = WinView(self.seconds_elapsed)
                 self.window.show_view(win_view)
 
         if game.get_solve_button().collides_with_point([x, y]):
-            game.set_board(copy.deepcopy(game.get_start_board()))
+            game.set_board(game.get_start_board())
             game.set_incorrect_coordinates([])
             game.solve()
-            temp_board = {(i, j): [] for i in range(9) for j in range(9)}
-            game.set_temp_board(temp_board)
+            game.set_temp_board({})
 
         if game.get_reset_button().collides_with_point([x, y]):
             game.reset_board()
@@ -1416,8 +1138,7 @@ class LeaderboardView(arcade.View):
 
     def on_show(self):
         arcade.set_background_color(arcade.color.EERIE_BLACK)
-        Winner._all_winners = data
-        Winner.sort_all_winner_times()
+        Winner.load_top_winners()
 
     def on_draw(self):
         arcade.start_render()
@@ -1492,9 +1213,16 @@ if __name__ == "__main__":
     what you are doing.
     """
     from utils import FakeDirector
-    load_data()
+    solution_cache = SolutionCache.load("sudoku_cache.p")
+    Board.set_solution_cache(solution_cache)
+    Board.set_puzzle_bank(PuzzleBank.load("puzzles.bank"))
+    puzzle_queue = PuzzleQueue()
+    puzzle_queue.start()
     window = arcade.Window(WIDTH, HEIGHT)
     introduction_view = IntroductionView()
     menu_view = MenuView()
     window.show_view(introduction_view)
-    arcade.run()
+    try:
+        arcade.run()
+    finally:
+        solution_cache.save()
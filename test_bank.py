@@ -0,0 +1,35 @@
+import random
+
+from bank import RECORD_SIZE, PuzzleBank, pack_board, unpack_board, write_bank
+from board import Board
+
+
+BOARDS = Board.get_all_start_boards()
+
+
+def test_pack_round_trip():
+    record = pack_board(BOARDS[0], 'hard')
+    assert len(record) == RECORD_SIZE
+    assert unpack_board(record) == BOARDS[0]
+
+
+def test_write_and_pick(tmp_path):
+    path = str(tmp_path / 'puzzles.bank')
+    counts = write_bank(path, [(BOARDS[0], 'easy'), (BOARDS[1], 'hard'),
+                               (BOARDS[0], 'easy'), (BOARDS[1], 'unknown')])
+    assert counts == {'easy': 2, 'medium': 0, 'hard': 1, 'expert': 0, 'extreme': 0}
+    bank = PuzzleBank.load(path)
+    try:
+        assert bank.get_count('easy') == 2
+        assert bank.get_board('hard', 0) == BOARDS[1]
+        assert bank.pick('easy', random.Random(0)) == BOARDS[0]
+        assert bank.pick('medium') is None
+    finally:
+        bank.close()
+    assert not (tmp_path / 'puzzles.bank.tmp').exists()
+
+
+def test_missing_or_damaged_bank_is_empty(tmp_path):
+    assert PuzzleBank.load(str(tmp_path / 'missing.bank')).get_count('easy') == 0
+    (tmp_path / 'damaged.bank').write_bytes(b'SDKB' + b'\xff' * 40)
+    assert PuzzleBank.load(str(tmp_path / 'damaged.bank')).get_count('easy') == 0
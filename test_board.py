@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from board import Board
+from commands import SetNumber, ToggleMark, replay
+
+
+def make_board() -> Board:
+    return Board(Board.get_all_start_boards()[0])
+
+
+def test_undo_after_solve_does_nothing():
+    board = make_board()
+    board.execute(SetNumber((0, 2), 5))
+    board.execute(SetNumber((0, 2), 0))
+    assert board.solve()
+    solved = bytes(board.get_grid().get_cells())
+
+    assert not board.can_undo()
+    assert board.undo() == []
+    assert bytes(board.get_grid().get_cells()) == solved
+    assert board.get_invalid_numbers() == []
+    assert board.get_commands() == []
+
+
+def test_candidates_stay_right_after_solve_and_undo():
+    board = make_board()
+    board.execute(SetNumber((0, 2), 5))
+    board.execute(SetNumber((0, 2), 0))
+    board.solve()
+    board.undo()
+    fresh = Board(board.get_grid().to_rows())
+    for row in range(9):
+        for column in range(9):
+            assert board.get_candidates((row, column)) == fresh.get_candidates((row, column))
+
+
+def get_state(board: Board):
+    grid = board.get_grid()
+    return (bytes(grid.get_cells()),
+            [grid.get_marks(row, column) for row in range(9) for column in range(9)],
+            board.get_invalid_numbers(),
+            [board.get_candidates((row, column)) for row in range(9) for column in range(9)])
+
+
+@pytest.mark.parametrize('auto_notes', [False, True])
+def test_undo_and_redo_restore_every_state(auto_notes):
+    rng = random.Random(4)
+    board = make_board()
+    board.set_auto_notes(auto_notes)
+    states = [get_state(board)]
+    for _ in range(300):
+        coordinate = (rng.randrange(9), rng.randrange(9))
+        if rng.random() < 0.4:
+            command = ToggleMark(coordinate, rng.randrange(1, 10))
+        else:
+            command = SetNumber(coordinate, rng.randrange(10))
+        count = len(board.get_commands())
+        board.execute(command)
+        if len(board.get_commands()) > count:
+            states.append(get_state(board))
+
+    redone = []
+    while board.can_undo():
+        redone.append(states.pop())
+        assert board.undo()
+        assert get_state(board) == states[-1]
+    assert board.undo() == []
+    assert len(states) == 1
+
+    while board.can_redo():
+        assert board.redo()
+        assert get_state(board) == redone.pop()
+    assert not redone
+
+
+def test_replaying_commands_gives_the_same_board():
+    rng = random.Random(5)
+    board = make_board()
+    for _ in range(100):
+        board.execute(SetNumber((rng.randrange(9), rng.randrange(9)), rng.randrange(10)))
+    board.undo()
+    replayed = make_board()
+    replay(replayed, board.get_commands())
+    assert get_state(replayed) == get_state(board)
+
+
+def test_hints_follow_the_solution():
+    board = make_board()
+    solution = board.get_solution()
+    while board.find_empty():
+        hint = board.get_hint()
+        assert hint is not None
+        row, column = hint.get_coordinate()
+        assert solution.get_number(row, column) == hint.get_number()
+        board.execute(SetNumber(hint.get_coordinate(), hint.get_number()))
+    assert board.get_hint() is None
+
+
+def test_no_hint_for_a_board_breaking_the_rules():
+    board = make_board()
+    board.set_number((0, 2), 7)
+    assert board.get_hint() is None
@@ -0,0 +1,114 @@
+import pickle
+import random
+
+from board import Board
+from cache import SYMMETRIES, SolutionCache, canonicalize
+import cache as cache_module
+from solver import create_solver
+
+
+def flatten(board):
+    return bytes(number for row in board for number in row)
+
+
+def solve(cells):
+    board = [list(cells[row:row + 9]) for row in range(0, 81, 9)]
+    assert create_solver(board).solve()
+    return flatten(board)
+
+
+def disguise(cells, rng):
+    # rearranges the cells by a random symmetry and renames the numbers
+    names = [0] + rng.sample(range(1, 10), 9)
+    return bytes(names[number] for number in SYMMETRIES[rng.randrange(len(SYMMETRIES))](cells))
+
+
+PUZZLE = flatten(Board.get_all_start_boards()[0])
+
+
+def test_canonical_form_is_shared_by_disguised_puzzles():
+    rng = random.Random(1)
+    canonical = canonicalize(PUZZLE)[0]
+    for _ in range(20):
+        assert canonicalize(disguise(PUZZLE, rng))[0] == canonical
+
+
+def test_canonicalize_round_trip():
+    canonical, symmetry, table = canonicalize(PUZZLE)
+    assert bytes(SYMMETRIES[symmetry](PUZZLE)).translate(table) == canonical
+    names = bytearray(range(256))
+    for number in range(1, 10):
+        names[table[number]] = number
+    restored = bytearray(81)
+    for new, old in enumerate(SYMMETRIES[symmetry](range(81))):
+        restored[old] = names[canonical[new]]
+    assert bytes(restored) == PUZZLE
+
+
+def test_canonical_form_is_the_smallest_of_every_rearrangement():
+    rng = random.Random(3)
+    for puzzle in [PUZZLE] + [disguise(PUZZLE, rng) for _ in range(5)]:
+        smallest = None
+        for symmetry in SYMMETRIES:
+            arranged = bytes(symmetry(puzzle))
+            names = {}
+            for number in arranged:
+                if number:
+                    names.setdefault(number, len(names) + 1)
+            renamed = bytes(names.get(number, 0) for number in arranged)
+            if smallest is None or renamed < smallest:
+                smallest = renamed
+        assert canonicalize(puzzle)[0] == smallest
+
+
+def test_get_answers_disguised_puzzles():
+    rng = random.Random(2)
+    cache = SolutionCache()
+    cache.put(PUZZLE, solve(PUZZLE))
+    for _ in range(20):
+        puzzle = disguise(PUZZLE, rng)
+        assert cache.get(puzzle) == solve(puzzle)
+    assert cache.get_stats() == {'hits': 20, 'misses': 0, 'size': 1}
+
+
+def test_least_recently_used_is_dropped():
+    cache = SolutionCache(max_size=1)
+    other = flatten(Board.get_all_start_boards()[1])
+    cache.put(PUZZLE, solve(PUZZLE))
+    cache.put(other, solve(other))
+    assert cache.get(PUZZLE) is None
+    assert cache.get(other) == solve(other)
+
+
+def test_saves_in_batches(tmp_path):
+    path = str(tmp_path / 'cache.p')
+    cache = SolutionCache.load(path, save_every=2)
+    boards = [flatten(board) for board in Board.get_all_start_boards()]
+    cache.put(boards[0], solve(boards[0]))
+    assert not (tmp_path / 'cache.p').exists()
+    cache.put(boards[1], solve(boards[1]))
+    assert SolutionCache.load(path).get_stats()['size'] == 2
+
+
+def test_load_of_damaged_file_is_empty(tmp_path):
+    (tmp_path / 'cache.p').write_bytes(b'not a pickle')
+    assert SolutionCache.load(str(tmp_path / 'cache.p')).get_stats()['size'] == 0
+
+
+def test_miss_then_put_canonicalizes_once(monkeypatch):
+    calls = []
+    real = cache_module.canonicalize
+    monkeypatch.setattr(cache_module, 'canonicalize',
+                        lambda cells: calls.append(cells) or real(cells))
+    cache = SolutionCache()
+    assert cache.get(PUZZLE) is None
+    cache.put(PUZZLE, solve(PUZZLE))
+    assert cache.get(PUZZLE) == solve(PUZZLE)
+    assert len(calls) == 1
+
+
+def test_load_of_file_with_bad_entries_is_empty(tmp_path):
+    path = tmp_path / 'cache.p'
+    for entries in ([(PUZZLE, 5)], [(PUZZLE, b'short')], [1, 2], 7):
+        path.write_bytes(pickle.dumps(entries))
+        assert SolutionCache.load(str(path)).get_stats()['size'] == 0
@@ -0,0 +1,49 @@
+import pytest
+
+import generator
+from generator import LEVEL_GIVENS, PuzzleQueue, generate_puzzle, generate_record, has_unique_solution
+from rater import LEVELS
+
+
+def test_seeded_puzzles_repeat_and_are_unique():
+    board = generate_puzzle(28, seed=7)
+    assert board == generate_puzzle(28, seed=7)
+    assert has_unique_solution(board)
+    assert sum(1 for row in board for number in row if number) >= 28
+
+
+def test_records_are_rated():
+    record = generate_record(30, seed=3)
+    assert record.get_level() in LEVELS
+
+
+def test_queue_gives_the_asked_level():
+    puzzles = PuzzleQueue(depth=1, levels=('easy', 'hard'))
+    record = generate_record(LEVEL_GIVENS['easy'], seed=1)
+    assert record.get_level() == 'easy'
+    assert puzzles._offer(record)
+    assert puzzles.pop('easy') is record
+    assert puzzles.get_stats()['misses'] == 0
+
+
+def test_dry_queue_gives_the_nearest_ready_level():
+    puzzles = PuzzleQueue(depth=1, levels=('easy', 'medium', 'hard'))
+    record = generate_record(LEVEL_GIVENS['easy'], seed=1)
+    puzzles._offer(record)
+    assert puzzles.pop('medium') is record
+    assert puzzles.get_stats()['misses'] == 1
+
+
+def test_empty_queue_generates_a_single_puzzle(monkeypatch):
+    calls = []
+    real = generator.generate_record
+    monkeypatch.setattr(generator, 'generate_record',
+                        lambda givens: calls.append(givens) or real(givens, seed=2))
+    puzzles = PuzzleQueue(depth=1, levels=('hard',))
+    assert puzzles.pop('hard').get_level() in LEVELS
+    assert calls == [LEVEL_GIVENS['hard']]
+
+
+def test_queue_rejects_unknown_levels():
+    with pytest.raises(ValueError):
+        PuzzleQueue(levels=('impossible',))
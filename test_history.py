@@ -0,0 +1,42 @@
+from history import History, pack_delta, unpack_delta
+
+
+def test_pack_round_trip():
+    for delta in ((0, 0, 0, 0, 0), (80, 9, 1, 511, 0), (40, 3, 7, 0b101, 0b110000000)):
+        assert unpack_delta(pack_delta(*delta)) == delta
+    assert pack_delta(80, 9, 9, 511, 511) < 1 << 33
+
+
+def test_undo_and_redo_move_whole_steps():
+    history = History()
+    history.push([1, 2, 3])
+    history.push([4])
+    assert list(history.undo()) == [4]
+    assert list(history.undo()) == [1, 2, 3]
+    assert history.undo() is None
+    assert not history.can_undo()
+    assert list(history.redo()) == [1, 2, 3]
+    assert list(history.redo()) == [4]
+    assert history.redo() is None
+    assert history.can_undo()
+
+
+def test_push_forgets_redo():
+    history = History()
+    history.push([1])
+    history.undo()
+    assert history.can_redo()
+    history.push([2])
+    assert not history.can_redo()
+    assert list(history.undo()) == [2]
+    assert history.undo() is None
+
+
+def test_clear():
+    history = History()
+    history.push([1])
+    history.push([2])
+    history.undo()
+    history.clear()
+    assert not history.can_undo()
+    assert not history.can_redo()
@@ -0,0 +1,46 @@
+import copy
+
+from board import Board
+from rater import LEVELS, find_hint, rate
+from solver import create_solver
+
+
+def test_known_boards_rate_easy():
+    for board in Board.get_all_start_boards():
+        rating = rate(board)
+        assert rating.get_level() == 'easy'
+        assert rating.get_hardest() == 'hidden_single'
+
+
+def test_solved_and_invalid_boards():
+    solved = copy.deepcopy(Board.get_all_start_boards()[0])
+    create_solver(solved).solve()
+    assert rate(solved).get_level() == LEVELS[0]
+    clashing = copy.deepcopy(solved)
+    clashing[0][0] = clashing[0][1]
+    assert rate(clashing).get_level() == 'invalid'
+
+
+def test_board_beyond_the_techniques_needs_guessing():
+    line = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+    board = [[int(number) for number in line[row:row + 9]] for row in range(0, 81, 9)]
+    rating = rate(board)
+    assert rating.get_level() == 'extreme'
+    assert rating.get_hardest() == 'guessing'
+    hint = find_hint(board)
+    if hint is not None:
+        solved = copy.deepcopy(board)
+        create_solver(solved).solve()
+        row, column = hint.get_coordinate()
+        assert solved[row][column] == hint.get_number()
+
+
+def test_find_hint_is_easiest_step():
+    board = Board.get_all_start_boards()[0]
+    hint = find_hint(board)
+    solved = copy.deepcopy(board)
+    create_solver(solved).solve()
+    row, column = hint.get_coordinate()
+    assert board[row][column] == 0
+    assert solved[row][column] == hint.get_number()
+    assert hint.get_technique() == 'hidden_single'
@@ -0,0 +1,133 @@
+import os
+import shutil
+
+import pytest
+
+from scores import Score, ScoreStore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_score(number: int) -> Score:
+    return Score(f"player{number % 3}", (1, 2, 3), float(100 - number), f"puzzle{number % 2}")
+
+
+def test_encode_round_trip_and_damage():
+    score = Score("name", (4, 5, 6), 12.5, "0" * 81)
+    line = score.encode()
+    decoded = Score.decode(line)
+    assert (decoded.get_name(), decoded.get_color(), decoded.get_time(), decoded.get_puzzle()) \
+        == ("name", (4, 5, 6), 12.5, "0" * 81)
+    assert Score.decode(line.replace(b"name", b"nama")) is None
+    assert Score.decode(line[:-5]) is None
+
+
+def test_migrates_the_pickled_leaderboard(tmp_path):
+    legacy = str(tmp_path / 'sudoku_data.p')
+    shutil.copy(os.path.join(HERE, 'sudoku_data.p'), legacy)
+    store = ScoreStore.load(str(tmp_path / 'scores.log'), legacy)
+    top = store.get_top()
+    assert store.get_count() == len(top) == 1
+    assert (top[0].get_name(), top[0].get_time()) == ("GDFS", 2.0)
+
+    # the log now exists, so the pickle is not read again
+    os.remove(legacy)
+    reopened = ScoreStore.load(str(tmp_path / 'scores.log'), legacy)
+    assert [score.get_name() for score in reopened.get_top()] == ["GDFS"]
+
+
+def test_reopening_reads_the_summary(tmp_path):
+    path = str(tmp_path / 'scores.log')
+    store = ScoreStore.load(path, top=3)
+    for number in range(10):
+        store.add(make_score(number))
+    reopened = ScoreStore.load(path, top=3)
+    assert reopened.get_count() == 10
+    assert [score.get_time() for score in reopened.get_top()] == [91.0, 92.0, 93.0]
+    assert [score.get_time() for score in reopened.get_top_by_name("player1")] == [93.0, 96.0, 99.0]
+    assert [score.get_time() for score in reopened.get_top_by_puzzle("puzzle0")] == [92.0, 94.0, 96.0]
+
+
+def test_cuts_off_a_truncated_tail(tmp_path):
+    path = str(tmp_path / 'scores.log')
+    store = ScoreStore.load(path)
+    for number in range(5):
+        store.add(make_score(number))
+    # a crash in the middle of writing a line
+    with open(path, 'ab') as f:
+        f.write(make_score(5).encode()[:20])
+
+    recovered = ScoreStore.load(path)
+    assert recovered.get_count() == 5
+    with open(path, 'rb') as f:
+        lines = f.read().split(b'\n')
+    assert lines[-1] == b''
+    assert all(Score.decode(line) for line in lines[:-1])
+    recovered.add(make_score(6))
+    assert ScoreStore.load(path).get_count() == 6
+
+
+def test_compaction_drops_damaged_lines_and_keeps_new_games(tmp_path):
+    path = str(tmp_path / 'scores.log')
+    store = ScoreStore.load(path)
+    for number in range(20):
+        store.add(make_score(number))
+    with open(path, 'r+b') as f:
+        data = f.read()
+        f.seek(data.index(b'player2'))
+        f.write(b'playerX')
+
+    store.compact(wait=True)
+    store.add(make_score(20))
+    with open(path, 'rb') as f:
+        lines = f.read().split(b'\n')[:-1]
+    assert len(lines) == 20
+    assert all(Score.decode(line) for line in lines)
+    assert not (tmp_path / 'scores.log.tmp').exists()
+    assert ScoreStore.load(path).get_top(1)[0].get_time() == 80.0
+
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_failed_compaction_can_be_retried(tmp_path, monkeypatch):
+    path = str(tmp_path / 'scores.log')
+    store = ScoreStore.load(path)
+    store.add(make_score(0))
+
+    def fail(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, 'replace', fail)
+    store.compact(wait=True)
+    monkeypatch.undo()
+
+    store.compact(wait=True)
+    assert store.get_count() == 1
+    assert not (tmp_path / 'scores.log.tmp').exists()
+
+
+def test_loading_drops_damaged_lines_in_the_background(tmp_path):
+    path = str(tmp_path / 'scores.log')
+    store = ScoreStore.load(path)
+    for number in range(5):
+        store.add(make_score(number))
+    with open(path, 'r+b') as f:
+        data = f.read()
+        f.seek(data.index(b'player2'))
+        f.write(b'playerX')
+
+    recovered = ScoreStore.load(path)
+    recovered.get_top_by_name('player1')
+    recovered.compact(wait=True)
+    recovered.add(make_score(5))
+    with open(path, 'rb') as f:
+        lines = f.read().split(b'\n')[:-1]
+    assert len(lines) == 5
+    assert all(Score.decode(line) for line in lines)
+
+
+def test_undamaged_log_is_never_rewritten(tmp_path, monkeypatch):
+    path = str(tmp_path / 'scores.log')
+    store = ScoreStore.load(path)
+    monkeypatch.setattr(ScoreStore, 'compact', lambda *args, **kwargs: pytest.fail("compacted"))
+    for number in range(300):
+        store.add(make_score(number))
+    assert ScoreStore.load(path).get_top_by_name('player1')
@@ -0,0 +1,106 @@
+import copy
+from time import perf_counter
+
+import pytest
+
+from board import Board
+from dlx import DancingLinksSolver
+from generator import generate_puzzle
+from solver import SOLVER_BACKENDS, BitmaskSolver, create_solver
+
+
+def is_solution(board, start):
+    for row in range(9):
+        for column in range(9):
+            if start[row][column] and board[row][column] != start[row][column]:
+                return False
+    units = ([board[row] for row in range(9)]
+             + [[board[row][column] for row in range(9)] for column in range(9)]
+             + [[board[box // 3 * 3 + i // 3][box % 3 * 3 + i % 3] for i in range(9)]
+                for box in range(9)])
+    return all(sorted(unit) == list(range(1, 10)) for unit in units)
+
+
+PUZZLES = Board.get_all_start_boards() + [generate_puzzle(26, seed) for seed in range(4)]
+
+
+@pytest.mark.parametrize('puzzle', PUZZLES)
+def test_backends_agree(puzzle):
+    solutions = []
+    for backend in SOLVER_BACKENDS:
+        board = copy.deepcopy(puzzle)
+        assert create_solver(board, backend).solve()
+        assert is_solution(board, puzzle)
+        solutions.append(board)
+    assert all(solution == solutions[0] for solution in solutions)
+
+
+@pytest.mark.parametrize('puzzle', PUZZLES)
+def test_count_solutions_of_unique_puzzles(puzzle):
+    assert BitmaskSolver(copy.deepcopy(puzzle)).count_solutions() == 1
+    assert DancingLinksSolver(copy.deepcopy(puzzle)).count_solutions() == 1
+
+
+def test_count_solutions_leaves_board_untouched():
+    puzzle = copy.deepcopy(PUZZLES[0])
+    start = copy.deepcopy(puzzle)
+    BitmaskSolver(puzzle).count_solutions()
+    assert puzzle == start
+
+
+def test_count_solutions_with_several_solutions():
+    board = copy.deepcopy(PUZZLES[0])
+    board[0] = [0] * 9
+    board[1] = [0] * 9
+    assert BitmaskSolver(copy.deepcopy(board)).count_solutions() == 14
+    assert DancingLinksSolver(copy.deepcopy(board)).count_solutions() == 14
+    assert BitmaskSolver(copy.deepcopy(board)).count_solutions(3) == 3
+    assert DancingLinksSolver(copy.deepcopy(board)).count_solutions(3) == 3
+
+
+def test_unsolvable_board_is_left_untouched():
+    board = copy.deepcopy(PUZZLES[0])
+    board[0][2] = 9
+    start = copy.deepcopy(board)
+    for backend in SOLVER_BACKENDS:
+        assert not create_solver(board, backend).solve()
+        assert board == start
+
+
+def test_failed_propagation_leaves_no_duplicate_empty_cells():
+    # (0, 7) can only hold 8, which leaves nothing for (0, 8)
+    board = [[0] * 9 for _ in range(9)]
+    board[0][:7] = [1, 2, 3, 4, 5, 6, 7]
+    board[4][7] = 9
+    board[7][8] = 9
+    start = copy.deepcopy(board)
+    solver = BitmaskSolver(board)
+
+    assert not solver.solve()
+    assert board == start
+    empty = solver.get_empty()
+    assert len(empty) == len(set(empty)) == 72
+
+
+def test_dlx_rejects_clashing_givens():
+    board = [[0] * 9 for _ in range(9)]
+    board[0][0] = board[0][5] = 4
+    start = copy.deepcopy(board)
+    solver = DancingLinksSolver(board)
+
+    assert solver.has_conflicts()
+    assert solver.count_solutions() == 0
+    assert not solver.solve()
+    assert board == start
+
+
+def test_backends_agree_quickly_on_clashing_givens():
+    board = [[0] * 9 for _ in range(9)]
+    board[0][0] = board[0][5] = 4
+    start = copy.deepcopy(board)
+    for backend in SOLVER_BACKENDS:
+        began = perf_counter()
+        assert not create_solver(board, backend).solve()
+        assert board == start
+        assert perf_counter() - began < 0.1
+    assert BitmaskSolver(board).count_solutions() == DancingLinksSolver(board).count_solutions() == 0